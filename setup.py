@@ -9,7 +9,6 @@ setup(
     packages=['zexus'],
     include_package_data=True,
     install_requires=[
-        'click>=7.0',
         'rich>=9.0'
     ],
     entry_points={
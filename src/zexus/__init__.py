@@ -8,16 +8,30 @@ __version__ = "0.1.0"
 __author__ = "Ziver Labs"
 __email__ = "dev@ziver.io"
 
-from .lexer import Lexer
-from .parser import Parser
-from .evaluator import eval_node, Environment
-from .object import (
-    Object, Integer, Float, String, Boolean, Null, 
-    List, Map, Action, Builtin, ReturnValue, EmbeddedCode
-)
+import importlib
 
 __all__ = [
     "Lexer", "Parser", "eval_node", "Environment",
     "Object", "Integer", "Float", "String", "Boolean", 
     "Null", "List", "Map", "Action", "Builtin", "ReturnValue", "EmbeddedCode"
 ]
+
+# Public names are imported on first access rather than at package import, so
+# `import zexus.cli.main` (and with it `zx --help`) does not load the evaluator.
+# name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "Lexer": ".lexer",
+    "Parser": ".parser",
+    "eval_node": ".evaluator",
+    "Environment": ".evaluator",
+}
+_LAZY_EXPORTS.update(dict.fromkeys(__all__[4:], ".object"))
+
+def __getattr__(name):
+    """PEP 562 hook: import the submodule defining `name` and cache the value."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,92 +1,357 @@
 # src/zexus/cli/main.py
-import click
 import sys
 import os
+import re
+import json
 from pathlib import Path
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.panel import Panel
-from rich.table import Table
-
-# Import your existing modules
-from ..lexer import Lexer
-from ..parser import Parser
-from ..evaluator import eval_node, Environment
-from ..syntax_validator import SyntaxValidator
-from ..hybrid_orchestrator import orchestrator
+
+# The lexer, parser, evaluator and validator are imported inside the commands
+# that use them, so --help, --version and usage errors never load them
 from ..config import config
 
-console = Console()
-
-@click.group()
-@click.version_option(version="0.1.0", prog_name="Zexus")
-@click.option('--syntax-style', type=click.Choice(['universal', 'tolerable', 'auto']), 
-              default='auto', help='Syntax style to use (universal=strict, tolerable=flexible)')
-@click.option('--advanced-parsing', is_flag=True, default=True, 
-              help='Enable advanced multi-strategy parsing (recommended)')
-@click.option('--execution-mode', type=click.Choice(['interpreter', 'compiler', 'auto']),
-              default='auto', help='Execution engine to use')
-@click.option('--debug', is_flag=True, help='Enable debug logging')
-@click.pass_context
-def cli(ctx, syntax_style, advanced_parsing, execution_mode, debug):
+_C = None
+_COLOR = False
+_MARKUP = re.compile(r'\[/?(?:bold|red|green|yellow|blue)(?: [a-z]+)?\]')
+
+
+def _console():
+    """Rich console, imported and created on first use"""
+    global _C
+    _C = _C or __import__('rich.console', fromlist=['Console']).Console()
+    return _C
+
+
+def echo(text=""):
+    """Print a line of CLI output; markup is rendered by Rich only with --color"""
+    if _COLOR:
+        _console().print(text)
+    else:
+        print(_MARKUP.sub('', text))
+
+
+def echo_lines(lines):
+    """echo() a batch of lines as one write; prints nothing for an empty batch"""
+    if lines:
+        echo("\n".join(lines))
+
+
+_VALIDATOR = None
+
+
+def _get_validator():
+    """Shared SyntaxValidator, constructed on first use"""
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        from ..syntax_validator import SyntaxValidator
+        _VALIDATOR = SyntaxValidator()
+    return _VALIDATOR
+
+
+# Auto-detected syntax style per source file, keyed on path + mtime + size.
+# Only the most recently detected STYLE_CACHE_SIZE files are kept.
+STYLE_CACHE_FILE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "zexus" / "style.json"
+STYLE_CACHE_SIZE = 256
+
+
+def _detect_syntax_style(validator, file, source_code):
+    """suggest_syntax_style() for a file, memoised on disk until the file changes"""
+    try:
+        st = os.stat(file)
+    except OSError:
+        return validator.suggest_syntax_style(source_code)
+    path = os.path.abspath(file)
+    stamp = [st.st_mtime_ns, st.st_size]
+
+    try:
+        cache = json.loads(STYLE_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    entry = cache.get(path)
+    if isinstance(entry, list) and len(entry) == 3 and entry[:2] == stamp:
+        return entry[2]
+
+    style = validator.suggest_syntax_style(source_code)
+    # dicts keep insertion order: re-inserting moves this file to the end and
+    # the oldest entries are dropped from the front
+    cache.pop(path, None)
+    cache[path] = stamp + [style]
+    for old_path in list(cache)[:-STYLE_CACHE_SIZE]:
+        del cache[old_path]
+    # write to a temp file and rename, so a concurrent run never reads a truncated file
+    tmp = STYLE_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        STYLE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(tmp, STYLE_CACHE_FILE)
+    except OSError:
+        # cache is best-effort; detection result is still valid
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+    return style
+
+
+VERSION = "0.1.0"
+PROG_NAME = "zx"
+SYNTAX_STYLES = ('universal', 'tolerable', 'auto')
+EXECUTION_MODES = ('interpreter', 'compiler', 'auto')
+DEBUG_ACTIONS = ('on', 'off', 'minimal', 'status')
+
+# (flag, metavar, help) for the global options accepted before the command
+GLOBAL_OPTIONS = (
+    ('--syntax-style', '[universal|tolerable|auto]', 'Syntax style to use (universal=strict, tolerable=flexible)'),
+    ('--advanced-parsing', None, 'Enable advanced multi-strategy parsing (recommended)'),
+    ('--execution-mode', '[interpreter|compiler|auto]', 'Execution engine to use'),
+    ('--debug', None, 'Enable debug logging'),
+    ('--color', None, 'Colorize output with Rich'),
+    ('--version', None, 'Show the version and exit.'),
+    ('--help', None, 'Show this message and exit.'),
+)
+# Global options that take no value
+GLOBAL_FLAGS = frozenset(flag for flag, metavar, _ in GLOBAL_OPTIONS if metavar is None)
+
+
+class UsageError(Exception):
+    """Invalid command line; reported with a usage hint and exit status 2"""
+
+    def __init__(self, message, usage=None):
+        super().__init__(message)
+        self.usage = usage
+
+
+def cli(argv=None):
     """Zexus Programming Language - Hybrid Interpreter/Compiler"""
-    ctx.ensure_object(dict)
-    ctx.obj['SYNTAX_STYLE'] = syntax_style
-    ctx.obj['ADVANCED_PARSING'] = advanced_parsing
-    ctx.obj['EXECUTION_MODE'] = execution_mode
-    ctx.obj['DEBUG'] = debug
-    
+    global _COLOR
+    argv = sys.argv[1:] if argv is None else list(argv)
+    ctx = {
+        'SYNTAX_STYLE': 'auto',
+        'ADVANCED_PARSING': True,
+        'EXECUTION_MODE': 'auto',
+        'DEBUG': False,
+    }
+
+    try:
+        # Global options come before the command name
+        while argv and argv[0].startswith('--'):
+            arg = argv.pop(0)
+            name, has_value, value = arg.partition('=')
+            if has_value and name in GLOBAL_FLAGS:
+                raise UsageError(f"Option '{name}' does not take a value.")
+            if name == '--help':
+                print(_main_help())
+                return
+            if name == '--version':
+                print(f"Zexus, version {VERSION}")
+                return
+            if name == '--advanced-parsing':
+                ctx['ADVANCED_PARSING'] = True
+            elif name == '--debug':
+                ctx['DEBUG'] = True
+            elif name == '--color':
+                _COLOR = True
+            elif name in ('--syntax-style', '--execution-mode'):
+                if not has_value:
+                    if not argv:
+                        raise UsageError(f"Option '{name}' requires an argument.")
+                    value = argv.pop(0)
+                if name == '--syntax-style':
+                    ctx['SYNTAX_STYLE'] = _choice(name, value, SYNTAX_STYLES)
+                else:
+                    ctx['EXECUTION_MODE'] = _choice(name, value, EXECUTION_MODES)
+            else:
+                raise UsageError(f"No such option: {name}")
+
+        if not argv:
+            print(_main_help())
+            return
+
+        command_name = argv.pop(0)
+        command = COMMANDS.get(command_name)
+        if command is None:
+            raise UsageError(f"No such command '{command_name}'.")
+        func, params = command
+        if '--help' in argv:
+            print(_command_help(command_name))
+            return
+        kwargs = _parse_command_args(command_name, params, argv)
+    except UsageError as e:
+        usage = e.usage or f"Usage: {PROG_NAME} [OPTIONS] COMMAND [ARGS]..."
+        print(f"{usage}\nTry '{PROG_NAME} --help' for help.\n\nError: {e}", file=sys.stderr)
+        sys.exit(2)
+
     # Update config based on CLI flags
-    if debug:
+    if ctx['DEBUG']:
         config.enable_debug_logs = True
-    if execution_mode == 'compiler':
+    if ctx['EXECUTION_MODE'] == 'compiler':
         config.use_hybrid_compiler = True
-    elif execution_mode == 'interpreter':
+    elif ctx['EXECUTION_MODE'] == 'interpreter':
         config.use_hybrid_compiler = False
 
-@cli.command()
-@click.argument('file', type=click.Path(exists=True))
-@click.pass_context
-def run(ctx, file):
+    return func(ctx, **kwargs)
+
+
+def _choice(name, value, choices, usage=None):
+    if value not in choices:
+        options = ", ".join(f"'{c}'" for c in choices)
+        raise UsageError(f"Invalid value for '{name}': '{value}' is not one of {options}.", usage)
+    return value
+
+
+def _parse_command_args(command_name, params, argv):
+    """Bind argv to a command's declared params.
+
+    params maps a keyword to ('file', None), ('choice', choices) for a
+    positional argument, ('option', (choices, default, help)) for `--<name> X`,
+    or ('flag', help) for a boolean `--<name>`.
+    """
+    usage = _command_usage(command_name)
+    kwargs = {}
+    positionals = [k for k, (kind, _) in params.items() if kind not in ('option', 'flag')]
+    for key, (kind, spec) in params.items():
+        if kind == 'option':
+            kwargs[key] = spec[1]
+        elif kind == 'flag':
+            kwargs[key] = False
+
+    rest = []
+    while argv:
+        arg = argv.pop(0)
+        if arg.startswith('--'):
+            name, has_value, value = arg.partition('=')
+            key = name[2:].replace('-', '_')
+            kind = params.get(key, (None,))[0]
+            if kind == 'flag':
+                if has_value:
+                    raise UsageError(f"Option '{name}' does not take a value.", usage)
+                kwargs[key] = True
+                continue
+            if kind != 'option':
+                raise UsageError(f"No such option: {name}", usage)
+            if not has_value:
+                if not argv:
+                    raise UsageError(f"Option '{name}' requires an argument.", usage)
+                value = argv.pop(0)
+            kwargs[key] = _choice(name, value, params[key][1][0], usage)
+        else:
+            rest.append(arg)
+
+    if len(rest) > len(positionals):
+        raise UsageError(f"Got unexpected extra argument ({' '.join(rest[len(positionals):])})", usage)
+    for key, value in zip(positionals, rest):
+        kind, spec = params[key]
+        if kind == 'file':
+            if not os.path.exists(value):
+                raise UsageError(f"Invalid value for '{key.upper()}': Path '{value}' does not exist.", usage)
+        else:
+            value = _choice(key.upper(), value, spec, usage)
+        kwargs[key] = value
+    for key in positionals[len(rest):]:
+        raise UsageError(f"Missing argument '{key.upper()}'.", usage)
+    return kwargs
+
+
+def _command_usage(command_name):
+    params = COMMANDS[command_name][1]
+    parts = [f"Usage: {PROG_NAME} {command_name} [OPTIONS]"]
+    for key, (kind, spec) in params.items():
+        if kind == 'file':
+            parts.append(key.upper())
+        elif kind == 'choice':
+            parts.append(f"{{{'|'.join(spec)}}}")
+    return " ".join(parts)
+
+
+def _command_help(command_name):
+    func, params = COMMANDS[command_name]
+    lines = [_command_usage(command_name), "", f"  {func.__doc__}", "", "Options:"]
+    for key, (kind, spec) in params.items():
+        if kind == 'option':
+            lines.append(f"  --{key.replace('_', '-')} [{'|'.join(spec[0])}]  {spec[2]}")
+        elif kind == 'flag':
+            lines.append(f"  --{key.replace('_', '-')}  {spec}")
+    lines.append("  --help  Show this message and exit.")
+    return "\n".join(lines)
+
+
+def _main_help():
+    lines = [f"Usage: {PROG_NAME} [OPTIONS] COMMAND [ARGS]...", "", f"  {cli.__doc__}", "", "Options:"]
+    width = max(len(flag) + len(metavar or '') + 1 for flag, metavar, _ in GLOBAL_OPTIONS)
+    for flag, metavar, help_text in GLOBAL_OPTIONS:
+        left = f"{flag} {metavar}" if metavar else flag
+        lines.append(f"  {left.ljust(width)}  {help_text}")
+    lines += ["", "Commands:"]
+    width = max(len(name) for name in COMMANDS)
+    for name in sorted(COMMANDS):
+        lines.append(f"  {name.ljust(width)}  {COMMANDS[name][0].__doc__.splitlines()[0]}")
+    return "\n".join(lines)
+
+
+def _parse_errors(source_code, syntax_style):
+    """Errors the interpreter's parser, configured as for the run, reports for
+    source_code. Its trace output is dropped; the run prints its own."""
+    import contextlib
+    import io
+    from ..lexer import Lexer
+    from ..parser import Parser
+    parser = Parser(Lexer(source_code), syntax_style)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_program()
+    return parser.errors
+
+
+def run(ctx, file, force):
     """Run a Zexus program with hybrid execution"""
     try:
-        with open(file, 'r') as f:
-            source_code = f.read()
+        source_code = Path(file).read_text(encoding='utf-8')
 
-        syntax_style = ctx.obj['SYNTAX_STYLE']
-        advanced_parsing = ctx.obj['ADVANCED_PARSING']
-        execution_mode = ctx.obj['EXECUTION_MODE']
-        validator = SyntaxValidator()
+        syntax_style = ctx['SYNTAX_STYLE']
+        advanced_parsing = ctx['ADVANCED_PARSING']
+        execution_mode = ctx['EXECUTION_MODE']
+        validator = _get_validator()
 
-        console.print(f"🚀 [bold green]Running[/bold green] {file}")
-        console.print(f"🔧 [bold blue]Execution mode:[/bold blue] {execution_mode}")
-        console.print(f"📝 [bold blue]Syntax style:[/bold blue] {syntax_style}")
-        console.print(f"🎯 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
+        echo(f"🚀 [bold green]Running[/bold green] {file}")
+        echo(f"🔧 [bold blue]Execution mode:[/bold blue] {execution_mode}")
+        echo(f"📝 [bold blue]Syntax style:[/bold blue] {syntax_style}")
+        echo(f"🎯 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
 
         # Auto-detect syntax style if needed
         if syntax_style == 'auto':
-            syntax_style = validator.suggest_syntax_style(source_code)
-            console.print(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
+            syntax_style = _detect_syntax_style(validator, file, source_code)
+            echo(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
 
         # Validate syntax
         validation_result = validator.validate_code(source_code, syntax_style)
         if not validation_result['is_valid']:
-            console.print(f"[bold yellow]⚠️  Syntax warnings: {validation_result['error_count']} issue(s) found[/bold yellow]")
-            for suggestion in validation_result['suggestions']:
-                severity_emoji = "❌" if suggestion['severity'] == 'error' else "⚠️"
-                console.print(f"  {severity_emoji} Line {suggestion['line']}: {suggestion['message']}")
+            echo(f"[bold yellow]⚠️  Syntax warnings: {validation_result['error_count']} issue(s) found[/bold yellow]")
+            echo_lines([
+                f"  {'❌' if suggestion['severity'] == 'error' else '⚠️'} Line {suggestion['line']}: {suggestion['message']}"
+                for suggestion in validation_result['suggestions']
+            ])
 
             # Auto-fix if there are errors
             if any(s['severity'] == 'error' for s in validation_result['suggestions']):
-                console.print("[bold yellow]🛠️  Attempting auto-fix...[/bold yellow]")
+                echo("[bold yellow]🛠️  Attempting auto-fix...[/bold yellow]")
                 fixed_code, fix_result = validator.auto_fix(source_code, syntax_style)
                 if fix_result['applied_fixes'] > 0:
-                    console.print(f"✅ [bold green]Applied {fix_result['applied_fixes']} fixes[/bold green]")
+                    echo(f"✅ [bold green]Applied {fix_result['applied_fixes']} fixes[/bold green]")
                     source_code = fixed_code
-                else:
-                    console.print("[bold red]❌ Could not auto-fix errors, attempting to run anyway...[/bold red]")
+
+                # The validator's line patterns can keep flagging code the parser
+                # accepts, so only refuse to run when the parser rejects it too
+                if any(s['severity'] == 'error' for s in fix_result['suggestions']):
+                    if _parse_errors(source_code, syntax_style):
+                        if not force:
+                            echo("[bold red]❌ Could not auto-fix errors, not running (use --force to run anyway)[/bold red]")
+                            sys.exit(1)
+                        echo("[bold red]❌ Could not auto-fix errors, attempting to run anyway...[/bold red]")
 
         # Use hybrid orchestrator for execution
+        from ..evaluator import Environment
+        from ..hybrid_orchestrator import orchestrator
         env = Environment()
         result = orchestrator.execute(
             source_code, 
@@ -96,250 +361,258 @@ def run(ctx, file):
         )
 
         if result and hasattr(result, 'inspect') and result.inspect() != 'null':
-            console.print(f"\n✅ [bold green]Result:[/bold green] {result.inspect()}")
+            echo(f"\n✅ [bold green]Result:[/bold green] {result.inspect()}")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        echo(f"[bold red]Error:[/bold red] {str(e)}")
         sys.exit(1)
 
-@cli.command()
-@click.argument('file', type=click.Path(exists=True))
-@click.pass_context
 def check(ctx, file):
     """Check syntax of a Zexus file with detailed validation"""
     try:
-        with open(file, 'r') as f:
-            source_code = f.read()
+        source_code = Path(file).read_text(encoding='utf-8')
 
-        syntax_style = ctx.obj['SYNTAX_STYLE']
-        advanced_parsing = ctx.obj['ADVANCED_PARSING']
-        validator = SyntaxValidator()
+        syntax_style = ctx['SYNTAX_STYLE']
+        advanced_parsing = ctx['ADVANCED_PARSING']
+        validator = _get_validator()
 
         # Auto-detect syntax style if needed
         if syntax_style == 'auto':
-            syntax_style = validator.suggest_syntax_style(source_code)
-            console.print(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
+            syntax_style = _detect_syntax_style(validator, file, source_code)
+            echo(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
 
-        console.print(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
+        echo(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
 
         # Run syntax validation
         validation_result = validator.validate_code(source_code, syntax_style)
 
-        # Also run parser for additional validation
-        lexer = Lexer(source_code)
-        parser = Parser(lexer, syntax_style, enable_advanced_strategies=advanced_parsing)
+        # Also run parser for additional validation. The source is lexed once;
+        # advanced parsing reuses the recorded tokens instead of re-scanning.
+        from ..lexer import Lexer, TokenStream
+        from ..parser import Parser
+        parser = Parser(TokenStream(Lexer(source_code)), syntax_style, enable_advanced_strategies=advanced_parsing)
         program = parser.parse_program()
 
         # Display results
         if parser.errors or not validation_result['is_valid']:
-            console.print("[bold red]❌ Syntax Issues Found:[/bold red]")
+            echo("[bold red]❌ Syntax Issues Found:[/bold red]")
 
             # Show parser errors first
-            for error in parser.errors:
-                console.print(f"  🚫 Parser: {error}")
+            echo_lines([f"  🚫 Parser: {error}" for error in parser.errors])
 
             # Show validator suggestions
-            for suggestion in validation_result['suggestions']:
-                severity_icon = "🚫" if suggestion['severity'] == 'error' else "⚠️"
-                console.print(f"  {severity_icon} Validator: {suggestion['message']}")
+            echo_lines([
+                f"  {'🚫' if suggestion['severity'] == 'error' else '⚠️'} Validator: {suggestion['message']}"
+                for suggestion in validation_result['suggestions']
+            ])
 
             # Show warnings
-            for warning in validation_result['warnings']:
-                console.print(f"  ⚠️  Warning: {warning['message']}")
+            echo_lines([f"  ⚠️  Warning: {warning['message']}" for warning in validation_result['warnings']])
 
             # Show recovery info if advanced parsing was used
             if advanced_parsing and hasattr(parser, 'use_advanced_parsing') and parser.use_advanced_parsing:
-                console.print(f"\n[bold yellow]🛡️  Advanced parsing recovered {len(program.statements)} statements[/bold yellow]")
+                echo(f"\n[bold yellow]🛡️  Advanced parsing recovered {len(program.statements)} statements[/bold yellow]")
 
             sys.exit(1)
         else:
-            console.print("[bold green]✅ Syntax is valid![/bold green]")
+            echo("[bold green]✅ Syntax is valid![/bold green]")
             if advanced_parsing and hasattr(parser, 'use_advanced_parsing') and parser.use_advanced_parsing:
-                console.print("[bold green]🔧 Advanced multi-strategy parsing successful![/bold green]")
+                echo("[bold green]🔧 Advanced multi-strategy parsing successful![/bold green]")
 
             if validation_result['warnings']:
-                console.print("\n[bold yellow]ℹ️  Warnings:[/bold yellow]")
-                for warning in validation_result['warnings']:
-                    console.print(f"  ⚠️  {warning['message']}")
+                echo("\n[bold yellow]ℹ️  Warnings:[/bold yellow]")
+                echo_lines([f"  ⚠️  {warning['message']}" for warning in validation_result['warnings']])
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        echo(f"[bold red]Error:[/bold red] {str(e)}")
         sys.exit(1)
 
-@cli.command()
-@click.argument('file', type=click.Path(exists=True))
-@click.pass_context
 def validate(ctx, file):
     """Validate and auto-fix Zexus syntax"""
     try:
-        with open(file, 'r') as f:
-            source_code = f.read()
+        source_code = Path(file).read_text(encoding='utf-8')
 
-        syntax_style = ctx.obj['SYNTAX_STYLE']
-        validator = SyntaxValidator()
+        syntax_style = ctx['SYNTAX_STYLE']
+        validator = _get_validator()
 
         # Auto-detect syntax style if needed
         if syntax_style == 'auto':
-            syntax_style = validator.suggest_syntax_style(source_code)
-            console.print(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
+            syntax_style = _detect_syntax_style(validator, file, source_code)
+            echo(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
 
-        console.print(f"📝 [bold blue]Validating with {syntax_style} syntax...[/bold blue]")
+        echo(f"📝 [bold blue]Validating with {syntax_style} syntax...[/bold blue]")
 
         # Run validation and auto-fix
         fixed_code, validation_result = validator.auto_fix(source_code, syntax_style)
 
         # Show results
         if validation_result['is_valid']:
-            console.print("[bold green]✅ Code is valid![/bold green]")
+            echo("[bold green]✅ Code is valid![/bold green]")
         else:
-            console.print(f"[bold yellow]🛠️  Applied {validation_result['applied_fixes']} fixes[/bold yellow]")
-            console.print("[bold yellow]⚠️  Remaining issues:[/bold yellow]")
+            echo(f"[bold yellow]🛠️  Applied {validation_result['applied_fixes']} fixes[/bold yellow]")
+            echo("[bold yellow]⚠️  Remaining issues:[/bold yellow]")
 
-            for suggestion in validation_result['suggestions']:
-                severity_icon = "🚫" if suggestion['severity'] == 'error' else "⚠️"
-                console.print(f"  {severity_icon} Line {suggestion['line']}: {suggestion['message']}")
+            echo_lines([
+                f"  {'🚫' if suggestion['severity'] == 'error' else '⚠️'} Line {suggestion['line']}: {suggestion['message']}"
+                for suggestion in validation_result['suggestions']
+            ])
 
-            for warning in validation_result['warnings']:
-                console.print(f"  ⚠️  Warning: {warning['message']}")
+            echo_lines([f"  ⚠️  Warning: {warning['message']}" for warning in validation_result['warnings']])
 
         # Write fixed code back to file if changes were made
         if validation_result['applied_fixes'] > 0:
-            with open(file, 'w') as f:
-                f.write(fixed_code)
-            console.print(f"💾 [bold green]Updated {file} with fixes[/bold green]")
+            Path(file).write_text(fixed_code, encoding='utf-8')
+            echo(f"💾 [bold green]Updated {file} with fixes[/bold green]")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        echo(f"[bold red]Error:[/bold red] {str(e)}")
         sys.exit(1)
 
-@cli.command()
-@click.argument('file', type=click.Path(exists=True))
-@click.pass_context
 def ast(ctx, file):
     """Show AST of a Zexus file"""
     try:
-        with open(file, 'r') as f:
-            source_code = f.read()
+        source_code = Path(file).read_text(encoding='utf-8')
 
-        syntax_style = ctx.obj['SYNTAX_STYLE']
-        advanced_parsing = ctx.obj['ADVANCED_PARSING']
-        validator = SyntaxValidator()
+        syntax_style = ctx['SYNTAX_STYLE']
+        advanced_parsing = ctx['ADVANCED_PARSING']
+        validator = _get_validator()
 
         # Auto-detect syntax style if needed
         if syntax_style == 'auto':
-            syntax_style = validator.suggest_syntax_style(source_code)
-            console.print(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
+            syntax_style = _detect_syntax_style(validator, file, source_code)
+            echo(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
 
-        console.print(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
+        echo(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
 
+        from ..lexer import Lexer
+        from ..parser import Parser
         lexer = Lexer(source_code)
         parser = Parser(lexer, syntax_style, enable_advanced_strategies=advanced_parsing)
         program = parser.parse_program()
 
         parsing_method = "Advanced Multi-Strategy" if (advanced_parsing and hasattr(parser, 'use_advanced_parsing') and parser.use_advanced_parsing) else "Traditional"
 
-        console.print(Panel.fit(
+        from rich.panel import Panel
+        _console().print(Panel.fit(
             str(program),
             title=f"[bold blue]Abstract Syntax Tree ({syntax_style} syntax) - {parsing_method} Parsing[/bold blue]",
             border_style="blue"
         ))
 
         if parser.errors:
-            console.print("\n[bold yellow]⚠️  Parser encountered errors but continued:[/bold yellow]")
-            for error in parser.errors:
-                console.print(f"  ❌ {error}")
+            echo("\n[bold yellow]⚠️  Parser encountered errors but continued:[/bold yellow]")
+            echo_lines([f"  ❌ {error}" for error in parser.errors])
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        echo(f"[bold red]Error:[/bold red] {str(e)}")
+
+def _iter_tokens(lexer):
+    """Yield tokens from lexer up to (not including) EOF"""
+    from ..zexus_token import EOF
+    next_token = lexer.next_token
+    while True:
+        token = next_token()
+        if token.type == EOF:
+            return
+        yield token
+
 
-@cli.command()
-@click.argument('file', type=click.Path(exists=True))
-@click.pass_context
-def tokens(ctx, file):
+def tokens(ctx, file, pretty):
     """Show tokens of a Zexus file"""
     try:
-        with open(file, 'r') as f:
-            source_code = f.read()
+        source_code = Path(file).read_text(encoding='utf-8')
 
-        syntax_style = ctx.obj['SYNTAX_STYLE']
-        validator = SyntaxValidator()
+        syntax_style = ctx['SYNTAX_STYLE']
+        validator = _get_validator()
 
         # Auto-detect syntax style if needed
         if syntax_style == 'auto':
-            syntax_style = validator.suggest_syntax_style(source_code)
-            console.print(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
+            syntax_style = _detect_syntax_style(validator, file, source_code)
+            echo(f"🔍 [bold blue]Detected syntax style:[/bold blue] {syntax_style}")
 
+        from ..lexer import Lexer
         lexer = Lexer(source_code)
 
+        if not (pretty and sys.stdout.isatty()):
+            # Stream one tab-separated row per token: type, literal, line, column
+            write = sys.stdout.write
+            for t in _iter_tokens(lexer):
+                literal = t.literal.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+                write(f"{t.type}\t{literal}\t{t.line}\t{t.column}\n")
+            return
+
+        from rich.table import Table
         table = Table(title=f"Tokens ({syntax_style} syntax)")
         table.add_column("Type", style="cyan")
         table.add_column("Literal", style="green")
         table.add_column("Line", style="yellow")
         table.add_column("Column", style="yellow")
 
-        while True:
-            token = lexer.next_token()
-            if token.type == "EOF":
-                break
-            table.add_row(token.type, token.literal, str(token.line), str(token.column))
+        rows = [(t.type, t.literal, str(t.line), str(t.column)) for t in _iter_tokens(lexer)]
+        for row in rows:
+            table.add_row(*row)
 
-        console.print(table)
+        _console().print(table)
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        echo(f"[bold red]Error:[/bold red] {str(e)}")
 
-@cli.command()
-@click.pass_context
 def repl(ctx):
     """Start Zexus REPL with hybrid execution"""
-    syntax_style = ctx.obj['SYNTAX_STYLE']
-    advanced_parsing = ctx.obj['ADVANCED_PARSING']
-    execution_mode = ctx.obj['EXECUTION_MODE']
+    syntax_style = ctx['SYNTAX_STYLE']
+    advanced_parsing = ctx['ADVANCED_PARSING']
+    execution_mode = ctx['EXECUTION_MODE']
+    from ..evaluator import Environment
+    from ..hybrid_orchestrator import orchestrator
     env = Environment()
-    validator = SyntaxValidator()
+    validator = _get_validator()
 
-    console.print("[bold green]Zexus Hybrid REPL v0.1.0[/bold green]")
-    console.print(f"🚀 [bold blue]Execution mode:[/bold blue] {execution_mode}")
-    console.print(f"📝 [bold blue]Syntax style:[/bold blue] {syntax_style}")
-    console.print(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
-    console.print("Type 'mode <interpreter|compiler|auto>' to switch execution mode")
-    console.print("Type 'stats' to see execution statistics")
-    console.print("Type 'exit' to quit\n")
+    echo("[bold green]Zexus Hybrid REPL v0.1.0[/bold green]")
+    echo(f"🚀 [bold blue]Execution mode:[/bold blue] {execution_mode}")
+    echo(f"📝 [bold blue]Syntax style:[/bold blue] {syntax_style}")
+    echo(f"🔧 [bold blue]Advanced parsing:[/bold blue] {'Enabled' if advanced_parsing else 'Disabled'}")
+    echo("Type 'mode <interpreter|compiler|auto>' to switch execution mode")
+    echo("Type 'stats' to see execution statistics")
+    echo("Type 'exit' to quit\n")
 
     current_mode = execution_mode
+    validate_code = validator.validate_code
+    execute = orchestrator.execute
+    read_line = _console().input if _COLOR else input
 
     while True:
         try:
-            code = console.input(f"[bold blue]zexus({current_mode})> [/bold blue]")
+            prompt = f"[bold blue]zexus({current_mode})> [/bold blue]"
+            code = read_line(prompt if _COLOR else _MARKUP.sub('', prompt))
             
             if code.strip() in ['exit', 'quit']:
                 break
             elif code.strip() == 'stats':
-                console.print(f"📊 Interpreter uses: {orchestrator.interpreter_used}")
-                console.print(f"📊 Compiler uses: {orchestrator.compiler_used}")
-                console.print(f"📊 Fallbacks: {orchestrator.fallbacks}")
+                echo(f"📊 Interpreter uses: {orchestrator.interpreter_used}")
+                echo(f"📊 Compiler uses: {orchestrator.compiler_used}")
+                echo(f"📊 Fallbacks: {orchestrator.fallbacks}")
                 continue
             elif code.strip().startswith('mode '):
                 new_mode = code.split(' ')[1]
                 if new_mode in ['interpreter', 'compiler', 'auto']:
                     current_mode = new_mode
-                    console.print(f"🔄 Switched to {current_mode} mode")
+                    echo(f"🔄 Switched to {current_mode} mode")
                 else:
-                    console.print("❌ Invalid mode. Use: interpreter, compiler, or auto")
+                    echo("❌ Invalid mode. Use: interpreter, compiler, or auto")
                 continue
             elif not code.strip():
                 continue
 
             # Validate syntax in REPL
             if syntax_style != 'auto':
-                validation_result = validator.validate_code(code, syntax_style)
+                validation_result = validate_code(code, syntax_style)
                 if not validation_result['is_valid']:
                     for suggestion in validation_result['suggestions']:
                         if suggestion['severity'] == 'error':
-                            console.print(f"[red]Syntax: {suggestion['message']}[/red]")
+                            echo(f"[red]Syntax: {suggestion['message']}[/red]")
 
             # Use hybrid execution
-            result = orchestrator.execute(
+            result = execute(
                 code, 
                 environment=env, 
                 mode=current_mode,
@@ -347,33 +620,17 @@ def repl(ctx):
             )
             
             if result and hasattr(result, 'inspect') and result.inspect() != 'null':
-                console.print(f"[green]{result.inspect()}[/green]")
+                echo(f"[green]{result.inspect()}[/green]")
 
         except KeyboardInterrupt:
-            console.print("\n👋 Goodbye!")
+            echo("\n👋 Goodbye!")
             break
         except Exception as e:
-            console.print(f"[red]Error: {str(e)}[/red]")
+            echo(f"[red]Error: {str(e)}[/red]")
 
-@cli.command()
-@click.option('--mode', type=click.Choice(['interpreter', 'compiler', 'auto']),
-              default='auto', help='Default execution mode for the project')
-@click.pass_context
-def init(ctx, mode):
-    """Initialize a new Zexus project with hybrid execution support"""
-    syntax_style = ctx.obj['SYNTAX_STYLE']
-    project_name = click.prompt("Project name", default="my-zexus-app")
 
-    project_path = Path(project_name)
-    project_path.mkdir(exist_ok=True)
-
-    # Create basic structure
-    (project_path / "src").mkdir()
-    (project_path / "tests").mkdir()
-
-    # Choose template based on syntax style and execution mode
-    if syntax_style == "universal":
-        main_content = f'''# Welcome to Zexus! (Universal Syntax)
+# Project files written by `init`, as str.format templates
+_MAIN_UNIVERSAL = '''# Welcome to Zexus! (Universal Syntax)
 # Execution Mode: {mode}
 
 let app_name = "My Zexus App"
@@ -400,8 +657,8 @@ action main() {{
 
 main()
 '''
-    else:
-        main_content = f'''# Welcome to Zexus! (Flexible Syntax)  
+
+_MAIN_FLEXIBLE = '''# Welcome to Zexus! (Flexible Syntax)  
 # Execution Mode: {mode}
 
 let app_name = "My Zexus App"
@@ -427,11 +684,10 @@ action main():
 main()
 '''
 
-    (project_path / "main.zx").write_text(main_content)
+_MAIN_TEMPLATES = {'universal': _MAIN_UNIVERSAL}
 
-    # Create config file with hybrid settings
-    config_content = f'''{{
-    "name": "{project_name}",
+_CONFIG_TEMPLATE = '''{{
+    "name": "{name}",
     "version": "0.1.0", 
     "type": "application",
     "entry_point": "main.zx",
@@ -442,37 +698,65 @@ main()
 }}
 '''
 
-    (project_path / "zexus.json").write_text(config_content)
 
-    console.print(f"\n✅ [bold green]Project '{project_name}' created![/bold green]")
-    console.print(f"📁 cd {project_name}")
-    console.print("🚀 zx run main.zx")
-    console.print(f"📝 [bold blue]Using {syntax_style} syntax style[/bold blue]")
-    console.print(f"🚀 [bold blue]Default execution mode: {mode}[/bold blue]")
+def init(ctx, mode):
+    """Initialize a new Zexus project with hybrid execution support"""
+    syntax_style = ctx['SYNTAX_STYLE']
+    project_name = input("Project name [my-zexus-app]: ").strip() or "my-zexus-app"
+
+    project_path = Path(project_name)
+    project_path.mkdir(exist_ok=True)
+
+    # Create basic structure
+    (project_path / "src").mkdir()
+    (project_path / "tests").mkdir()
+
+    # Choose template based on syntax style and execution mode
+    main_template = _MAIN_TEMPLATES.get(syntax_style, _MAIN_FLEXIBLE)
+    (project_path / "main.zx").write_bytes(main_template.format(mode=mode).encode('utf-8'))
+
+    # Create config file with hybrid settings
+    config_content = _CONFIG_TEMPLATE.format(name=project_name, syntax_style=syntax_style, mode=mode)
+    (project_path / "zexus.json").write_bytes(config_content.encode('utf-8'))
+
+    echo(f"\n✅ [bold green]Project '{project_name}' created![/bold green]")
+    echo(f"📁 cd {project_name}")
+    echo("🚀 zx run main.zx")
+    echo(f"📝 [bold blue]Using {syntax_style} syntax style[/bold blue]")
+    echo(f"🚀 [bold blue]Default execution mode: {mode}[/bold blue]")
 
-@cli.command()
-@click.argument('action', type=click.Choice(['on', 'off', 'minimal', 'status']))
-@click.pass_context
 def debug(ctx, action):
     """Control persistent debug logging: on/off/minimal/status"""
     if action == 'status':
-        console.print(f"🔍 Debug level: [bold]{config.debug_level}[/bold]")
+        echo(f"🔍 Debug level: [bold]{config.debug_level}[/bold]")
         return
 
     if action == 'on':
         config.enable_debug('full')
-        console.print("✅ Debugging enabled (full)")
+        echo("✅ Debugging enabled (full)")
         return
 
     if action == 'minimal':
         config.enable_debug('minimal')
-        console.print("✅ Debugging set to minimal (errors/warnings)")
+        echo("✅ Debugging set to minimal (errors/warnings)")
         return
 
     if action == 'off':
         config.disable_debug()
-        console.print("✅ Debugging disabled")
+        echo("✅ Debugging disabled")
         return
 
+# command name -> (handler, params); see _parse_command_args for param kinds
+COMMANDS = {
+    'run': (run, {'file': ('file', None), 'force': ('flag', 'Run even when syntax errors could not be auto-fixed')}),
+    'check': (check, {'file': ('file', None)}),
+    'validate': (validate, {'file': ('file', None)}),
+    'ast': (ast, {'file': ('file', None)}),
+    'tokens': (tokens, {'file': ('file', None), 'pretty': ('flag', 'Render a table when writing to a terminal')}),
+    'repl': (repl, {}),
+    'init': (init, {'mode': ('option', (EXECUTION_MODES, 'auto', 'Default execution mode for the project'))}),
+    'debug': (debug, {'action': ('choice', DEBUG_ACTIONS)}),
+}
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
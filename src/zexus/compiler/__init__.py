@@ -5,31 +5,206 @@ Zexus Compiler Phase - Frontend compilation with semantic analysis
 """
 
 # Minimal top-level exports to avoid import-time cycles/errors.
-# Do not import .parser, .semantic, .bytecode at module import time unconditionally.
-# They will be imported lazily inside ZexusCompiler.compile().
+# Only ZexusCompiler is defined at import time; Parser, BUILTINS and the frontend
+# classes are resolved on first attribute access by the module __getattr__ below.
+import hashlib
+import importlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
 
-Parser = None  # will be set if parser import succeeds below (best-effort)
 ZexusCompiler = None  # defined below
 
-# Expose interpreter builtins to the compiler package for semantic passes.
-# Fall back to an empty dict if the evaluator cannot be imported (avoids import cycles).
-try:
-	from ..evaluator import builtins as BUILTINS
-except Exception:
-	BUILTINS = {}
-
-# Try to import ProductionParser now but don't fail if it errors (best-effort).
-try:
-	from .parser import ProductionParser as _ProductionParser
-	Parser = _ProductionParser
-except Exception:
-	# Leave Parser as None; consumers should handle None and provide helpful messages.
-	Parser = None
+# name -> (submodule, attribute) for lazily exported frontend classes
+_LAZY_EXPORTS = {
+	'Lexer': ('.lexer', 'Lexer'),
+	'ProductionParser': ('.parser', 'ProductionParser'),
+	'SemanticAnalyzer': ('.semantic', 'SemanticAnalyzer'),
+	'BytecodeGenerator': ('.bytecode', 'BytecodeGenerator'),
+}
+
+def __getattr__(name):
+	"""PEP 562 hook: import what `name` needs on first access and cache it."""
+	if name == 'BUILTINS':
+		# Expose interpreter builtins to the compiler package for semantic passes.
+		# Fall back to an empty dict if the evaluator cannot be imported (avoids import cycles).
+		try:
+			from ..evaluator import builtins as value
+		except Exception:
+			value = {}
+	elif name == 'Parser':
+		# Best-effort: Parser is None if the parser cannot be imported;
+		# consumers should handle None and provide helpful messages.
+		try:
+			from .parser import ProductionParser as value
+		except Exception:
+			value = None
+	elif name in _LAZY_EXPORTS:
+		module_name, attr = _LAZY_EXPORTS[name]
+		value = getattr(importlib.import_module(module_name, __name__), attr)
+	else:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	globals()[name] = value
+	return value
+
+def _builtins():
+	"""BUILTINS for use inside this module (bare names bypass __getattr__)."""
+	g = globals()
+	return g['BUILTINS'] if 'BUILTINS' in g else __getattr__('BUILTINS')
+
+# Frontend classes (Lexer, ProductionParser, SemanticAnalyzer, BytecodeGenerator),
+# bound by _lazy_load() on the first compile() rather than at package import.
+_FRONTEND = None
+
+def _lazy_load():
+	"""Import the frontend modules once; returns an error message if one fails."""
+	global _FRONTEND
+	if _FRONTEND is not None:
+		return None
+
+	try:
+		from .lexer import Lexer
+	except Exception as e:
+		return f"Compilation import error (lexer): {e}"
+
+	try:
+		from .parser import ProductionParser
+	# if parser import fails, record the error and provide a helpful fallback
+	except Exception as e:
+		return f"Compilation import error (parser): {e}"
+
+	try:
+		from .semantic import SemanticAnalyzer
+	except Exception as e:
+		return f"Compilation import error (semantic): {e}"
+
+	try:
+		from .bytecode import BytecodeGenerator
+	except Exception as e:
+		return f"Compilation import error (bytecode): {e}"
+
+	_FRONTEND = (Lexer, ProductionParser, SemanticAnalyzer, BytecodeGenerator)
+	return None
+
+# Successful compilations keyed by source digest: key -> (ast, analyzer, bytecode).
+# Least recently used entries are evicted past _BYTECODE_CACHE_SIZE. Every
+# ZexusCompiler for the same source gets these same objects, so they are
+# treated as read-only once cached.
+_BYTECODE_CACHE = OrderedDict()
+_BYTECODE_CACHE_SIZE = 128
+
+# On-disk copy of the same entries, one pickle per source digest. Once more
+# than _DISK_CACHE_SIZE files are there, the least recently used are deleted.
+_DISK_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "zexus" / "bc"
+_DISK_CACHE_SIZE = 1024
+
+_DISK_CACHE_TAG = None
+
+# Pickles in _DISK_CACHE_DIR as counted by this process; None until its first write
+_disk_cache_count = None
+
+def _disk_cache_path(key):
+	# The file name carries a stamp of the compiler's own source files, so
+	# entries pickled by a different version of the frontend are never loaded.
+	global _DISK_CACHE_TAG
+	if _DISK_CACHE_TAG is None:
+		here = Path(__file__).parent
+		stamp = hashlib.blake2b(digest_size=4)
+		for name in ("lexer.py", "parser.py", "zexus_ast.py", "semantic.py", "bytecode.py"):
+			st = os.stat(here / name)
+			stamp.update(f"{name}:{st.st_mtime_ns}:{st.st_size};".encode())
+		_DISK_CACHE_TAG = stamp.hexdigest()
+	return _DISK_CACHE_DIR / f"{key.hex()}-{_DISK_CACHE_TAG}.pkl"
+
+def _load_cached(key):
+	entry = _BYTECODE_CACHE.get(key)
+	if entry is not None:
+		_BYTECODE_CACHE.move_to_end(key)
+		return entry
+	path = _disk_cache_path(key)
+	try:
+		with open(path, 'rb') as f:
+			entry = pickle.load(f)
+	except Exception:
+		return None
+	# mark the file as recently used, so eviction keeps it
+	try:
+		os.utime(path)
+	except OSError:
+		pass
+	_store_cached(key, entry, write_disk=False)
+	return entry
+
+def _store_cached(key, entry, write_disk=True):
+	global _disk_cache_count
+	_BYTECODE_CACHE[key] = entry
+	if len(_BYTECODE_CACHE) > _BYTECODE_CACHE_SIZE:
+		_BYTECODE_CACHE.popitem(last=False)
+	if not write_disk:
+		return
+	# best-effort: write to a temp file and rename so readers never see a partial pickle
+	path = _disk_cache_path(key)
+	tmp = path.with_suffix(f".{os.getpid()}.tmp")
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		is_new = not path.exists()
+		with open(tmp, 'wb') as f:
+			pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp, path)
+	except Exception:
+		try:
+			tmp.unlink()
+		except OSError:
+			pass
+		return
+	if not is_new:
+		return
+	if _disk_cache_count is None:
+		# first new file of this process: count what earlier runs left
+		try:
+			_disk_cache_count = sum(1 for _ in _DISK_CACHE_DIR.glob("*.pkl"))
+		except OSError:
+			return
+	else:
+		_disk_cache_count += 1
+	if _disk_cache_count > _DISK_CACHE_SIZE:
+		_prune_disk_cache()
+
+def _prune_disk_cache():
+	"""Delete pickles written by other versions of the frontend (another tag),
+	which can never be loaded again, then the least recently used ones until a
+	quarter of _DISK_CACHE_SIZE is free, so the next writes do not prune again."""
+	global _disk_cache_count
+	suffix = f"-{_DISK_CACHE_TAG}.pkl"
+	stale = []
+	current = []
+	try:
+		for p in _DISK_CACHE_DIR.glob("*.pkl"):
+			if not p.name.endswith(suffix):
+				stale.append(p)
+				continue
+			try:
+				current.append((p.stat().st_mtime_ns, p))
+			except OSError:
+				pass
+	except OSError:
+		return
+	current.sort()
+	keep = _DISK_CACHE_SIZE - _DISK_CACHE_SIZE // 4
+	evicted = [p for _, p in current[:max(len(current) - keep, 0)]]
+	for p in stale + evicted:
+		try:
+			p.unlink()
+		except OSError:
+			pass
+	_disk_cache_count = len(current) - len(evicted)
 
 # --- Compiler class (lazy imports inside compile) --------------------------------
 class ZexusCompiler:
 	def __init__(self, source, enable_optimizations=True):
 		self.source = source
+		self._cache_key = hashlib.blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
 		self.enable_optimizations = enable_optimizations
 		self.ast = None
 		self.bytecode = None
@@ -37,32 +212,22 @@ class ZexusCompiler:
 		self.analyzer = None  # store SemanticAnalyzer instance after compile
 		
 	def compile(self):
-		"""Full compilation pipeline with enhanced error reporting (lazy module imports)"""
-		# Import frontend components lazily to avoid import-time circular issues.
-		try:
-			from .lexer import Lexer
-		except Exception as e:
-			self.errors.append(f"Compilation import error (lexer): {e}")
-			return None
+		"""Full compilation pipeline with enhanced error reporting (lazy module imports)
 
-		try:
-			from .parser import ProductionParser
-		# if parser import fails, record the error and provide a helpful fallback
-		except Exception as e:
-			self.errors.append(f"Compilation import error (parser): {e}")
-			return None
-
-		try:
-			from .semantic import SemanticAnalyzer
-		except Exception as e:
-			self.errors.append(f"Compilation import error (semantic): {e}")
-			return None
+		A source compiled before is served from the cache: the ast, analyzer and
+		bytecode are then the same objects other compilers of that source hold,
+		and must not be modified."""
+		cached = _load_cached(self._cache_key)
+		if cached is not None:
+			self.ast, self.analyzer, self.bytecode = cached
+			return self.bytecode
 
-		try:
-			from .bytecode import BytecodeGenerator
-		except Exception as e:
-			self.errors.append(f"Compilation import error (bytecode): {e}")
+		# Import frontend components lazily to avoid import-time circular issues.
+		import_error = _lazy_load()
+		if import_error:
+			self.errors.append(import_error)
 			return None
+		Lexer, ProductionParser, SemanticAnalyzer, BytecodeGenerator = _FRONTEND
 
 		try:
 			# Phase 1: Lexical Analysis
@@ -83,6 +248,7 @@ class ZexusCompiler:
 			self.analyzer = analyzer
 
 			# Best-effort: inject BUILTINS into analyzer environment
+			BUILTINS = _builtins()
 			try:
 				if BUILTINS:
 					if hasattr(analyzer, "register_builtins") and callable(getattr(analyzer, "register_builtins")):
@@ -113,7 +279,8 @@ class ZexusCompiler:
 			# Phase 4: Bytecode Generation
 			generator = BytecodeGenerator()
 			self.bytecode = generator.generate(self.ast)
-			
+
+			_store_cached(self._cache_key, (self.ast, self.analyzer, self.bytecode))
 			return self.bytecode
 			
 		except Exception as e:
@@ -136,6 +303,7 @@ class ZexusCompiler:
 			return None
 
 		# Provide builtins mapping to VM if analyzer has environment dict or via compiler BUILTINS
+		BUILTINS = _builtins()
 		builtins_map = {}
 		if self.analyzer and hasattr(self.analyzer, "environment") and isinstance(self.analyzer.environment, dict):
 			builtins_map = {k: v for k, v in self.analyzer.environment.items() if k in BUILTINS}
@@ -153,13 +321,3 @@ class ZexusCompiler:
 
 		vm = VM(builtins=builtins_map, env=vm_env)
 		return vm.execute(self.bytecode, debug=debug)
-
-# Provide Parser alias for external code expecting it (best-effort)
-try:
-	from .parser import ProductionParser as _ParserAlias
-	Parser = _ParserAlias
-except Exception:
-	# keep existing Parser (possibly None) and avoid raising on import
-	pass
-
-Parser = Parser or None
\ No newline at end of file
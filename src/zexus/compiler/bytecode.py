@@ -2,265 +2,578 @@
 Low-level Bytecode Generator for Zexus compiler frontend.
 
 Generates a stack-machine Bytecode object:
- - bytecode.instructions: list of (opcode, operand)
+ - bytecode.opcodes / operands / operands2: parallel typed arrays, one slot per instruction
+ - bytecode.instructions: (opcode, operand) view decoded from the arrays
  - bytecode.constants: list of python literals / nested Bytecode function descriptors
+ - bytecode.names: variable / function names referenced by the name opcodes
 
 New opcodes introduced/used:
  - LOAD_CONST (idx)     ; push constant
- - LOAD_NAME (idx)      ; push env[name] at runtime (name stored in constants)
+ - LOAD_SMALLINT (n)    ; push the int n stored in the operand itself (no constant slot)
+ - LOAD_TRUE / LOAD_FALSE ; push a boolean
+ - LOAD_NAME (idx)      ; push env[name] at runtime (name stored in names)
  - STORE_NAME (idx)     ; pop and store into env[name]
+ - STORE_FUNC (name_idx, func_const_idx) ; bind a function descriptor constant to a name
  - CALL_NAME (name_idx, arg_count)   ; call function by name (env or builtins)
  - CALL_FUNC_CONST (func_const_idx, arg_count) ; call function by constant descriptor
  - RETURN
  - SPAWN_CALL (call_operand) ; spawn a call as task (call_operand is same structure as CALL_*)
  - AWAIT
+ - CONCAT_N (count)     ; pop count values, push their string concatenation
+ - JUMP_IF_TRUE (target) ; pop; jump unless the value is None/False
  - Other control ops: JUMP, JUMP_IF_FALSE, etc.
 
 This generator focuses on action/function lowering and call sites.
 """
-from typing import List, Any, Dict, Tuple
+import operator
+import sys
+from array import array
+from typing import List, Any, Dict, Tuple, Union
 from .zexus_ast import (
     Program, LetStatement, ExpressionStatement, PrintStatement, ReturnStatement,
-    IfStatement, WhileStatement, Identifier, IntegerLiteral, StringLiteral,
+    IfStatement, WhileStatement, Identifier, IntegerLiteral, FloatLiteral, StringLiteral,
     Boolean as AST_Boolean, InfixExpression, PrefixExpression, CallExpression,
-    ActionStatement, BlockStatement, MapLiteral, ListLiteral, AwaitExpression
+    ActionStatement, ActionLiteral, BlockStatement, MapLiteral, ListLiteral, AwaitExpression
 )
 
+# Opcode name <-> numeric id used in Bytecode.opcodes
+_OPCODE_NAMES = tuple(sys.intern(name) for name in (
+    'LOAD_CONST', 'LOAD_SMALLINT', 'LOAD_TRUE', 'LOAD_FALSE', 'LOAD_NAME', 'STORE_NAME', 'STORE_FUNC', 'POP', 'PRINT',
+    'CALL_NAME', 'CALL_FUNC_CONST', 'CALL_TOP', 'RETURN', 'SPAWN', 'AWAIT',
+    'JUMP', 'JUMP_IF_FALSE', 'JUMP_IF_TRUE', 'BUILD_LIST', 'CONCAT_N', 'NOT', 'NEG',
+    'ADD', 'SUB', 'MUL', 'DIV', 'EQ', 'NEQ', 'LT', 'GT', 'LTE', 'GTE', 'AND', 'OR',
+    'REGISTER_EVENT', 'EMIT_EVENT', 'IMPORT', 'DEFINE_ENUM', 'ASSERT_PROTOCOL',
+    'UNKNOWN_OP',
+))
+_OPCODE_ID = {name: i for i, name in enumerate(_OPCODE_NAMES)}
+
+# Numeric opcodes, in _OPCODE_NAMES order
+(
+    LOAD_CONST, LOAD_SMALLINT, LOAD_TRUE, LOAD_FALSE, LOAD_NAME, STORE_NAME, STORE_FUNC, POP, PRINT,
+    CALL_NAME, CALL_FUNC_CONST, CALL_TOP, RETURN, SPAWN, AWAIT,
+    JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, BUILD_LIST, CONCAT_N, NOT, NEG,
+    ADD, SUB, MUL, DIV, EQ, NEQ, LT, GT, LTE, GTE, AND, OR,
+    REGISTER_EVENT, EMIT_EVENT, IMPORT, DEFINE_ENUM, ASSERT_PROTOCOL,
+    UNKNOWN_OP,
+) = range(len(_OPCODE_NAMES))
+
+# Infix / prefix operator -> opcode
+_OP_MAP = {
+    '+': ADD, '-': SUB, '*': MUL, '/': DIV,
+    '==': EQ, '!=': NEQ, '<': LT, '>': GT,
+    '<=': LTE, '>=': GTE,
+}
+_PREFIX_OP_MAP = {'!': NOT, '-': NEG}
+# Logical operator -> jump taken as soon as the left operand decides the result
+_SHORT_CIRCUIT_JUMPS = {'&&': JUMP_IF_FALSE, '||': JUMP_IF_TRUE}
+
+# Opcodes whose operand is a pair; the second half lives in Bytecode.operands2
+_PAIR_OPCODES = frozenset((
+    STORE_FUNC, CALL_NAME, CALL_FUNC_CONST,
+    REGISTER_EVENT, EMIT_EVENT, IMPORT, DEFINE_ENUM, ASSERT_PROTOCOL,
+))
+
+# Operand slot value standing in for a missing (None) operand
+NO_OPERAND = -1
+
+# Int literals in this range are emitted inline as LOAD_SMALLINT; the range stays
+# clear of NO_OPERAND and within the signed 32-bit operand array
+_SMALLINT_MAX = 2 ** 31 - 1
+
+# Compile-time folding of literal-only operator trees, per operand type (both
+# operands must share it). Semantics follow the interpreter: int '/' floors.
+_NOT_CONSTANT = object()
+_FOLD_OPS = {
+    int: {
+        '+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.floordiv,
+        '==': operator.eq, '!=': operator.ne, '<': operator.lt, '>': operator.gt,
+        '<=': operator.le, '>=': operator.ge,
+    },
+    str: {'+': operator.add, '==': operator.eq, '!=': operator.ne},
+    bool: {
+        '&&': lambda a, b: a and b, '||': lambda a, b: a or b,
+        '==': operator.eq, '!=': operator.ne,
+    },
+}
+_FOLD_PREFIX = {('-', int): operator.neg, ('!', bool): operator.not_}
+
+# Map literal keys taken by value, and value nodes stored straight into the map constant
+_MAP_KEY_TYPES = frozenset((StringLiteral, Identifier))
+_MAP_LITERAL_TYPES = frozenset((StringLiteral, IntegerLiteral, FloatLiteral, AST_Boolean))
+
+def _fold_node(node, operands):
+    """Value of an infix/prefix node over literal operand values, or _NOT_CONSTANT"""
+    if _NOT_CONSTANT in operands:
+        return _NOT_CONSTANT
+    if len(operands) == 1:
+        fn = _FOLD_PREFIX.get((node.operator, type(operands[0])))
+        return _NOT_CONSTANT if fn is None else fn(operands[0])
+    left, right = operands
+    if type(left) is not type(right):
+        return _NOT_CONSTANT
+    fn = _FOLD_OPS.get(type(left), {}).get(node.operator)
+    if fn is None or (fn is operator.floordiv and right == 0):
+        # unknown operator, or a division error left for runtime
+        return _NOT_CONSTANT
+    return fn(left, right)
+
+def _string_concat_parts(root, not_chains):
+    """Operands of a '+' tree in which every '+' has a string operand, in order.
+
+    The evaluator turns `str + x` / `x + str` into concatenation, so such a tree
+    is the concatenation of its operands' string forms. Returns None when the
+    node is not such a tree. Walks the tree with an explicit stack so long
+    chains cannot hit the recursion limit. `not_chains` holds the ids of '+'
+    nodes already found not to be such trees and is extended in place, so the
+    subtrees of a rejected tree are not walked again when they are emitted.
+    """
+    def pending(node):
+        return type(node) is InfixExpression and node.operator == '+' and id(node) not in not_chains
+
+    if not pending(root):
+        return None
+    results = []  # part lists (or None) of finished '+' nodes
+    work = [(root, None)]
+    while work:
+        node, walked = work.pop()
+        if walked is None:
+            walked = (pending(node.left), pending(node.right))
+            work.append((node, walked))
+            # right pushed first so the left subtree finishes first
+            if walked[1]:
+                work.append((node.right, None))
+            if walked[0]:
+                work.append((node.left, None))
+            continue
+        right = results.pop() if walked[1] else None
+        left = results.pop() if walked[0] else None
+        if (left is None and right is None
+                and type(node.left) is not StringLiteral and type(node.right) is not StringLiteral):
+            not_chains.add(id(node))
+            results.append(None)
+            continue
+        parts = left if left is not None else [node.left]
+        parts.extend(right if right is not None else [node.right])
+        results.append(parts)
+    return results.pop()
+
 # --- Bytecode representation ---
 class Bytecode:
+    """Instructions stored column-wise: opcodes[i], operands[i] and operands2[i]
+    describe instruction i, so backpatching a jump is a single int store."""
+
+    __slots__ = ('opcodes', 'operands', 'operands2', 'constants', '_const_index', 'names', '_name_index')
+
     def __init__(self):
-        self.instructions: List[Tuple[str, Any]] = []
+        self.opcodes = array('B')
+        self.operands = array('i')
+        self.operands2 = array('i')
         self.constants: List[Any] = []
-
-    def add_instruction(self, opcode: str, operand: Any = None):
-        self.instructions.append((opcode, operand))
+        # (type, value) -> index, so repeated literals share one slot
+        self._const_index: Dict[Tuple[type, Any], int] = {}
+        # Names used by LOAD_NAME / STORE_NAME / STORE_FUNC / CALL_NAME, kept
+        # apart from literal constants
+        self.names: List[str] = []
+        self._name_index: Dict[str, int] = {}
+
+    def add_instruction(self, opcode: Union[int, str], operand: Any = None):
+        """Append an instruction; `opcode` is a numeric opcode or its name."""
+        self.opcodes.append(opcode if type(opcode) is int else _OPCODE_ID[opcode])
+        if isinstance(operand, tuple):
+            first, second = operand
+            self.operands.append(NO_OPERAND if first is None else first)
+            self.operands2.append(NO_OPERAND if second is None else second)
+        else:
+            self.operands.append(NO_OPERAND if operand is None else operand)
+            self.operands2.append(NO_OPERAND)
+
+    def emit(self, opcode: int, operand: int = NO_OPERAND, operand2: int = NO_OPERAND):
+        """Append an instruction from a numeric opcode and already-encoded
+        int operands; the generator's fast path around add_instruction()."""
+        self.opcodes.append(opcode)
+        self.operands.append(operand)
+        self.operands2.append(operand2)
+
+    @property
+    def instructions(self) -> List[Tuple[str, Any]]:
+        """Decode the arrays back into (opcode, operand) tuples"""
+        names = _OPCODE_NAMES
+        pairs = _PAIR_OPCODES
+        decoded = []
+        append = decoded.append
+        for op, a, b in zip(self.opcodes, self.operands, self.operands2):
+            a = None if a == NO_OPERAND else a
+            if op in pairs:
+                append((names[op], (a, None if b == NO_OPERAND else b)))
+            else:
+                append((names[op], a))
+        return decoded
 
     def add_constant(self, value: Any) -> int:
-        idx = len(self.constants)
+        try:
+            key = (type(value), value)
+            return self._const_index[key]
+        except KeyError:
+            idx = self._const_index[key] = len(self.constants)
+        except TypeError:
+            # unhashable (map constants, function descriptors): never shared
+            idx = len(self.constants)
         self.constants.append(value)
         return idx
 
+    def add_name(self, name: str) -> int:
+        try:
+            return self._name_index[name]
+        except KeyError:
+            idx = self._name_index[name] = len(self.names)
+            self.names.append(name)
+            return idx
+
 # --- Generator ---
 class BytecodeGenerator:
+    __slots__ = ('bytecode', '_folded', '_not_concat')
+
     def __init__(self):
         self.bytecode = Bytecode()
+        self._folded = {}
+        self._not_concat = set()
 
     def generate(self, program: Program) -> Bytecode:
         self.bytecode = Bytecode()
-        for stmt in getattr(program, "statements", []):
-            self._emit_statement(stmt, self.bytecode)
+        # id(infix/prefix node) -> folded value or _NOT_CONSTANT
+        self._folded = {}
+        # ids of '+' nodes that are not string concatenation chains
+        self._not_concat = set()
+        self._emit_statements(getattr(program, "statements", []), self.bytecode)
         return self.bytecode
 
     # Statement lowering
     def _emit_statement(self, stmt, bc: Bytecode):
-        t = type(stmt).__name__
-
-        if t == "LetStatement":
-            # Evaluate value -> push result, then STORE_NAME
-            self._emit_expression(stmt.value, bc)
-            name_idx = bc.add_constant(stmt.name.value)
-            bc.add_instruction("STORE_NAME", name_idx)
-            return
-
-        if t == "ExpressionStatement":
-            self._emit_expression(stmt.expression, bc)
-            # drop result (no-op) or keep for top-level
-            bc.add_instruction("POP", None)
-            return
-
-        if t == "PrintStatement":
-            self._emit_expression(stmt.value, bc)
-            bc.add_instruction("PRINT", None)
-            return
-
-        if t == "ReturnStatement":
-            self._emit_expression(stmt.return_value, bc)
-            bc.add_instruction("RETURN", None)
-            return
-
-        if t == "ActionStatement":
-            # Compile action body into a nested Bytecode; store as function descriptor constant
-            func_bc = Bytecode()
-            # compile body: we expect BlockStatement
-            for s in getattr(stmt.body, "statements", []):
-                self._emit_statement(s, func_bc)
-            # ensure function returns (implicit)
-            func_bc.add_instruction("RETURN", None)
-            # function descriptor: dict with bytecode, params list, is_async flag
-            params = [p.value for p in getattr(stmt, "parameters", [])]
-            func_desc = {"bytecode": func_bc, "params": params, "is_async": getattr(stmt, "is_async", False)}
-            func_const_idx = bc.add_constant(func_desc)
-            # store function descriptor into environment under name
-            name_idx = bc.add_constant(stmt.name.value)
-            # STORE_FUNC: operand (name_idx, func_const_idx)
-            bc.add_instruction("STORE_FUNC", (name_idx, func_const_idx))
-            return
-
-        if t == "IfStatement":
-            # Very basic lowering: condition, JUMP_IF_FALSE to else/start, consequence, [else], ...
-            self._emit_expression(stmt.condition, bc)
-            # placeholder jump; compute positions
-            jump_pos = len(bc.instructions)
-            bc.add_instruction("JUMP_IF_FALSE", None)
-            # consequence
-            for s in getattr(stmt.consequence, "statements", []):
-                self._emit_statement(s, bc)
-            # update jump to after consequence
-            end_pos = len(bc.instructions)
-            bc.instructions[jump_pos] = ("JUMP_IF_FALSE", end_pos)
-            return
-
-        if t == "WhileStatement":
-            start_pos = len(bc.instructions)
-            self._emit_expression(stmt.condition, bc)
-            # placeholder jump
-            jump_pos = len(bc.instructions)
-            bc.add_instruction("JUMP_IF_FALSE", None)
-            # body
-            for s in getattr(stmt.body, "statements", []):
-                self._emit_statement(s, bc)
-            # loop back
-            bc.add_instruction("JUMP", start_pos)
-            end_pos = len(bc.instructions)
-            bc.instructions[jump_pos] = ("JUMP_IF_FALSE", end_pos)
-            return
-
+        handler = _STMT_DISPATCH.get(type(stmt))
+        if handler is not None:
+            handler(self, stmt, bc)
         # Event/emit/enum/import handled at higher-level generator earlier; treat as NOP here
-        return
+
+    def _emit_statements(self, statements, bc: Bytecode):
+        """_emit_statement over a statement list with the dispatch lookup bound once"""
+        get_handler = _STMT_DISPATCH.get
+        for stmt in statements:
+            handler = get_handler(type(stmt))
+            if handler is not None:
+                handler(self, stmt, bc)
+
+    def _emit_let_statement(self, stmt, bc: Bytecode):
+        # Evaluate value -> push result, then STORE_NAME
+        self._emit_expression(stmt.value, bc)
+        name_idx = bc.add_name(stmt.name.value)
+        bc.emit(STORE_NAME, name_idx)
+
+    def _emit_expression_statement(self, stmt, bc: Bytecode):
+        self._emit_expression(stmt.expression, bc)
+        # drop result (no-op) or keep for top-level
+        bc.emit(POP)
+
+    def _emit_print_statement(self, stmt, bc: Bytecode):
+        self._emit_expression(stmt.value, bc)
+        bc.emit(PRINT)
+
+    def _emit_return_statement(self, stmt, bc: Bytecode):
+        self._emit_expression(stmt.return_value, bc)
+        bc.emit(RETURN)
+
+    def _emit_action_statement(self, stmt, bc: Bytecode):
+        # Compile action body into a nested Bytecode; store as function descriptor constant
+        func_bc = Bytecode()
+        # compile body: we expect BlockStatement
+        self._emit_statements(getattr(stmt.body, "statements", []), func_bc)
+        # ensure function returns (implicit)
+        func_bc.emit(RETURN)
+        # function descriptor: dict with bytecode, params list, is_async flag
+        params = [p.value for p in getattr(stmt, "parameters", [])]
+        func_desc = {"bytecode": func_bc, "params": params, "is_async": getattr(stmt, "is_async", False)}
+        func_const_idx = bc.add_constant(func_desc)
+        # store function descriptor into environment under name
+        name_idx = bc.add_name(stmt.name.value)
+        # STORE_FUNC: operand (name_idx, func_const_idx)
+        bc.emit(STORE_FUNC, name_idx, func_const_idx)
+
+    def _emit_if_statement(self, stmt, bc: Bytecode):
+        # Very basic lowering: condition, JUMP_IF_FALSE to else/start, consequence, [else], ...
+        self._emit_expression(stmt.condition, bc)
+        # placeholder jump; compute positions
+        jump_pos = len(bc.opcodes)
+        bc.emit(JUMP_IF_FALSE)
+        # consequence
+        self._emit_statements(getattr(stmt.consequence, "statements", []), bc)
+        # update jump to after consequence
+        bc.operands[jump_pos] = len(bc.opcodes)
+
+    def _emit_while_statement(self, stmt, bc: Bytecode):
+        start_pos = len(bc.opcodes)
+        self._emit_expression(stmt.condition, bc)
+        # placeholder jump
+        jump_pos = len(bc.opcodes)
+        bc.emit(JUMP_IF_FALSE)
+        # body
+        self._emit_statements(getattr(stmt.body, "statements", []), bc)
+        # loop back
+        bc.emit(JUMP, start_pos)
+        bc.operands[jump_pos] = len(bc.opcodes)
 
     # Expression lowering
     def _emit_expression(self, expr, bc: Bytecode):
-        if expr is None:
-            bc.add_instruction("LOAD_CONST", bc.add_constant(None))
-            return
-
-        typ = type(expr).__name__
-
-        if typ == "IntegerLiteral":
-            const_idx = bc.add_constant(expr.value)
-            bc.add_instruction("LOAD_CONST", const_idx)
-            return
-
-        if typ == "StringLiteral":
-            const_idx = bc.add_constant(expr.value)
-            bc.add_instruction("LOAD_CONST", const_idx)
-            return
-
-        if typ == "Identifier":
-            # push variable value at runtime
-            name_idx = bc.add_constant(expr.value)
-            bc.add_instruction("LOAD_NAME", name_idx)
+        """Lower an expression tree without recursing.
+
+        `work` is a stack of nodes still to visit and (finish, payload) pairs.
+        A handler schedules its own finish step and then its operands on top,
+        so operands are emitted first (left to right) and finish runs after.
+        """
+        work = [expr]
+        pop = work.pop
+        push = work.append
+        dispatch = _EXPR_DISPATCH
+        while work:
+            item = pop()
+            if type(item) is tuple:
+                finish, payload = item
+                finish(payload, bc)
+                continue
+            handler = dispatch.get(type(item)) if item is not None else None
+            if handler is None:
+                # None or unsupported node: push None
+                const_idx = bc.add_constant(None)
+                bc.emit(LOAD_CONST, const_idx)
+                continue
+            handler(self, item, bc, push)
+
+    @staticmethod
+    def _schedule(push, finish, payload, operands):
+        push((finish, payload))
+        for operand in reversed(operands):
+            push(operand)
+
+    def _emit_literal(self, expr, bc: Bytecode, push):
+        const_idx = bc.add_constant(expr.value)
+        bc.emit(LOAD_CONST, const_idx)
+
+    def _emit_integer_literal(self, expr, bc: Bytecode, push):
+        self._emit_value(expr.value, bc)
+
+    def _emit_boolean(self, expr, bc: Bytecode, push):
+        self._emit_value(expr.value, bc)
+
+    @staticmethod
+    def _emit_value(value, bc: Bytecode):
+        """Push a known python value with the cheapest load"""
+        value_type = type(value)
+        if value_type is bool:
+            bc.emit(LOAD_TRUE if value else LOAD_FALSE)
+        elif value_type is int and 0 <= value <= _SMALLINT_MAX:
+            bc.emit(LOAD_SMALLINT, value)
+        else:
+            bc.emit(LOAD_CONST, bc.add_constant(value))
+
+    def _constant_value(self, root):
+        """Fold an infix/prefix tree whose leaves are all literals.
+
+        Returns the value, or _NOT_CONSTANT. Results are memoized per node for
+        the whole generate() run, so nested operators are each folded once.
+        """
+        memo = self._folded
+
+        def value_of(node):
+            node_type = type(node)
+            if node_type is IntegerLiteral or node_type is StringLiteral or node_type is AST_Boolean:
+                return node.value
+            if node_type is InfixExpression or node_type is PrefixExpression:
+                return memo[id(node)]
+            return _NOT_CONSTANT
+
+        work = [(root, False)]
+        while work:
+            node, children_done = work.pop()
+            if id(node) in memo:
+                continue
+            children = (node.left, node.right) if type(node) is InfixExpression else (node.right,)
+            if not children_done:
+                work.append((node, True))
+                for child in children:
+                    if type(child) is InfixExpression or type(child) is PrefixExpression:
+                        work.append((child, False))
+                continue
+            memo[id(node)] = _fold_node(node, [value_of(child) for child in children])
+        return memo[id(root)]
+
+    def _emit_identifier(self, expr, bc: Bytecode, push):
+        # push variable value at runtime
+        name_idx = bc.add_name(expr.value)
+        bc.emit(LOAD_NAME, name_idx)
+
+    def _emit_call_expression(self, expr, bc: Bytecode, push):
+        # Evaluate arguments first (push in order)
+        # If function is an Identifier -> CALL_NAME (by name lookup at runtime)
+        function_type = type(expr.function)
+        if function_type is Identifier:
+            self._schedule(push, self._finish_call_name, expr, expr.arguments)
+        # If function is a literal function descriptor (constant), emit CALL_FUNC_CONST
+        elif function_type is ActionLiteral:
+            self._schedule(push, self._finish_call_action_literal, expr, expr.arguments)
+        # Otherwise function expression evaluated to value on stack, call with CALL_TOP
+        else:
+            self._schedule(push, self._finish_call_top, expr, list(expr.arguments) + [expr.function])
+
+    def _finish_call_name(self, call, bc: Bytecode):
+        name_idx = bc.add_name(call.function.value)
+        # operand: (name_idx, arg_count)
+        bc.emit(CALL_NAME, name_idx, len(call.arguments))
+
+    def _finish_call_action_literal(self, call, bc: Bytecode):
+        # compile inline action literal into nested func bytecode and store as constant
+        # compile nested action body into func_bc
+        func_bc = Bytecode()
+        # lower the action literal's body statements (best-effort)
+        self._emit_statements(getattr(call.function.body, "statements", []), func_bc)
+        func_bc.emit(RETURN)
+        func_desc = {"bytecode": func_bc, "params": [p.value for p in call.function.parameters], "is_async": getattr(call.function, "is_async", False)}
+        func_const_idx = bc.add_constant(func_desc)
+        bc.emit(CALL_FUNC_CONST, func_const_idx, len(call.arguments))
+
+    def _finish_call_top(self, call, bc: Bytecode):
+        bc.emit(CALL_TOP, len(call.arguments))
+
+    # NEW: AwaitExpression lowering to CALL_* followed by AWAIT
+    def _emit_await_expression(self, expr, bc: Bytecode, push):
+        inner = expr.expression
+        # If inner is call by name, emit CALL_NAME then AWAIT
+        if type(inner) is CallExpression and type(inner.function) is Identifier:
+            self._schedule(push, self._finish_await_call_name, inner, inner.arguments)
+        # If inner is call to function expression, evaluate function then CALL_TOP then AWAIT
+        elif type(inner) is CallExpression:
+            self._schedule(push, self._finish_await_call_top, inner, list(inner.arguments) + [inner.function])
+        # generic: emit inner then AWAIT
+        else:
+            self._schedule(push, self._finish_await, None, [inner])
+
+    def _finish_await_call_name(self, call, bc: Bytecode):
+        self._finish_call_name(call, bc)
+        bc.emit(AWAIT)
+
+    def _finish_await_call_top(self, call, bc: Bytecode):
+        bc.emit(CALL_TOP, len(call.arguments))
+        bc.emit(AWAIT)
+
+    def _finish_await(self, _, bc: Bytecode):
+        bc.emit(AWAIT)
+
+    def _emit_infix_expression(self, expr, bc: Bytecode, push):
+        value = self._constant_value(expr)
+        if value is not _NOT_CONSTANT:
+            self._emit_value(value, bc)
             return
-
-        if typ == "CallExpression":
-            # Evaluate arguments first (push in order)
-            for arg in expr.arguments:
-                self._emit_expression(arg, bc)
-
-            # If function is an Identifier -> CALL_NAME (by name lookup at runtime)
-            if isinstance(expr.function, Identifier):
-                name_idx = bc.add_constant(expr.function.value)
-                # operand: (name_const_idx, arg_count)
-                bc.add_instruction("CALL_NAME", (name_idx, len(expr.arguments)))
-                return
-
-            # If function is a literal function descriptor (constant), emit CALL_FUNC_CONST
-            if isinstance(expr.function, ActionLiteral):
-                # compile inline action literal into nested func bytecode and store as constant
-                # compile nested action body into func_bc
-                func_bc = Bytecode()
-                # lower the action literal's body statements (best-effort)
-                for s in getattr(expr.function.body, "statements", []):
-                    self._emit_statement(s, func_bc)
-                func_bc.add_instruction("RETURN", None)
-                func_desc = {"bytecode": func_bc, "params": [p.value for p in expr.function.parameters], "is_async": getattr(expr.function, "is_async", False)}
-                func_const_idx = bc.add_constant(func_desc)
-                bc.add_instruction("CALL_FUNC_CONST", (func_const_idx, len(expr.arguments)))
+        # String '+' chains: push every operand, then join them in one step
+        if expr.operator == '+':
+            parts = _string_concat_parts(expr, self._not_concat)
+            if parts is not None:
+                self._schedule(push, self._finish_concat, len(parts), parts)
                 return
-
-            # Otherwise function expression evaluated to value on stack, call with CALL_TOP
-            self._emit_expression(expr.function, bc)
-            bc.add_instruction("CALL_TOP", len(expr.arguments))
+        # && / || short-circuit: the right operand only runs when it decides the result
+        jump_op = _SHORT_CIRCUIT_JUMPS.get(expr.operator)
+        if jump_op is not None:
+            jumps = [jump_op]
+            push((self._finish_short_circuit, jumps))
+            push(expr.right)
+            push((self._short_circuit_jump, jumps))
+            push(expr.left)
             return
-
-        # NEW: AwaitExpression lowering to CALL_* followed by AWAIT
-        if typ == "AwaitExpression":
-            inner = expr.expression
-            # If inner is call by name, emit CALL_NAME then AWAIT
-            if isinstance(inner, CallExpression) and isinstance(inner.function, Identifier):
-                for arg in inner.arguments:
-                    self._emit_expression(arg, bc)
-                name_idx = bc.add_constant(inner.function.value)
-                bc.add_instruction("CALL_NAME", (name_idx, len(inner.arguments)))
-                bc.add_instruction("AWAIT", None)
-                return
-            # If inner is call to function expression, evaluate function then CALL_TOP then AWAIT
-            if isinstance(inner, CallExpression):
-                for arg in inner.arguments:
-                    self._emit_expression(arg, bc)
-                self._emit_expression(inner.function, bc)
-                bc.add_instruction("CALL_TOP", len(inner.arguments))
-                bc.add_instruction("AWAIT", None)
-                return
-            # generic: emit inner then AWAIT
-            self._emit_expression(inner, bc)
-            bc.add_instruction("AWAIT", None)
-            return
-
-        if typ == "InfixExpression":
-            # Evaluate left then right then op
-            self._emit_expression(expr.left, bc)
-            self._emit_expression(expr.right, bc)
-            op_map = {
-                '+': 'ADD', '-': 'SUB', '*': 'MUL', '/': 'DIV',
-                '==': 'EQ', '!=': 'NEQ', '<': 'LT', '>': 'GT',
-                '<=': 'LTE', '>=': 'GTE', '&&': 'AND', '||': 'OR'
-            }
-            bc.add_instruction(op_map.get(expr.operator, "UNKNOWN_OP"), None)
-            return
-
-        if typ == "PrefixExpression":
-            self._emit_expression(expr.right, bc)
-            if expr.operator == "!":
-                bc.add_instruction("NOT", None)
-            elif expr.operator == "-":
-                bc.add_instruction("NEG", None)
+        # Evaluate left then right then op
+        self._schedule(push, self._finish_op, _OP_MAP.get(expr.operator, UNKNOWN_OP), (expr.left, expr.right))
+
+    def _short_circuit_jump(self, jumps, bc: Bytecode):
+        # jumps[0] is the opcode; later entries are positions awaiting the short-circuit target
+        jumps.append(len(bc.opcodes))
+        bc.emit(jumps[0])
+
+    def _finish_short_circuit(self, jumps, bc: Bytecode):
+        # Both operands fell through: && is true, || is false. A taken jump
+        # lands on the opposite boolean. The result is always a bool, as in the interpreter.
+        self._short_circuit_jump(jumps, bc)
+        is_and = jumps[0] == JUMP_IF_FALSE
+        bc.emit(LOAD_TRUE if is_and else LOAD_FALSE)
+        end_jump = len(bc.opcodes)
+        bc.emit(JUMP)
+        target = len(bc.opcodes)
+        for pos in jumps[1:]:
+            bc.operands[pos] = target
+        bc.emit(LOAD_FALSE if is_and else LOAD_TRUE)
+        bc.operands[end_jump] = len(bc.opcodes)
+
+    def _finish_concat(self, count, bc: Bytecode):
+        bc.emit(CONCAT_N, count)
+
+    def _finish_op(self, opcode, bc: Bytecode):
+        if opcode is not None:
+            bc.emit(opcode)
+
+    def _emit_prefix_expression(self, expr, bc: Bytecode, push):
+        value = self._constant_value(expr)
+        if value is not _NOT_CONSTANT:
+            self._emit_value(value, bc)
             return
-
-        if typ == "ListLiteral":
-            # emit each element and then BUILD_LIST with count
-            for el in expr.elements:
-                self._emit_expression(el, bc)
-            bc.add_instruction("BUILD_LIST", len(expr.elements))
-            return
-
-        if typ == "MapLiteral":
-            # emit k,v pairs as literals (best-effort)
-            items = {}
-            for k_expr, v_expr in expr.pairs:
-                # assume keys are string or identifier
-                if isinstance(k_expr, StringLiteral):
-                    key = k_expr.value
-                elif isinstance(k_expr, Identifier):
-                    key = k_expr.value
-                else:
-                    key = str(k_expr)
-                # lower value to constant if possible
-                if isinstance(v_expr, (StringLiteral, IntegerLiteral)):
-                    items[key] = v_expr.value
-                else:
-                    # fallback: emit value and store under a temp constant (not ideal)
-                    self._emit_expression(v_expr, bc)
-                    # pop and store into a constant slot? Simplify: mark as None
-                    items[key] = None
-            const_idx = bc.add_constant(items)
-            bc.add_instruction("LOAD_CONST", const_idx)
-            return
-
-        # fallback: push None
-        const_idx = bc.add_constant(None)
-        bc.add_instruction("LOAD_CONST", const_idx)
-        return
+        opcode = _PREFIX_OP_MAP.get(expr.operator)
+        self._schedule(push, self._finish_op, opcode, (expr.right,))
+
+    def _emit_list_literal(self, expr, bc: Bytecode, push):
+        # emit each element and then BUILD_LIST with count
+        self._schedule(push, self._finish_list, len(expr.elements), expr.elements)
+
+    def _finish_list(self, count, bc: Bytecode):
+        bc.emit(BUILD_LIST, count)
+
+    def _emit_map_literal(self, expr, bc: Bytecode, push):
+        # emit k,v pairs as literals (best-effort)
+        items = {}
+        emitted = []
+        for k_expr, v_expr in zip(expr.keys, expr.values):
+            # assume keys are string or identifier
+            key = k_expr.value if type(k_expr) in _MAP_KEY_TYPES else str(k_expr)
+            # lower value to constant if possible
+            if type(v_expr) in _MAP_LITERAL_TYPES:
+                items[key] = v_expr.value
+            else:
+                # fallback: emit value and store under a temp constant (not ideal)
+                emitted.append(v_expr)
+                # pop and store into a constant slot? Simplify: mark as None
+                items[key] = None
+        self._schedule(push, self._finish_map, items, emitted)
+
+    def _finish_map(self, items, bc: Bytecode):
+        const_idx = bc.add_constant(items)
+        bc.emit(LOAD_CONST, const_idx)
+
+# type(node) -> handler(generator, node, bc[, push]). AST node classes are never
+# subclassed, so an exact-type lookup replaces an isinstance chain; nodes without
+# a handler fall back to the defaults in _emit_statement/_emit_expression.
+_STMT_DISPATCH = {
+    LetStatement: BytecodeGenerator._emit_let_statement,
+    ExpressionStatement: BytecodeGenerator._emit_expression_statement,
+    PrintStatement: BytecodeGenerator._emit_print_statement,
+    ReturnStatement: BytecodeGenerator._emit_return_statement,
+    ActionStatement: BytecodeGenerator._emit_action_statement,
+    IfStatement: BytecodeGenerator._emit_if_statement,
+    WhileStatement: BytecodeGenerator._emit_while_statement,
+}
+_EXPR_DISPATCH = {
+    IntegerLiteral: BytecodeGenerator._emit_integer_literal,
+    StringLiteral: BytecodeGenerator._emit_literal,
+    AST_Boolean: BytecodeGenerator._emit_boolean,
+    Identifier: BytecodeGenerator._emit_identifier,
+    CallExpression: BytecodeGenerator._emit_call_expression,
+    AwaitExpression: BytecodeGenerator._emit_await_expression,
+    InfixExpression: BytecodeGenerator._emit_infix_expression,
+    PrefixExpression: BytecodeGenerator._emit_prefix_expression,
+    ListLiteral: BytecodeGenerator._emit_list_literal,
+    MapLiteral: BytecodeGenerator._emit_map_literal,
+}
 
 # Backwards compatibility
 Generator = BytecodeGenerator
\ No newline at end of file
@@ -37,7 +37,19 @@ except Exception:
     class EvaluationError(Exception):
         pass
 
-    EVAL_SUMMARY = {}
+    # Same counters as the evaluator's EvalSummary
+    class EvalSummary:
+        __slots__ = ('parsed_statements', 'evaluated_statements', 'errors',
+                     'async_tasks_run', 'max_statements_in_block')
+
+        def __init__(self):
+            self.parsed_statements = 0
+            self.evaluated_statements = 0
+            self.errors = 0
+            self.async_tasks_run = 0
+            self.max_statements_in_block = 0
+
+    EVAL_SUMMARY = EvalSummary()
     NULL = None
     TRUE = True
     FALSE = False
@@ -39,119 +39,138 @@ class Lexer:
             return self.input[self.read_position]
 
     def next_token(self):
+        return self.fill_token(Token(EOF, ""))
+
+    def fill_token(self, tok):
+        """Scan the next token into `tok` in place and return it.
+
+        tokenize_all() recycles one Token this way for the whole source;
+        next_token() wraps this with a new Token for callers that keep tokens.
+        """
         self.skip_whitespace()
 
         # Skip single line comments
         if self.ch == '#' and self.peek_char() != '{':
             self.skip_comment()
-            return self.next_token()
+            return self.fill_token(tok)
 
-        tok = None
-        current_line = self.line
-        current_column = self.column
+        tok.line = self.line
+        tok.column = self.column
+        ch = self.ch
 
-        if self.ch == '=':
+        if ch == '=':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(EQ, literal, current_line, current_column)
+                token_type, literal = EQ, ch + self.ch
             else:
-                tok = Token(ASSIGN, self.ch, current_line, current_column)
-        elif self.ch == '!':
+                token_type, literal = ASSIGN, ch
+        elif ch == '!':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(NOT_EQ, literal, current_line, current_column)
+                token_type, literal = NOT_EQ, ch + self.ch
             else:
-                tok = Token(BANG, self.ch, current_line, current_column)
-        elif self.ch == '&':
+                token_type, literal = BANG, ch
+        elif ch == '&':
             if self.peek_char() == '&':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(AND, literal, current_line, current_column)
+                token_type, literal = AND, ch + self.ch
             else:
-                tok = Token(ILLEGAL, self.ch, current_line, current_column)
-        elif self.ch == '|':
+                token_type, literal = ILLEGAL, ch
+        elif ch == '|':
             if self.peek_char() == '|':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(OR, literal, current_line, current_column)
+                token_type, literal = OR, ch + self.ch
             else:
-                tok = Token(ILLEGAL, self.ch, current_line, current_column)
-        elif self.ch == '<':
+                token_type, literal = ILLEGAL, ch
+        elif ch == '<':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(LTE, literal, current_line, current_column)
+                token_type, literal = LTE, ch + self.ch
             else:
-                tok = Token(LT, self.ch, current_line, current_column)
-        elif self.ch == '>':
+                token_type, literal = LT, ch
+        elif ch == '>':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(GTE, literal, current_line, current_column)
+                token_type, literal = GTE, ch + self.ch
             else:
-                tok = Token(GT, self.ch, current_line, current_column)
-        elif self.ch == '"':
-            string_literal = self.read_string()
-            tok = Token(STRING, string_literal, current_line, current_column)
-        elif self.ch == '[':
-            tok = Token(LBRACKET, self.ch, current_line, current_column)
-        elif self.ch == ']':
-            tok = Token(RBRACKET, self.ch, current_line, current_column)
-        elif self.ch == '(':
-            tok = Token(LPAREN, self.ch, current_line, current_column)
-        elif self.ch == ')':
-            tok = Token(RPAREN, self.ch, current_line, current_column)
-        elif self.ch == '{':
-            tok = Token(LBRACE, self.ch, current_line, current_column)
-        elif self.ch == '}':
-            tok = Token(RBRACE, self.ch, current_line, current_column)
-        elif self.ch == ',':
-            tok = Token(COMMA, self.ch, current_line, current_column)
-        elif self.ch == ';':
-            tok = Token(SEMICOLON, self.ch, current_line, current_column)
-        elif self.ch == ':':
-            tok = Token(COLON, self.ch, current_line, current_column)
-        elif self.ch == '+':
-            tok = Token(PLUS, self.ch, current_line, current_column)
-        elif self.ch == '-':
-            tok = Token(MINUS, self.ch, current_line, current_column)
-        elif self.ch == '*':
-            tok = Token(STAR, self.ch, current_line, current_column)
-        elif self.ch == '/':
-            tok = Token(SLASH, self.ch, current_line, current_column)
-        elif self.ch == '%':
-            tok = Token(MOD, self.ch, current_line, current_column)
-        elif self.ch == '.':
-            tok = Token(DOT, self.ch, current_line, current_column)
-        elif self.ch == "":
-            tok = Token(EOF, "", current_line, current_column)
+                token_type, literal = GT, ch
+        elif ch == '"':
+            token_type, literal = STRING, self.read_string()
+        elif ch == '[':
+            token_type, literal = LBRACKET, ch
+        elif ch == ']':
+            token_type, literal = RBRACKET, ch
+        elif ch == '(':
+            token_type, literal = LPAREN, ch
+        elif ch == ')':
+            token_type, literal = RPAREN, ch
+        elif ch == '{':
+            token_type, literal = LBRACE, ch
+        elif ch == '}':
+            token_type, literal = RBRACE, ch
+        elif ch == ',':
+            token_type, literal = COMMA, ch
+        elif ch == ';':
+            token_type, literal = SEMICOLON, ch
+        elif ch == ':':
+            token_type, literal = COLON, ch
+        elif ch == '+':
+            token_type, literal = PLUS, ch
+        elif ch == '-':
+            token_type, literal = MINUS, ch
+        elif ch == '*':
+            token_type, literal = STAR, ch
+        elif ch == '/':
+            token_type, literal = SLASH, ch
+        elif ch == '%':
+            token_type, literal = MOD, ch
+        elif ch == '.':
+            token_type, literal = DOT, ch
+        elif ch == "":
+            token_type, literal = EOF, ""
         else:
-            if self.is_letter(self.ch):
+            if self.is_letter(ch):
                 literal = self.read_identifier()
-                token_type = self.lookup_ident(literal)
-                tok = Token(token_type, literal, current_line, current_column)
+                tok.type = self.lookup_ident(literal)
+                tok.literal = tok.value = literal
                 return tok
-            elif self.is_digit(self.ch):
-                num_literal = self.read_number()
-                if '.' in num_literal:
-                    tok = Token(FLOAT, num_literal, current_line, current_column)
-                else:
-                    tok = Token(INT, num_literal, current_line, current_column)
+            elif self.is_digit(ch):
+                literal = self.read_number()
+                tok.type = FLOAT if '.' in literal else INT
+                tok.literal = tok.value = literal
                 return tok
             else:
-                tok = Token(ILLEGAL, self.ch, current_line, current_column)
+                token_type, literal = ILLEGAL, ch
 
         self.read_char()
+        tok.type = token_type
+        tok.literal = tok.value = literal
         return tok
 
+    def tokenize_all(self):
+        """Scan the rest of the source into parallel (types, literals, lines) lists.
+
+        The lists end with two EOF entries so a parser sitting on the first
+        one can still peek. A single Token is recycled for the whole scan.
+        """
+        types = []
+        literals = []
+        lines = []
+        tok = Token(EOF, "")
+        fill_token = self.fill_token
+        while True:
+            fill_token(tok)
+            types.append(tok.type)
+            literals.append(tok.literal)
+            lines.append(tok.line)
+            if tok.type == EOF:
+                break
+        fill_token(tok)
+        types.append(tok.type)
+        literals.append(tok.literal)
+        lines.append(tok.line)
+        return types, literals, lines
+
     def skip_comment(self):
         while self.ch != '\n' and self.ch != "":
             self.read_char()
@@ -21,12 +21,31 @@ precedences = {
     ASSIGN: ASSIGN_PREC,
 }
 
+# Leaf nodes are never mutated after parsing, so every `true`/`false` in a
+# program can share one node
+_TRUE = Boolean(True)
+_FALSE = Boolean(False)
+_EMPTY_EMBEDDED = EmbeddedLiteral("unknown", "")
+
 class ProductionParser:
+    __slots__ = ('lexer', 'errors', 'types', 'literals', 'lines', 'i', '_last',
+                 'prefix_parse_fns', 'infix_parse_fns', 'infix_table', 'stmt_parse_fns',
+                 '_ident_cache', '_int_cache', '_float_cache')
+
     def __init__(self, lexer):
         self.lexer = lexer
         self.errors = []
-        self.cur_token = None
-        self.peek_token = None
+
+        # Lex the whole stream up front and walk it with an integer cursor;
+        # a second EOF keeps the peek slot valid while sitting on the first.
+        self.types, self.literals, self.lines = lexer.tokenize_all()
+        self.i = 0
+        self._last = len(self.types) - 2
+        # One Identifier node per distinct name used in an expression, and
+        # one literal node per distinct number spelling
+        self._ident_cache = {}
+        self._int_cache = {}
+        self._float_cache = {}
         
         # Parser function maps
         self.prefix_parse_fns = {
@@ -66,87 +85,101 @@ class ProductionParser:
             LPAREN: self.parse_call_expression,
             DOT: self.parse_method_call_expression,
         }
-        
-        self.next_token()
-        self.next_token()
+
+        # Operator token -> (precedence, handler), so the Pratt loop finds
+        # both with one probe; tokens without an entry end an expression.
+        # A None handler marks a plain binary operator, which
+        # parse_expression folds itself instead of recursing.
+        binary = self.parse_infix_expression
+        self.infix_table = {
+            t: (precedences[t], None if fn == binary else fn)
+            for t, fn in self.infix_parse_fns.items()
+        }
+
+        self.stmt_parse_fns = {
+            LET: self.parse_let_statement,
+            RETURN: self.parse_return_statement,
+            PRINT: self.parse_print_statement,
+            FOR: self.parse_for_each_statement,
+            ACTION: self.parse_action_statement,
+            ASYNC: self.parse_async_statement,
+            EVENT: self.parse_event_declaration,
+            EMIT: self.parse_emit_statement,
+            ENUM: self.parse_enum_declaration,
+            PROTOCOL: self.parse_protocol_declaration,
+            IMPORT: self.parse_import_statement,
+        }
 
     def parse_program(self):
         """Clean, efficient program parsing"""
         program = Program()
-        while not self.cur_token_is(EOF):
+        types = self.types
+        statements = program.statements
+        parse_statement = self.parse_statement
+        next_token = self.next_token
+        while types[self.i] != EOF:
             # Tolerant: skip stray semicolons between statements
-            if self.cur_token_is(SEMICOLON):
-                self.next_token()
+            if types[self.i] == SEMICOLON:
+                next_token()
                 continue
 
-            stmt = self.parse_statement()
+            try:
+                stmt = parse_statement()
+            except Exception as e:
+                # Last-resort guard: parse_* methods report their own
+                # failures through self.errors and return None
+                self.errors.append(f"Line {self.lines[self.i]}: Parse error - {str(e)}")
+                stmt = None
             if stmt:
-                program.statements.append(stmt)
+                statements.append(stmt)
 
-            self.next_token()
+            next_token()
         return program
 
     def parse_statement(self):
         """Parse statements with clear error reporting"""
-        try:
-            if self.cur_token_is(LET):
-                return self.parse_let_statement()
-            elif self.cur_token_is(RETURN):
-                return self.parse_return_statement()
-            elif self.cur_token_is(PRINT):
-                return self.parse_print_statement()
-            elif self.cur_token_is(FOR):
-                return self.parse_for_each_statement()
-            elif self.cur_token_is(ACTION):
-                return self.parse_action_statement()
-            elif self.cur_token_is(ASYNC):
-                # support "async action name ..." or "action async name ..."
-                # If "async action ..." then consume ASYNC and expect ACTION next
-                self.next_token()
-                if self.cur_token_is(ACTION):
-                    return self.parse_action_statement(async_flag=True)
-                # otherwise error
-                self.errors.append(f"Line {self.cur_token.line}: Expected 'action' after 'async'")
-                return None
-            elif self.cur_token_is(EVENT):
-                return self.parse_event_declaration()
-            elif self.cur_token_is(EMIT):
-                return self.parse_emit_statement()
-            elif self.cur_token_is(ENUM):
-                return self.parse_enum_declaration()
-            elif self.cur_token_is(PROTOCOL):
-                return self.parse_protocol_declaration()
-            elif self.cur_token_is(IMPORT):
-                return self.parse_import_statement()
-            else:
-                return self.parse_expression_statement()
-        except Exception as e:
-            self.errors.append(f"Line {self.cur_token.line}: Parse error - {str(e)}")
-            return None
+        fn = self.stmt_parse_fns.get(self.types[self.i], self.parse_expression_statement)
+        return fn()
+
+    def parse_async_statement(self):
+        # support "async action name ..." or "action async name ..."
+        # If "async action ..." then consume ASYNC and expect ACTION next
+        self.next_token()
+        if self.cur_token_is(ACTION):
+            return self.parse_action_statement(async_flag=True)
+        # otherwise error
+        self.errors.append(f"Line {self.lines[self.i]}: Expected 'action' after 'async'")
+        return None
 
     def parse_let_statement(self):
         """Fixed: Properly handles object literals"""
-        if not self.expect_peek(IDENT):
-            self.errors.append(f"Line {self.cur_token.line}: Expected variable name after 'let'")
+        types = self.types
+        if types[self.i + 1] != IDENT:
+            self._expect_fail(IDENT)
+            self.errors.append(f"Line {self.lines[self.i]}: Expected variable name after 'let'")
             return None
-            
-        name = Identifier(self.cur_token.literal)
-        
-        if not self.expect_peek(ASSIGN):
+        self.i += 1
+
+        name = Identifier(self.literals[self.i])
+
+        if types[self.i + 1] != ASSIGN:
+            self._expect_fail(ASSIGN)
             return None
-            
+        self.i += 1
+
         self.next_token()
         value = self.parse_expression(LOWEST)
         
-        return LetStatement(name=name, value=value)
+        return LetStatement(name, value)
 
     def parse_map_literal(self):
         """FIXED: Proper map literal parsing - this was the core issue!"""
-        pairs = []
+        keys = []
+        values = []
 
         # Must be called when current token is LBRACE
         if not self.cur_token_is(LBRACE):
-            self.errors.append(f"Line {getattr(self.cur_token, 'line', 'unknown')}: parse_map_literal called on non-brace token")
+            self.errors.append(f"Line {self.lines[self.i]}: parse_map_literal called on non-brace token")
             return None
 
         # Move inside the braces
@@ -154,111 +187,144 @@ class ProductionParser:
 
         # Handle empty object case: {}
         if self.cur_token_is(RBRACE):
-            return MapLiteral(pairs)
+            return MapLiteral(keys, values)
 
         # Parse key-value pairs
-        while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
+        types = self.types
+        literals = self.literals
+        parse_expression = self.parse_expression
+        keys_append = keys.append
+        values_append = values.append
+        while types[self.i] != RBRACE and types[self.i] != EOF:
             # Parse key (can be string or identifier)
-            if self.cur_token_is(STRING):
-                key = StringLiteral(self.cur_token.literal)
-            elif self.cur_token_is(IDENT):
-                key = Identifier(self.cur_token.literal)
+            key_type = types[self.i]
+            if key_type == STRING:
+                key = StringLiteral(literals[self.i])
+            elif key_type == IDENT:
+                key = Identifier(literals[self.i])
             else:
-                self.errors.append(f"Line {getattr(self.cur_token, 'line', 'unknown')}: Object key must be string or identifier")
+                self.errors.append(f"Line {self.lines[self.i]}: Object key must be string or identifier")
                 return None
 
-            # Expect colon (current peek should be COLON)
-            if not self.expect_peek(COLON):
+            # Expect colon (current peek should be COLON), then step past it
+            # onto the value token
+            if types[self.i + 1] != COLON:
+                self._expect_fail(COLON)
                 return None
+            self.i += 2
 
-            # Move to value token and parse it
-            self.next_token()
-            value = self.parse_expression(LOWEST)
+            value = parse_expression(LOWEST)
             if value is None:
                 return None
 
-            pairs.append((key, value))
+            keys_append(key)
+            values_append(value)
 
             # Accept comma OR semicolon as separators; tolerate trailing separators
-            if self.peek_token_is(COMMA) or self.peek_token_is(SEMICOLON):
-                self.next_token()  # move to separator
-                # advance to next token after separator (or closing brace)
-                if self.peek_token_is(RBRACE):
-                    self.next_token()  # move to RBRACE and break next loop iteration
+            peek_type = types[self.i + 1]
+            if peek_type == COMMA or peek_type == SEMICOLON:
+                # Step over the separator onto the next key or closing brace
+                self.i += 2
+                if types[self.i] == RBRACE:
                     break
-                self.next_token()
-                continue
-
-            # If closing brace is the next token, consume it and finish
-            if self.peek_token_is(RBRACE):
-                self.next_token()  # advance to RBRACE
+            elif peek_type == RBRACE:
+                self.i += 1
                 break
-
-            # Otherwise, try to advance; tolerant parsing
-            self.next_token()
+            else:
+                # Otherwise, try to advance; tolerant parsing
+                self.next_token()
 
         # Final check: should be at a RBRACE token
         if not self.cur_token_is(RBRACE):
-            self.errors.append(f"Line {getattr(self.cur_token, 'line', 'unknown')}: Expected '}}' to close object literal")
+            self.errors.append(f"Line {self.lines[self.i]}: Expected '}}' to close object literal")
             return None
 
         # Note: we keep the closing brace consumed (caller behavior consistent)
-        return MapLiteral(pairs)
+        return MapLiteral(keys, values)
 
     # Rest of parser methods (simplified for production)
     def parse_expression(self, precedence):
-        if self.cur_token.type not in self.prefix_parse_fns:
-            self.errors.append(f"Line {self.cur_token.line}: Unexpected token '{self.cur_token.literal}'")
-            return None
-
-        prefix = self.prefix_parse_fns[self.cur_token.type]
-        left_exp = prefix()
-
-        if left_exp is None:
-            return None
-
-        while (not self.peek_token_is(SEMICOLON) and 
-               not self.peek_token_is(EOF) and 
-               precedence <= self.peek_precedence()):
-
-            if self.peek_token.type not in self.infix_parse_fns:
-                return left_exp
-
-            infix = self.infix_parse_fns[self.peek_token.type]
-            self.next_token()
-            left_exp = infix(left_exp)
+        types = self.types
+        prefix_fns = self.prefix_parse_fns
+        infix_table = self.infix_table
+        # Binary operators still waiting for their right operand, each with
+        # the precedence of the level it interrupted
+        pending = []
+        while True:
+            prefix = prefix_fns.get(types[self.i])
+            if prefix is None:
+                self.errors.append(f"Line {self.lines[self.i]}: Unexpected token '{self.literals[self.i]}'")
+                left_exp = None
+            else:
+                left_exp = prefix()
+
+            while True:
+                if left_exp is None:
+                    # A failed operand leaves the operator waiting on it with
+                    # right=None, and parsing carries on at its level
+                    if not pending:
+                        return None
+                    left_exp, precedence = pending.pop()
+                    continue
 
-            if left_exp is None:
-                return None
+                # SEMICOLON and EOF have no infix entry, so they end a level
+                entry = infix_table.get(types[self.i + 1])
+                if entry is None or precedence > entry[0]:
+                    if not pending:
+                        return left_exp
+                    expression, precedence = pending.pop()
+                    expression.right = left_exp
+                    left_exp = expression
+                    continue
 
-        return left_exp
+                # peek is not EOF here, so the cursor can step without clamping
+                self.i += 1
+                infix = entry[1]
+                if infix is None:
+                    pending.append((InfixExpression(left_exp, self.literals[self.i], None), precedence))
+                    precedence = entry[0]
+                    self.i += 1
+                    break
+                left_exp = infix(left_exp)
 
     def parse_identifier(self):
-        return Identifier(value=self.cur_token.literal)
+        name = self.literals[self.i]
+        node = self._ident_cache.get(name)
+        if node is None:
+            node = self._ident_cache[name] = Identifier(name)
+        return node
 
     def parse_integer_literal(self):
-        try:
-            return IntegerLiteral(value=int(self.cur_token.literal))
-        except ValueError:
-            self.errors.append(f"Line {self.cur_token.line}: Could not parse {self.cur_token.literal} as integer")
-            return None
+        literal = self.literals[self.i]
+        node = self._int_cache.get(literal)
+        if node is None:
+            try:
+                node = self._int_cache[literal] = IntegerLiteral(int(literal))
+            except ValueError:
+                self.errors.append(f"Line {self.lines[self.i]}: Could not parse {literal} as integer")
+                return None
+        return node
 
     def parse_float_literal(self):
-        try:
-            return FloatLiteral(value=float(self.cur_token.literal))
-        except ValueError:
-            self.errors.append(f"Line {self.cur_token.line}: Could not parse {self.cur_token.literal} as float")
-            return None
+        literal = self.literals[self.i]
+        node = self._float_cache.get(literal)
+        if node is None:
+            try:
+                node = self._float_cache[literal] = FloatLiteral(float(literal))
+            except ValueError:
+                self.errors.append(f"Line {self.lines[self.i]}: Could not parse {literal} as float")
+                return None
+        return node
 
     def parse_string_literal(self):
-        return StringLiteral(value=self.cur_token.literal)
+        return StringLiteral(self.literals[self.i])
 
     def parse_boolean(self):
-        return Boolean(value=self.cur_token_is(TRUE))
+        return _TRUE if self.types[self.i] == TRUE else _FALSE
 
     def parse_list_literal(self):
         elements = self.parse_expression_list(RBRACKET)
-        return ListLiteral(elements=elements)
+        return ListLiteral(elements)
 
     def parse_grouped_expression(self):
         self.next_token()
@@ -268,28 +334,29 @@ class ProductionParser:
         return exp
 
     def parse_prefix_expression(self):
-        expression = PrefixExpression(operator=self.cur_token.literal, right=None)
+        expression = PrefixExpression(self.literals[self.i], None)
         self.next_token()
         expression.right = self.parse_expression(PREFIX)
         return expression
 
     def parse_infix_expression(self, left):
-        expression = InfixExpression(left=left, operator=self.cur_token.literal, right=None)
-        precedence = self.cur_precedence()
+        expression = InfixExpression(left, self.literals[self.i], None)
+        # Only reached on an operator token, which always has a precedence
+        precedence = precedences[self.types[self.i]]
         self.next_token()
         expression.right = self.parse_expression(precedence)
         return expression
 
     def parse_call_expression(self, function):
         arguments = self.parse_expression_list(RPAREN)
-        return CallExpression(function=function, arguments=arguments)
+        return CallExpression(function, arguments)
 
     def parse_assignment_expression(self, left):
-        if not isinstance(left, Identifier):
-            self.errors.append(f"Line {self.cur_token.line}: Cannot assign to {type(left).__name__}")
+        if type(left) is not Identifier:
+            self.errors.append(f"Line {self.lines[self.i]}: Cannot assign to {type(left).__name__}")
             return None
 
-        expression = AssignmentExpression(name=left, value=None)
+        expression = AssignmentExpression(left, None)
         self.next_token()
         expression.value = self.parse_expression(LOWEST)
         return expression
@@ -298,14 +365,14 @@ class ProductionParser:
         if not self.expect_peek(IDENT):
             return None
 
-        method = Identifier(self.cur_token.literal)
+        method = Identifier(self.literals[self.i])
 
         if self.peek_token_is(LPAREN):
             self.next_token()
             arguments = self.parse_expression_list(RPAREN)
-            return MethodCallExpression(object=left, method=method, arguments=arguments)
+            return MethodCallExpression(left, method, arguments)
         else:
-            return PropertyAccessExpression(object=left, property=method)
+            return PropertyAccessExpression(left, method)
 
     def parse_expression_list(self, end):
         elements = []
@@ -313,13 +380,16 @@ class ProductionParser:
             self.next_token()
             return elements
 
-        self.next_token()
-        elements.append(self.parse_expression(LOWEST))
+        types = self.types
+        parse_expression = self.parse_expression
+        next_token = self.next_token
+        next_token()
+        elements.append(parse_expression(LOWEST))
 
-        while self.peek_token_is(COMMA):
-            self.next_token()
-            self.next_token()
-            elements.append(self.parse_expression(LOWEST))
+        while types[self.i + 1] == COMMA:
+            next_token()
+            next_token()
+            elements.append(parse_expression(LOWEST))
 
         if not self.expect_peek(end):
             return elements
@@ -329,19 +399,19 @@ class ProductionParser:
     # Statement parsing methods
     def parse_expression_statement(self):
         """Parse expression as a statement"""
-        stmt = ExpressionStatement(expression=self.parse_expression(LOWEST))
+        stmt = ExpressionStatement(self.parse_expression(LOWEST))
         if self.peek_token_is(SEMICOLON):
             self.next_token()
         return stmt
 
     def parse_return_statement(self):
-        stmt = ReturnStatement(return_value=None)
+        stmt = ReturnStatement(None)
         self.next_token()
         stmt.return_value = self.parse_expression(LOWEST)
         return stmt
 
     def parse_print_statement(self):
-        stmt = PrintStatement(value=None)
+        stmt = PrintStatement(None)
         self.next_token()
         stmt.value = self.parse_expression(LOWEST)
         return stmt
@@ -371,35 +441,42 @@ class ProductionParser:
             self.next_token()
             alternative = self.parse_block()
 
-        return IfStatement(condition=condition, consequence=consequence, alternative=alternative)
+        return IfStatement(condition, consequence, alternative)
 
     def parse_block(self):
         block = BlockStatement()
 
         # Handle different block styles
         if self.cur_token_is(LBRACE):
-            self.next_token()  # Skip {
-
-            while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
-                # Skip stray semicolons between statements inside a block
-                if self.cur_token_is(SEMICOLON):
-                    self.next_token()
-                    continue
-
-                stmt = self.parse_statement()
-                if stmt:
-                    block.statements.append(stmt)
-
-                # After parsing a statement, consume any trailing semicolons so they don't become unexpected tokens
-                while self.peek_token_is(SEMICOLON):
-                    self.next_token()  # move to semicolon
-                    self.next_token()  # move past semicolon
-
-                # Advance to next token if parser hasn't advanced to EOF or closing brace
-                if not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
-                    self.next_token()
-
-            if self.cur_token_is(EOF):
+            types = self.types
+            statements = block.statements
+            parse_statement = self.parse_statement
+            # Nothing in this loop moves onto the final EOF, so the cursor is
+            # stepped directly; semicolon runs go through the slow helper.
+            self.i += 1  # Skip {
+
+            t = types[self.i]
+            while t != RBRACE and t != EOF:
+                if t == SEMICOLON:
+                    # Skip stray semicolons between statements inside a block
+                    self.i += 1
+                else:
+                    stmt = parse_statement()
+                    if stmt:
+                        statements.append(stmt)
+
+                    # After parsing a statement, consume any trailing semicolons so they don't become unexpected tokens
+                    if types[self.i + 1] == SEMICOLON:
+                        self._skip_trailing_semicolons()
+
+                    # Advance to next token if parser hasn't advanced to EOF or closing brace
+                    t = types[self.i]
+                    if t == RBRACE or t == EOF:
+                        break
+                    self.i += 1
+                t = types[self.i]
+
+            if types[self.i] == EOF:
                 self.errors.append("Unclosed block (reached EOF)")
         else:
             # Single statement block
@@ -412,24 +489,36 @@ class ProductionParser:
 
         return block
 
+    def _skip_trailing_semicolons(self):
+        types = self.types
+        while types[self.i + 1] == SEMICOLON:
+            self.i += 2  # move to the semicolon, then past it
+
     def parse_for_each_statement(self):
-        if not self.expect_peek(EACH):
+        types = self.types
+        if types[self.i + 1] != EACH:
+            self._expect_fail(EACH)
             return None
-            
-        if not self.expect_peek(IDENT):
+        self.i += 1
+
+        if types[self.i + 1] != IDENT:
+            self._expect_fail(IDENT)
             return None
-            
-        item = Identifier(self.cur_token.literal)
-        
-        if not self.expect_peek(IN):
+        self.i += 1
+
+        item = Identifier(self.literals[self.i])
+
+        if types[self.i + 1] != IN:
+            self._expect_fail(IN)
             return None
-            
+        self.i += 1
+
         self.next_token()
         iterable = self.parse_expression(LOWEST)
         
         body = self.parse_block()
         
-        return ForEachStatement(item=item, iterable=iterable, body=body)
+        return ForEachStatement(item, iterable, body)
 
     def parse_action_statement(self, async_flag=False):
         """Parse action declaration; supports optional async modifier (action async name(...) { ... } or async action ...)"""
@@ -437,7 +526,7 @@ class ProductionParser:
         is_async = async_flag
 
         # Handle optional 'async' immediately after 'action': action async name ...
-        if self.peek_token_is(IDENT) and self.peek_token.literal == "async":
+        if self.peek_token_is(IDENT) and self.literals[self.i + 1] == "async":
             # unusual: peek is IDENT with literal "async" — but lexer maps "async" to ASYNC token;
             pass
 
@@ -449,7 +538,7 @@ class ProductionParser:
         # Continue normal action parse
         if not self.expect_peek(IDENT):
             return None
-        name = Identifier(self.cur_token.literal)
+        name = Identifier(self.literals[self.i])
 
         parameters = []
         if self.peek_token_is(LPAREN):
@@ -458,7 +547,7 @@ class ProductionParser:
 
         body = self.parse_block()
         # Create ActionStatement with is_async flag (add attribute)
-        stmt = ActionStatement(name=name, parameters=parameters, body=body)
+        stmt = ActionStatement(name, parameters, body)
         # attach async flag if supported by AST
         setattr(stmt, "is_async", is_async)
         return stmt
@@ -474,7 +563,7 @@ class ProductionParser:
         body = self.parse_expression(LOWEST)
         # If action literal is used as an expression, callers may expect a function-like node.
         # Mark the ActionLiteral node to indicate expression-level function (helps lowering).
-        action_lit = ActionLiteral(parameters=parameters, body=body)
+        action_lit = ActionLiteral(parameters, body)
         setattr(action_lit, "is_expression", True)
         return action_lit
 
@@ -482,30 +571,39 @@ class ProductionParser:
         # current token is AWAIT
         self.next_token()
         value = self.parse_expression(LOWEST)
-        return AwaitExpression(expression=value)
+        return AwaitExpression(value)
 
     def parse_if_expression(self):
         """Parse if expression: if (condition) { consequence } else { alternative }"""
-        expression = IfExpression(condition=None, consequence=None, alternative=None)
+        expression = IfExpression(None, None, None)
+        types = self.types
 
-        if not self.expect_peek(LPAREN):
+        if types[self.i + 1] != LPAREN:
+            self._expect_fail(LPAREN)
             return None
+        self.i += 1
 
         self.next_token()
         expression.condition = self.parse_expression(LOWEST)
 
-        if not self.expect_peek(RPAREN):
+        if types[self.i + 1] != RPAREN:
+            self._expect_fail(RPAREN)
             return None
+        self.i += 1
 
-        if not self.expect_peek(LBRACE):
+        if types[self.i + 1] != LBRACE:
+            self._expect_fail(LBRACE)
             return None
+        self.i += 1
 
         expression.consequence = self.parse_block()
 
-        if self.peek_token_is(ELSE):
-            self.next_token()
-            if not self.expect_peek(LBRACE):
+        if types[self.i + 1] == ELSE:
+            self.i += 1
+            if types[self.i + 1] != LBRACE:
+                self._expect_fail(LBRACE)
                 return None
+            self.i += 1
             expression.alternative = self.parse_block()
 
         return expression
@@ -517,35 +615,31 @@ class ProductionParser:
 
         self.next_token()
         code_lines = []
-        
+        types = self.types
+
         # Read until closing brace
-        while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
-            code_lines.append(self.cur_token.literal)
+        while types[self.i] != RBRACE and types[self.i] != EOF:
+            code_lines.append(self.literals[self.i])
             self.next_token()
-        
-        if not self.cur_token_is(RBRACE):
+
+        if types[self.i] != RBRACE:
             self.errors.append("Expected } after embedded code block")
             return None
-        
+
         self.next_token()  # Skip closing brace
-        
-        code_content = ' '.join(code_lines)
-        lines = code_content.strip().split('\n')
-        
-        if not lines:
-            self.errors.append("Empty embedded code block")
-            return None
-        
+
+        if not code_lines:
+            return _EMPTY_EMBEDDED
+
         # First line is language, rest is code
-        language_line = lines[0].strip() if lines else "unknown"
-        language = language_line if language_line else "unknown"
-        code = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
-        
-        return EmbeddedLiteral(language=language, code=code)
+        lines = ' '.join(code_lines).strip().split('\n')
+        language = lines[0].strip() or "unknown"
+        code = '\n'.join(lines[1:]).strip()
+
+        return EmbeddedLiteral(language, code)
 
     def parse_lambda_expression(self):
         """Parse lambda/arrow function: x => body or lambda(x): body"""
-        token = self.cur_token
         parameters = []
 
         self.next_token()
@@ -557,7 +651,7 @@ class ProductionParser:
                 return None
         elif self.cur_token_is(IDENT):
             # Single parameter without parens
-            parameters = [Identifier(self.cur_token.literal)]
+            parameters = [Identifier(self.literals[self.i])]
             self.next_token()
 
         # Handle arrow or colon separator
@@ -570,7 +664,7 @@ class ProductionParser:
             self.next_token()  # Skip >
 
         body = self.parse_expression(LOWEST)
-        return LambdaExpression(parameters=parameters, body=body)
+        return LambdaExpression(parameters, body)
 
     def parse_action_literal(self):
         """Parse action literal: action (params) { body } or action (params) => expr"""
@@ -594,7 +688,7 @@ class ProductionParser:
             # Expression body (shorthand)
             body = self.parse_expression(LOWEST)
         
-        action_lit = ActionLiteral(parameters=parameters, body=body)
+        action_lit = ActionLiteral(parameters, body)
         return action_lit
 
     def parse_parameter_list(self):
@@ -606,7 +700,7 @@ class ProductionParser:
         
         while not self.cur_token_is(RPAREN) and not self.cur_token_is(EOF):
             if self.cur_token_is(IDENT):
-                parameters.append(Identifier(self.cur_token.literal))
+                parameters.append(Identifier(self.literals[self.i]))
                 self.next_token()
             else:
                 break
@@ -624,14 +718,14 @@ class ProductionParser:
     def parse_event_declaration(self):
         if not self.expect_peek(IDENT):
             return None
-        name = Identifier(self.cur_token.literal)
+        name = Identifier(self.literals[self.i])
         body = self.parse_block()
-        return EventDeclaration(name=name, properties=body)
+        return EventDeclaration(name, body)
 
     def parse_emit_statement(self):
         if not self.expect_peek(IDENT):
             return None
-        name = Identifier(self.cur_token.literal)
+        name = Identifier(self.literals[self.i])
         payload = None
         if self.peek_token_is(LPAREN):
             self.next_token()
@@ -642,12 +736,12 @@ class ProductionParser:
         elif self.peek_token_is(LBRACE):
             self.next_token()
             payload = self.parse_block()
-        return EmitStatement(name=name, payload=payload)
+        return EmitStatement(name, payload)
 
     def parse_enum_declaration(self):
         if not self.expect_peek(IDENT):
             return None
-        name = Identifier(self.cur_token.literal)
+        name = Identifier(self.literals[self.i])
         if not self.expect_peek(LBRACE):
             return None
         # parse simple comma-separated identifiers or key:value pairs
@@ -655,14 +749,14 @@ class ProductionParser:
         self.next_token()
         while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
             if self.cur_token_is(IDENT) or self.cur_token_is(STRING):
-                key = self.cur_token.literal
+                key = self.literals[self.i]
                 # optional colon value
                 val = None
                 if self.peek_token_is(COLON):
                     self.next_token()
                     self.next_token()
                     if self.cur_token_is(INT):
-                        val = int(self.cur_token.literal)
+                        val = int(self.literals[self.i])
                 members[key] = val
             if self.peek_token_is(COMMA):
                 self.next_token()
@@ -672,12 +766,12 @@ class ProductionParser:
         if not self.cur_token_is(RBRACE):
             self.errors.append("Unclosed enum declaration")
             return None
-        return EnumDeclaration(name=name, members=members)
+        return EnumDeclaration(name, members)
 
     def parse_protocol_declaration(self):
         if not self.expect_peek(IDENT):
             return None
-        name = Identifier(self.cur_token.literal)
+        name = Identifier(self.literals[self.i])
         if not self.expect_peek(LBRACE):
             return None
         # parse simple list of method signatures (as identifiers)
@@ -685,7 +779,7 @@ class ProductionParser:
         self.next_token()
         while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
             if self.cur_token_is(IDENT):
-                spec["methods"].append(self.cur_token.literal)
+                spec["methods"].append(self.literals[self.i])
             if self.peek_token_is(COMMA):
                 self.next_token()
                 self.next_token()
@@ -694,43 +788,58 @@ class ProductionParser:
         if not self.cur_token_is(RBRACE):
             self.errors.append("Unclosed protocol declaration")
             return None
-        return ProtocolDeclaration(name=name, spec=spec)
+        return ProtocolDeclaration(name, spec)
 
     def parse_import_statement(self):
         if not self.expect_peek(STRING):
             return None
-        module_path = self.cur_token.literal
+        module_path = self.literals[self.i]
         alias = None
-        if self.peek_token_is(IDENT) and self.peek_token.literal == "as":
+        if self.peek_token_is(IDENT) and self.literals[self.i + 1] == "as":
             self.next_token()
             self.next_token()
             if self.cur_token_is(IDENT):
-                alias = self.cur_token.literal
-        return ImportStatement(module_path=module_path, alias=alias)
+                alias = self.literals[self.i]
+        return ImportStatement(module_path, alias)
 
     # Token utilities
+    @property
+    def cur_token(self):
+        i = self.i
+        return Token(self.types[i], self.literals[i], self.lines[i])
+
+    @property
+    def peek_token(self):
+        i = self.i + 1
+        return Token(self.types[i], self.literals[i], self.lines[i])
+
     def next_token(self):
-        self.cur_token = self.peek_token
-        self.peek_token = self.lexer.next_token()
+        # Stay on the final EOF once reached, like a drained lexer would
+        if self.i < self._last:
+            self.i += 1
 
     def cur_token_is(self, t):
-        return self.cur_token.type == t
+        return self.types[self.i] == t
 
     def peek_token_is(self, t):
-        return self.peek_token.type == t
+        return self.types[self.i + 1] == t
 
     def expect_peek(self, t):
-        if self.peek_token_is(t):
+        if self.types[self.i + 1] == t:
             self.next_token()
             return True
-        self.errors.append(f"Line {self.cur_token.line}: Expected '{t}', got '{self.peek_token.type}'")
+        self._expect_fail(t)
         return False
 
+    def _expect_fail(self, t):
+        # Cold path kept out of expect_peek and its inlined call sites
+        self.errors.append(f"Line {self.lines[self.i]}: Expected '{t}', got '{self.types[self.i + 1]}'")
+
     def peek_precedence(self):
-        return precedences.get(self.peek_token.type, LOWEST)
+        return precedences.get(self.types[self.i + 1], LOWEST)
 
     def cur_precedence(self):
-        return precedences.get(self.cur_token.type, LOWEST)
+        return precedences.get(self.types[self.i], LOWEST)
 
 # --- Compatibility alias ----------------------------------------------------
 # Provide the common name `Parser` for code that imports the compiler parser
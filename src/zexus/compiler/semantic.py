@@ -12,7 +12,7 @@ while you incrementally implement full semantic checks (name resolution, types).
 
 from typing import List, Dict, Any
 # Import compiler AST node classes we need to inspect
-from .zexus_ast import Program, ActionStatement, AwaitExpression, ProtocolDeclaration, EventDeclaration, MapLiteral, BlockStatement
+from .zexus_ast import Node, Program, ActionStatement, AwaitExpression, ProtocolDeclaration, EventDeclaration, MapLiteral, BlockStatement
 
 class SemanticAnalyzer:
 	def __init__(self):
@@ -92,11 +92,13 @@ class SemanticAnalyzer:
 					if attr.startswith("_") or attr in ("token_literal", "__repr__"):
 						continue
 					val = getattr(node, attr)
+					# Only descend into AST nodes; plain values such as ints
+					# expose themselves through attributes like .denominator
 					if isinstance(val, list):
 						for item in val:
-							if hasattr(item, "__class__"):
+							if isinstance(item, Node):
 								walk(item, in_async=in_async)
-					elif hasattr(val, "__class__"):
+					elif isinstance(val, Node):
 						walk(val, in_async=in_async)
 
 			# Walk top-level statements
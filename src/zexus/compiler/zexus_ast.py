@@ -3,20 +3,24 @@ Clean AST Definitions for Compiler Phase
 """
 
 # Base classes
-class Node: 
+class Node:
+    __slots__ = ()
+
     def token_literal(self):
         return ""
 
     def __repr__(self):
         return f"{self.__class__.__name__}()"
 
-class Statement(Node): 
-    pass
+class Statement(Node):
+    __slots__ = ()
 
-class Expression(Node): 
-    pass
+class Expression(Node):
+    __slots__ = ()
 
 class Program(Node):
+    __slots__ = ('statements',)
+
     def __init__(self):
         self.statements = []
 
@@ -30,6 +34,8 @@ class Program(Node):
 
 # Statement Nodes
 class LetStatement(Statement):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -41,6 +47,8 @@ class LetStatement(Statement):
         return f"LetStatement({self.name})"
 
 class ReturnStatement(Statement):
+    __slots__ = ('return_value',)
+
     def __init__(self, return_value):
         self.return_value = return_value
 
@@ -51,6 +59,8 @@ class ReturnStatement(Statement):
         return f"ReturnStatement({self.return_value})"
 
 class ExpressionStatement(Statement):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -61,6 +71,8 @@ class ExpressionStatement(Statement):
         return f"ExpressionStatement({self.expression})"
 
 class BlockStatement(Statement):
+    __slots__ = ('statements',)
+
     def __init__(self):
         self.statements = []
 
@@ -73,6 +85,8 @@ class BlockStatement(Statement):
         return f"BlockStatement({len(self.statements)} statements)"
 
 class PrintStatement(Statement):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -83,6 +97,8 @@ class PrintStatement(Statement):
         return f"PrintStatement({self.value})"
 
 class IfStatement(Statement):
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self, condition, consequence, alternative=None):
         self.condition = condition
         self.consequence = consequence
@@ -95,6 +111,8 @@ class IfStatement(Statement):
         return f"IfStatement(condition={self.condition})"
 
 class WhileStatement(Statement):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -106,6 +124,8 @@ class WhileStatement(Statement):
         return f"WhileStatement(condition={self.condition})"
 
 class ForEachStatement(Statement):
+    __slots__ = ('item', 'iterable', 'body')
+
     def __init__(self, item, iterable, body):
         self.item = item
         self.iterable = iterable
@@ -118,6 +138,8 @@ class ForEachStatement(Statement):
         return f"ForEachStatement(item={self.item}, iterable={self.iterable})"
 
 class ActionStatement(Statement):
+    __slots__ = ('name', 'parameters', 'body', 'is_async')
+
     def __init__(self, name, parameters, body):
         self.name = name
         self.parameters = parameters
@@ -130,6 +152,8 @@ class ActionStatement(Statement):
         return f"ActionStatement({self.name}, {len(self.parameters)} params)"
 
 class UseStatement(Statement):
+    __slots__ = ('file_path', 'alias')
+
     def __init__(self, file_path, alias=None):
         self.file_path = file_path
         self.alias = alias
@@ -142,6 +166,8 @@ class UseStatement(Statement):
 
 # NEW: Compiler-side Screen/Component/Theme nodes
 class ScreenStatement(Statement):
+    __slots__ = ('name', 'body')
+
     def __init__(self, name, body):
         self.name = name
         self.body = body
@@ -153,6 +179,8 @@ class ScreenStatement(Statement):
         return f"ScreenStatement({self.name})"
 
 class ComponentStatement(Statement):
+    __slots__ = ('name', 'properties')
+
     def __init__(self, name, properties):
         self.name = name
         self.properties = properties
@@ -164,6 +192,8 @@ class ComponentStatement(Statement):
         return f"ComponentStatement({self.name})"
 
 class ThemeStatement(Statement):
+    __slots__ = ('name', 'properties')
+
     def __init__(self, name, properties):
         self.name = name
         self.properties = properties
@@ -176,6 +206,8 @@ class ThemeStatement(Statement):
 
 # NEW: TryCatchStatement for compiler AST (matches interpreter node)
 class TryCatchStatement(Statement):
+    __slots__ = ('try_block', 'error_variable', 'catch_block')
+
     def __init__(self, try_block, error_variable, catch_block):
         self.try_block = try_block
         self.error_variable = error_variable
@@ -189,6 +221,8 @@ class TryCatchStatement(Statement):
 
 # NEW: ExternalDeclaration for compiler AST (matches interpreter node)
 class ExternalDeclaration(Statement):
+    __slots__ = ('name', 'parameters', 'module_path')
+
     def __init__(self, name, parameters, module_path):
         self.name = name
         self.parameters = parameters or []
@@ -202,6 +236,8 @@ class ExternalDeclaration(Statement):
 
 # Expression Nodes
 class Identifier(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -212,6 +248,8 @@ class Identifier(Expression):
         return f"Identifier('{self.value}')"
 
 class IntegerLiteral(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -222,6 +260,8 @@ class IntegerLiteral(Expression):
         return f"IntegerLiteral({self.value})"
 
 class FloatLiteral(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -232,6 +272,8 @@ class FloatLiteral(Expression):
         return f"FloatLiteral({self.value})"
 
 class StringLiteral(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -242,6 +284,8 @@ class StringLiteral(Expression):
         return f"StringLiteral('{self.value}')"
 
 class Boolean(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -252,6 +296,8 @@ class Boolean(Expression):
         return f"Boolean({self.value})"
 
 class ListLiteral(Expression):
+    __slots__ = ('elements',)
+
     def __init__(self, elements):
         self.elements = elements
 
@@ -262,16 +308,26 @@ class ListLiteral(Expression):
         return f"ListLiteral({len(self.elements)} elements)"
 
 class MapLiteral(Expression):
-    def __init__(self, pairs):
-        self.pairs = pairs
+    __slots__ = ('keys', 'values')
+
+    # Keys and values are kept in parallel lists rather than as (key, value) tuples
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    @property
+    def pairs(self):
+        return list(zip(self.keys, self.values))
 
     def token_literal(self):
         return "{"
 
     def __repr__(self):
-        return f"MapLiteral({len(self.pairs)} pairs)"
+        return f"MapLiteral({len(self.keys)} pairs)"
 
 class PrefixExpression(Expression):
+    __slots__ = ('operator', 'right')
+
     def __init__(self, operator, right):
         self.operator = operator
         self.right = right
@@ -283,6 +339,8 @@ class PrefixExpression(Expression):
         return f"PrefixExpression('{self.operator}', {self.right})"
 
 class InfixExpression(Expression):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -295,6 +353,8 @@ class InfixExpression(Expression):
         return f"InfixExpression({self.left}, '{self.operator}', {self.right})"
 
 class CallExpression(Expression):
+    __slots__ = ('function', 'arguments')
+
     def __init__(self, function, arguments):
         self.function = function
         self.arguments = arguments
@@ -306,6 +366,8 @@ class CallExpression(Expression):
         return f"CallExpression({self.function}, {len(self.arguments)} args)"
 
 class AssignmentExpression(Expression):
+    __slots__ = ('name', 'value')
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -317,6 +379,8 @@ class AssignmentExpression(Expression):
         return f"AssignmentExpression({self.name}, {self.value})"
 
 class MethodCallExpression(Expression):
+    __slots__ = ('object', 'method', 'arguments')
+
     def __init__(self, object, method, arguments):
         self.object = object
         self.method = method
@@ -329,6 +393,8 @@ class MethodCallExpression(Expression):
         return f"MethodCallExpression({self.object}.{self.method})"
 
 class PropertyAccessExpression(Expression):
+    __slots__ = ('object', 'property')
+
     def __init__(self, object, property):
         self.object = object
         self.property = property
@@ -340,6 +406,8 @@ class PropertyAccessExpression(Expression):
         return f"PropertyAccessExpression({self.object}.{self.property})"
 
 class LambdaExpression(Expression):
+    __slots__ = ('parameters', 'body')
+
     def __init__(self, parameters, body):
         self.parameters = parameters
         self.body = body
@@ -351,6 +419,8 @@ class LambdaExpression(Expression):
         return f"LambdaExpression({len(self.parameters)} params)"
 
 class ActionLiteral(Expression):
+    __slots__ = ('parameters', 'body', 'is_expression')
+
     def __init__(self, parameters, body):
         self.parameters = parameters
         self.body = body
@@ -362,6 +432,8 @@ class ActionLiteral(Expression):
         return f"ActionLiteral({len(self.parameters)} params)"
 
 class IfExpression(Expression):
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self, condition, consequence, alternative=None):
         self.condition = condition
         self.consequence = consequence
@@ -374,6 +446,8 @@ class IfExpression(Expression):
         return f"IfExpression(condition={self.condition})"
 
 class EmbeddedLiteral(Expression):
+    __slots__ = ('language', 'code')
+
     def __init__(self, language, code):
         self.language = language
         self.code = code
@@ -386,6 +460,8 @@ class EmbeddedLiteral(Expression):
 
 # NEW: AwaitExpression (used in compiler AST)
 class AwaitExpression(Expression):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
 
@@ -397,6 +473,8 @@ class AwaitExpression(Expression):
 
 # NEW: EventDeclaration / EmitStatement
 class EventDeclaration(Statement):
+    __slots__ = ('name', 'properties')
+
     def __init__(self, name, properties):
         self.name = name
         self.properties = properties
@@ -408,6 +486,8 @@ class EventDeclaration(Statement):
         return f"EventDeclaration({self.name})"
 
 class EmitStatement(Statement):
+    __slots__ = ('name', 'payload')
+
     def __init__(self, name, payload=None):
         self.name = name
         self.payload = payload
@@ -420,6 +500,8 @@ class EmitStatement(Statement):
 
 # NEW: EnumDeclaration and ProtocolDeclaration
 class EnumDeclaration(Statement):
+    __slots__ = ('name', 'members')
+
     def __init__(self, name, members):
         self.name = name
         self.members = members
@@ -431,6 +513,8 @@ class EnumDeclaration(Statement):
         return f"EnumDeclaration({self.name})"
 
 class ProtocolDeclaration(Statement):
+    __slots__ = ('name', 'spec')
+
     def __init__(self, name, spec):
         self.name = name
         self.spec = spec
@@ -443,6 +527,8 @@ class ProtocolDeclaration(Statement):
 
 # NEW: ImportStatement (explicit import syntax)
 class ImportStatement(Statement):
+    __slots__ = ('module_path', 'alias')
+
     def __init__(self, module_path, alias=None):
         self.module_path = module_path
         self.alias = alias
@@ -7,7 +7,6 @@ Exports a `config` singleton with convenient helpers.
 import os
 import json
 from pathlib import Path
-from datetime import datetime, timezone
 
 DEFAULT_CONFIG = {
     "debug": {
@@ -32,10 +31,13 @@ DEFAULT_RUNTIME = {
     'fallback_to_interpreter': True,
     'compiler_line_threshold': 100,
     'enable_execution_stats': False,
+    'enable_jit': False,
 }
 
 
 class Config:
+    __slots__ = ('config_dir', 'config_file', '_data', '_debug_level')
+
     def __init__(self):
         self.config_dir = Path.home() / ".zexus"
         self.config_file = self.config_dir / "config.json"
@@ -47,6 +49,10 @@ class Config:
         for k, v in DEFAULT_RUNTIME.items():
             self._data['runtime'].setdefault(k, v)
 
+        # should_log() runs on every evaluator debug_log() call, so the level
+        # is mirrored here instead of being looked up in _data each time
+        self._debug_level = self._data.get('debug', {}).get('level', 'none')
+
     def _ensure_loaded(self):
         try:
             self.config_dir.mkdir(mode=0o700, exist_ok=True)
@@ -72,6 +78,8 @@ class Config:
         return result
 
     def _write(self):
+        # datetime is only needed when settings change, not at every import
+        from datetime import datetime, timezone
         try:
             self.config_dir.mkdir(mode=0o700, exist_ok=True)
             self._data['debug']['last_updated'] = datetime.now(timezone.utc).isoformat()
@@ -84,7 +92,7 @@ class Config:
     # Public API
     @property
     def debug_level(self):
-        return self._data.get('debug', {}).get('level', 'none')
+        return self._debug_level
 
     @debug_level.setter
     def debug_level(self, value):
@@ -92,6 +100,7 @@ class Config:
             raise ValueError('Invalid debug level')
         self._data.setdefault('debug', {})['level'] = value
         self._data['debug']['enabled'] = (value != 'none')
+        self._debug_level = value
         self._write()
 
     def enable_debug(self, level='full'):
@@ -182,12 +191,21 @@ class Config:
         self._data.setdefault('runtime', {})['enable_execution_stats'] = bool(value)
         self._write()
 
+    @property
+    def enable_jit(self):
+        return bool(self._data.get('runtime', {}).get('enable_jit', False))
+
+    @enable_jit.setter
+    def enable_jit(self, value):
+        self._data.setdefault('runtime', {})['enable_jit'] = bool(value)
+        self._write()
+
     # Helper logging function used by modules
     def should_log(self, level='debug'):
         """Decide whether to emit a log of a particular level.
         Levels: 'debug' (very verbose), 'info' (useful info), 'warn', 'error'
         """
-        dl = self.debug_level
+        dl = self._debug_level
         if dl == 'full':
             return True
         if dl == 'minimal':
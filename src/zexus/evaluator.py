@@ -6,7 +6,7 @@ import os
 import asyncio
 from . import zexus_ast
 from .zexus_ast import (
-    Program, ExpressionStatement, BlockStatement, ReturnStatement, LetStatement,
+    Program, ExpressionStatement, BlockStatement, SingleStatementBlock, ReturnStatement, LetStatement,
     ActionStatement, IfStatement, WhileStatement, ForEachStatement, MethodCallExpression,
     EmbeddedLiteral, PrintStatement, ScreenStatement, EmbeddedCodeStatement, UseStatement,
     ExactlyStatement, TryCatchStatement, IntegerLiteral, StringLiteral, ListLiteral, MapLiteral, Identifier,
@@ -34,14 +34,20 @@ EvaluationError = ObjectEvaluationError
 def is_error(obj):
     return isinstance(obj, (EvaluationError, ObjectEvaluationError))
 
-# Summary counters for lightweight, 5-line summary logging when debug is off
-EVAL_SUMMARY = {
-    'parsed_statements': 0,
-    'evaluated_statements': 0,
-    'errors': 0,
-    'async_tasks_run': 0,
-    'max_statements_in_block': 0
-}
+# Summary counters for lightweight, 5-line summary logging when debug is off.
+# Bumped once per evaluated statement, so they live in slots rather than a dict.
+class EvalSummary:
+    __slots__ = ('parsed_statements', 'evaluated_statements', 'errors',
+                 'async_tasks_run', 'max_statements_in_block')
+
+    def __init__(self):
+        self.parsed_statements = 0
+        self.evaluated_statements = 0
+        self.errors = 0
+        self.async_tasks_run = 0
+        self.max_statements_in_block = 0
+
+EVAL_SUMMARY = EvalSummary()
 
 def _is_awaitable(obj):
     try:
@@ -55,7 +61,7 @@ def _resolve_awaitable(obj):
     """
     if _is_awaitable(obj):
         try:
-            EVAL_SUMMARY['async_tasks_run'] += 1
+            EVAL_SUMMARY.async_tasks_run += 1
             return asyncio.run(obj)
         except RuntimeError:
             # Already running event loop (e.g., invoked from async VM). Return as-is.
@@ -86,7 +92,7 @@ def debug_log(message, data=None, level='debug'):
 def eval_program(statements, env):
     debug_log("eval_program", f"Processing {len(statements)} statements")
     try:
-        EVAL_SUMMARY['parsed_statements'] = max(EVAL_SUMMARY.get('parsed_statements', 0), len(statements))
+        EVAL_SUMMARY.parsed_statements = max(EVAL_SUMMARY.parsed_statements, len(statements))
     except Exception:
         pass
 
@@ -95,14 +101,14 @@ def eval_program(statements, env):
         debug_log(f"  Statement {i+1}", type(stmt).__name__)
         res = eval_node(stmt, env)
         res = _resolve_awaitable(res)
-        EVAL_SUMMARY['evaluated_statements'] += 1
+        EVAL_SUMMARY.evaluated_statements += 1
         if isinstance(res, ReturnValue):
             debug_log("  ReturnValue encountered", res.value)
             return res.value
         if is_error(res):
             debug_log("  Error encountered", res)
             try:
-                EVAL_SUMMARY['errors'] += 1
+                EVAL_SUMMARY.errors += 1
             except Exception:
                 pass
             return res
@@ -132,7 +138,7 @@ def eval_assignment_expression(node, env):
 def eval_block_statement(block, env):
     debug_log("eval_block_statement", f"Processing {len(block.statements)} statements in block")
     try:
-        EVAL_SUMMARY['max_statements_in_block'] = max(EVAL_SUMMARY.get('max_statements_in_block', 0), len(block.statements))
+        EVAL_SUMMARY.max_statements_in_block = max(EVAL_SUMMARY.max_statements_in_block, len(block.statements))
     except Exception:
         pass
 
@@ -140,12 +146,12 @@ def eval_block_statement(block, env):
     for stmt in block.statements:
         res = eval_node(stmt, env)
         res = _resolve_awaitable(res)
-        EVAL_SUMMARY['evaluated_statements'] += 1
+        EVAL_SUMMARY.evaluated_statements += 1
         if isinstance(res, (ReturnValue, EvaluationError, ObjectEvaluationError)):
             debug_log("  Block interrupted", res)
             if is_error(res):
                 try:
-                    EVAL_SUMMARY['errors'] += 1
+                    EVAL_SUMMARY.errors += 1
                 except Exception:
                     pass
             return res
@@ -163,12 +169,12 @@ def eval_expressions(expressions, env):
         if is_error(res):
             debug_log("  Expression evaluation interrupted", res)
             try:
-                EVAL_SUMMARY['errors'] += 1
+                EVAL_SUMMARY.errors += 1
             except Exception:
                 pass
             return res
         results.append(res)
-        EVAL_SUMMARY['evaluated_statements'] += 1
+        EVAL_SUMMARY.evaluated_statements += 1
         debug_log(f"  Expression {i+1} result", res)
     debug_log("  All expressions evaluated", results)
     return results
@@ -1180,7 +1186,7 @@ def eval_node(node, env, stack_trace=None):
             debug_log("  ExpressionStatement node")
             return eval_node(node.expression, env, stack_trace)
 
-        elif node_type == BlockStatement:
+        elif node_type == BlockStatement or node_type == SingleStatementBlock:
             debug_log("  BlockStatement node", f"{len(node.statements)} statements")
             return eval_block_statement(node, env)
 
@@ -1621,9 +1627,9 @@ def eval_node(node, env, stack_trace=None):
             return List(elements)
 
         elif node_type == MapLiteral:
-            debug_log("  MapLiteral node", f"{len(node.pairs)} pairs")
+            debug_log("  MapLiteral node", f"{len(node.keys)} pairs")
             pairs = {}
-            for key_expr, value_expr in node.pairs:
+            for key_expr, value_expr in zip(node.keys, node.values):
                 key = eval_node(key_expr, env, stack_trace)
                 # FIXED: use is_error helper
                 if is_error(key):
@@ -2026,11 +2032,11 @@ def evaluate(program, env, debug_mode=False):
     # When debug mode is off, print a concise 5-line summary only
     if not debug_mode:
         try:
-            print(f"Summary: statements parsed={EVAL_SUMMARY.get('parsed_statements',0)}")
-            print(f"Summary: statements evaluated={EVAL_SUMMARY.get('evaluated_statements',0)}")
-            print(f"Summary: errors={EVAL_SUMMARY.get('errors',0)}")
-            print(f"Summary: async_tasks_run={EVAL_SUMMARY.get('async_tasks_run',0)}")
-            print(f"Summary: max_statements_in_block={EVAL_SUMMARY.get('max_statements_in_block',0)}")
+            print(f"Summary: statements parsed={EVAL_SUMMARY.parsed_statements}")
+            print(f"Summary: statements evaluated={EVAL_SUMMARY.evaluated_statements}")
+            print(f"Summary: errors={EVAL_SUMMARY.errors}")
+            print(f"Summary: async_tasks_run={EVAL_SUMMARY.async_tasks_run}")
+            print(f"Summary: max_statements_in_block={EVAL_SUMMARY.max_statements_in_block}")
         except Exception:
             # If summary printing fails, ignore and continue
             pass
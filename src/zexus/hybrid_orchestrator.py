@@ -5,6 +5,7 @@ Hybrid Orchestrator - Intelligently chooses between interpreter and compiler
 
 import os
 import time
+from collections import OrderedDict
 from .lexer import Lexer
 from .parser import UltimateParser
 from .evaluator import eval_node, Environment
@@ -18,11 +19,20 @@ try:
 except ImportError:
     COMPILER_AVAILABLE = False
 
+# Parsed programs kept per orchestrator; least recently used evicted past this
+_PROGRAM_CACHE_SIZE = 64
+
 class HybridOrchestrator:
     def __init__(self):
         self.interpreter_used = 0
         self.compiler_used = 0
         self.fallbacks = 0
+        # Lexer/parser pair reused across interpret() calls (one REPL line each)
+        self._lexer = None
+        self._parser = None
+        # (syntax_style, advanced parsing, source) -> Program for sources that
+        # parsed without errors; the evaluator never mutates the AST
+        self._programs = OrderedDict()
         
     def should_use_compiler(self, code, syntax_style="auto"):
         """
@@ -94,12 +104,33 @@ class HybridOrchestrator:
         """
         Execute code using the interpreter path
         """
-        lexer = Lexer(code)
-        parser = UltimateParser(lexer, syntax_style)
-        program = parser.parse_program()
-        
-        if len(parser.errors) > 0:
-            raise Exception(f"Parse errors: {parser.errors}")
+        style = syntax_style or config.syntax_style
+        parser = self._parser
+        # Drop the parser when the style or advanced-parsing setting changed since it was built
+        if parser is not None and (parser.syntax_style != style
+                or parser.enable_advanced_strategies != config.enable_advanced_parsing):
+            parser = self._parser = None
+
+        key = (style, config.enable_advanced_parsing, code)
+        program = self._programs.get(key)
+        if program is not None:
+            self._programs.move_to_end(key)
+        else:
+            if parser is None:
+                self._lexer = Lexer(code)
+                parser = self._parser = UltimateParser(self._lexer, syntax_style)
+            else:
+                self._lexer.reset(code)
+                parser.reset(self._lexer)
+            program = parser.parse_program()
+
+            if len(parser.errors) > 0:
+                raise Exception(f"Parse errors: {parser.errors}")
+
+            # stored under the settings the parser actually ran with
+            self._programs[(parser.syntax_style, parser.enable_advanced_strategies, code)] = program
+            if len(self._programs) > _PROGRAM_CACHE_SIZE:
+                self._programs.popitem(last=False)
         
         if environment is None:
             environment = Environment()
@@ -16,6 +16,18 @@ class Lexer:
         self._next_paren_has_lambda = False
         self.read_char()
 
+    def reset(self, source_code):
+        """Re-initialize this lexer in place to scan a new source string."""
+        self.input = source_code
+        self.position = 0
+        self.read_position = 0
+        self.ch = ""
+        self.in_embedded_block = False
+        self.line = 1
+        self.column = 1
+        self._next_paren_has_lambda = False
+        self.read_char()
+
     def read_char(self):
         if self.read_position >= len(self.input):
             self.ch = ""
@@ -39,117 +51,79 @@ class Lexer:
             return self.input[self.read_position]
 
     def next_token(self):
+        return self.fill_token(Token(EOF, ""))
+
+    def fill_token(self, tok):
+        """Scan the next token into `tok` in place and return it.
+
+        Lets the parser recycle its cur/peek Token objects instead of
+        allocating a fresh Token per call; next_token() wraps this with a new
+        Token for callers that keep tokens around.
+        """
         self.skip_whitespace()
 
         # CRITICAL FIX: Skip single line comments (both # and // styles)
         if self.ch == '#' and self.peek_char() != '{':
             self.skip_comment()
-            return self.next_token()
+            return self.fill_token(tok)
         
         # NEW: Handle // style comments
         if self.ch == '/' and self.peek_char() == '/':
             self.skip_double_slash_comment()
-            return self.next_token()
+            return self.fill_token(tok)
 
-        tok = None
-        current_line = self.line
-        current_column = self.column
+        tok.line = self.line
+        tok.column = self.column
+        ch = self.ch
 
-        if self.ch == '=':
+        if ch == '=':
             # Equality '=='
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(EQ, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = EQ, ch + self.ch
             # Arrow '=>' (treat as lambda shorthand)
             elif self.peek_char() == '>':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(LAMBDA, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = LAMBDA, ch + self.ch
             else:
-                tok = Token(ASSIGN, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '!':
+                token_type, literal = ASSIGN, ch
+        elif ch == '!':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(NOT_EQ, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = NOT_EQ, ch + self.ch
             else:
-                tok = Token(BANG, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '&':
+                token_type, literal = BANG, ch
+        elif ch == '&':
             if self.peek_char() == '&':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(AND, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = AND, ch + self.ch
             else:
-                tok = Token(ILLEGAL, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '|':
+                token_type, literal = ILLEGAL, ch
+        elif ch == '|':
             if self.peek_char() == '|':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(OR, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = OR, ch + self.ch
             else:
-                tok = Token(ILLEGAL, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '<':
+                token_type, literal = ILLEGAL, ch
+        elif ch == '<':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(LTE, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = LTE, ch + self.ch
             else:
-                tok = Token(LT, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '>':
+                token_type, literal = LT, ch
+        elif ch == '>':
             if self.peek_char() == '=':
-                ch = self.ch
                 self.read_char()
-                literal = ch + self.ch
-                tok = Token(GTE, literal)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = GTE, ch + self.ch
             else:
-                tok = Token(GT, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '"':
-            string_literal = self.read_string()
-            tok = Token(STRING, string_literal)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '[':
-            tok = Token(LBRACKET, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == ']':
-            tok = Token(RBRACKET, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '(':
+                token_type, literal = GT, ch
+        elif ch == '"':
+            token_type, literal = STRING, self.read_string()
+        elif ch == '[':
+            token_type, literal = LBRACKET, ch
+        elif ch == ']':
+            token_type, literal = RBRACKET, ch
+        elif ch == '(':
             # Quick char-level scan: detect if this '(' pairs with a ')' that
             # is followed by '=>' (arrow). If so, set a hint flag so parser
             # can treat the parentheses as a lambda-parameter list.
@@ -177,75 +151,42 @@ class Lexer:
             except Exception:
                 self._next_paren_has_lambda = False
 
-            tok = Token(LPAREN, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == ')':
-            tok = Token(RPAREN, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '{':
+            token_type, literal = LPAREN, ch
+        elif ch == ')':
+            token_type, literal = RPAREN, ch
+        elif ch == '{':
             # Check if this might be start of embedded block
             lookback = self.input[max(0, self.position-10):self.position]
             if 'embedded' in lookback:
                 self.in_embedded_block = True
-            tok = Token(LBRACE, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '}':
+            token_type, literal = LBRACE, ch
+        elif ch == '}':
             if self.in_embedded_block:
                 self.in_embedded_block = False
-            tok = Token(RBRACE, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == ',':
-            tok = Token(COMMA, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == ';':
-            tok = Token(SEMICOLON, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == ':':
-            tok = Token(COLON, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '+':
-            tok = Token(PLUS, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '-':
-            tok = Token(MINUS, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '*':
-            tok = Token(STAR, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '/':
-            # Check if this is division or comment
-            if self.peek_char() == '/':
-                # It's a // comment, handle above
-                self.skip_double_slash_comment()
-                return self.next_token()
-            else:
-                tok = Token(SLASH, self.ch)
-                tok.line = current_line
-                tok.column = current_column
-        elif self.ch == '%':
-            tok = Token(MOD, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == '.':
-            tok = Token(DOT, self.ch)
-            tok.line = current_line
-            tok.column = current_column
-        elif self.ch == "":
-            tok = Token(EOF, "")
-            tok.line = current_line
-            tok.column = current_column
+            token_type, literal = RBRACE, ch
+        elif ch == ',':
+            token_type, literal = COMMA, ch
+        elif ch == ';':
+            token_type, literal = SEMICOLON, ch
+        elif ch == ':':
+            token_type, literal = COLON, ch
+        elif ch == '+':
+            token_type, literal = PLUS, ch
+        elif ch == '-':
+            token_type, literal = MINUS, ch
+        elif ch == '*':
+            token_type, literal = STAR, ch
+        elif ch == '/':
+            # '//' comments are consumed above, so this is always division
+            token_type, literal = SLASH, ch
+        elif ch == '%':
+            token_type, literal = MOD, ch
+        elif ch == '.':
+            token_type, literal = DOT, ch
+        elif ch == "":
+            token_type, literal = EOF, ""
         else:
-            if self.is_letter(self.ch):
+            if self.is_letter(ch):
                 literal = self.read_identifier()
 
                 if self.in_embedded_block:
@@ -253,35 +194,28 @@ class Lexer:
                 else:
                     token_type = self.lookup_ident(literal)
 
-                tok = Token(token_type, literal)
-                tok.line = current_line
-                tok.column = current_column
+                tok.type = token_type
+                tok.literal = tok.value = literal
                 return tok
-            elif self.is_digit(self.ch):
-                num_literal = self.read_number()
-                if '.' in num_literal:
-                    tok = Token(FLOAT, num_literal)
-                else:
-                    tok = Token(INT, num_literal)
-                tok.line = current_line
-                tok.column = current_column
+            elif self.is_digit(ch):
+                literal = self.read_number()
+                tok.type = FLOAT if '.' in literal else INT
+                tok.literal = tok.value = literal
                 return tok
             else:
-                if self.ch in ['\n', '\r']:
+                if ch in ['\n', '\r']:
                     self.read_char()
-                    return self.next_token()
+                    return self.fill_token(tok)
                 # For embedded code, treat unknown printable chars as IDENT
-                if self.ch.isprintable():
-                    literal = self.read_embedded_char()
-                    tok = Token(IDENT, literal)
-                    tok.line = current_line
-                    tok.column = current_column
+                if ch.isprintable():
+                    tok.type = IDENT
+                    tok.literal = tok.value = self.read_embedded_char()
                     return tok
-                tok = Token(ILLEGAL, self.ch)
-                tok.line = current_line
-                tok.column = current_column
+                token_type, literal = ILLEGAL, ch
 
         self.read_char()
+        tok.type = token_type
+        tok.literal = tok.value = literal
         return tok
 
     def read_embedded_char(self):
@@ -401,4 +335,49 @@ class Lexer:
 
     def skip_whitespace(self):
         while self.ch in [' ', '\t', '\n', '\r']:
-            self.read_char()
\ No newline at end of file
+            self.read_char()
+
+class TokenStream:
+    """Replays tokens already scanned by a Lexer through the same interface.
+
+    Lets a caller lex a source once and hand the result to the parser
+    (which also asks for the full token list in advanced mode) without the
+    source being scanned again. The lexer's `position` and lambda-paren hint
+    are recorded per token; UltimateParser reads them from `_positions` and
+    `_lambda_hints`, and fill_token() replays them for streaming callers.
+    """
+
+    def __init__(self, lexer):
+        self.input = lexer.input
+        self.tokens = []
+        self._positions = []
+        self._lambda_hints = {}
+        while True:
+            tok = lexer.next_token()
+            if tok.type == LPAREN:
+                self._lambda_hints[len(self.tokens)] = lexer._next_paren_has_lambda
+            self.tokens.append(tok)
+            self._positions.append(lexer.position)
+            if tok.type == EOF:
+                break
+        self.index = 0
+        self.position = 0
+        self._next_paren_has_lambda = False
+
+    def next_token(self):
+        return self.fill_token(Token(EOF, ""))
+
+    def fill_token(self, tok):
+        """Copy the next recorded token into `tok`; EOF repeats at the end"""
+        i = self.index
+        if i < len(self.tokens) - 1:
+            self.index = i + 1
+        src = self.tokens[i]
+        tok.type = src.type
+        tok.literal = tok.value = src.literal
+        tok.line = src.line
+        tok.column = src.column
+        self.position = self._positions[i]
+        if i in self._lambda_hints:
+            self._next_paren_has_lambda = self._lambda_hints[i]
+        return tok
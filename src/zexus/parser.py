@@ -1,6 +1,8 @@
 ## src/zexus/parser.py
+import sys
+
 from .zexus_token import *
-from .lexer import Lexer
+from .lexer import Lexer, TokenStream
 from .zexus_ast import *
 from .strategy_structural import StructuralAnalyzer
 from .strategy_context import ContextStackParser
@@ -21,6 +23,30 @@ precedences = {
     ASSIGN: ASSIGN_PREC,
 }
 
+# Tokens that can begin a statement; error recovery stops in front of these
+STATEMENT_START_TOKENS = frozenset({
+    LET, RETURN, PRINT, FOR, SCREEN, ACTION, IF, WHILE, USE, EXACTLY,
+    EXPORT, DEBUG, TRY, EXTERNAL,
+})
+
+# Leaf nodes are never mutated after parsing, so every `true`/`false` and
+# every small integer literal in a program can share one node
+_TRUE = Boolean(True)
+_FALSE = Boolean(False)
+_SMALL_INTS = tuple(IntegerLiteral(i) for i in range(257))
+
+# A single-token operand followed by one of these is a whole expression
+_LEAF_TYPES = frozenset({IDENT, INT, FLOAT, STRING, TRUE, FALSE})
+_EXPRESSION_END = frozenset({COMMA, RPAREN, RBRACKET, RBRACE, SEMICOLON, EOF})
+
+# Bracket pairs matched up front by _load_tokens
+_OPENERS = frozenset({LPAREN, LBRACE, LBRACKET})
+_CLOSERS = frozenset({RPAREN, RBRACE, RBRACKET})
+
+# Floor for the interpreter recursion limit while parsing; prefix/grouped
+# expressions and nested blocks still recurse per nesting level.
+MIN_RECURSION_LIMIT = 10000
+
 class UltimateParser:
     def __init__(self, lexer, syntax_style=None, enable_advanced_strategies=None):
         self.lexer = lexer
@@ -31,8 +57,9 @@ class UltimateParser:
             else config.enable_advanced_parsing
         )
         self.errors = []
-        self.cur_token = None
-        self.peek_token = None
+        # One Identifier node per distinct name used in an expression; kept
+        # across reset() so a REPL session reuses its nodes
+        self._ident_cache = {}
 
         # Multi-strategy architecture
         if self.enable_advanced_strategies:
@@ -85,8 +112,89 @@ class UltimateParser:
             LPAREN: self.parse_call_expression,
             DOT: self.parse_method_call_expression,
         }
-        self.next_token()
-        self.next_token()
+        # Statement keyword -> parse method; anything else is an expression
+        self.stmt_parse_fns = {
+            LET: self.parse_let_statement,
+            RETURN: self.parse_return_statement,
+            PRINT: self.parse_print_statement,
+            FOR: self.parse_for_each_statement,
+            SCREEN: self.parse_screen_statement,
+            ACTION: self.parse_action_statement,
+            IF: self.parse_if_statement,
+            WHILE: self.parse_while_statement,
+            USE: self.parse_use_statement,
+            EXACTLY: self.parse_exactly_statement,
+            EXPORT: self.parse_export_statement,
+            DEBUG: self.parse_debug_statement,
+            TRY: self.parse_try_catch_statement,
+            EXTERNAL: self.parse_external_declaration,
+            ENTITY: self.parse_entity_statement,
+            VERIFY: self.parse_verify_statement,
+            CONTRACT: self.parse_contract_statement,
+            PROTECT: self.parse_protect_statement,
+            SEAL: self.parse_seal_statement,
+        }
+        # Infix token -> (precedence, handler), so parse_expression decides
+        # whether and how to extend an operand with one probe. Plain binary
+        # operators get a None handler: they are reduced on parse_expression's
+        # explicit stack instead of recursing. Tokens without an entry
+        # (SEMICOLON, EOF, ...) end the expression.
+        binary = self.parse_infix_expression
+        self.infix_table = {
+            t: (precedences.get(t, LOWEST), None if fn == binary else fn)
+            for t, fn in self.infix_parse_fns.items()
+        }
+        self._load_tokens(lexer)
+
+    def reset(self, lexer):
+        """Reuse this parser for a new lexer without rebuilding the parse tables.
+
+        Clears per-parse state (errors, block map, context stack) and lexes
+        `lexer` into a fresh token list.
+        """
+        self.lexer = lexer
+        self.errors.clear()
+        if self.enable_advanced_strategies:
+            self.block_map = {}
+            self.context_parser.current_context[:] = ['global']
+            # A failed advanced parse switches to traditional for that parse only
+            self.use_advanced_parsing = True
+        self._load_tokens(lexer)
+
+    def _load_tokens(self, lexer):
+        """Lex the whole input up front and put the cursor on its first token.
+
+        The parser walks `self.tokens` with an integer cursor; cur_token and
+        peek_token are tokens[pos] and tokens[pos + 1]. A TokenStream is read
+        as-is, a plain Lexer is drained through one, which also records the
+        source position and '(' lambda hint the lexer had after each token.
+        """
+        stream = lexer if isinstance(lexer, TokenStream) else TokenStream(lexer)
+        tokens = stream.tokens
+        # A second EOF keeps the peek slot valid while sitting on the first
+        self.tokens = tokens + [tokens[-1]]
+        self._token_positions = stream._positions + [stream._positions[-1]]
+        self._lambda_hints = stream._lambda_hints
+        self._source = stream.input
+        self._last = len(tokens) - 1
+        # '(' hints at or before this index have been consumed
+        self._hints_cleared_upto = -1
+        self.pos = min(stream.index, self._last)
+        self.cur_token = self.tokens[self.pos]
+        self.peek_token = self.tokens[self.pos + 1]
+
+        # _match[i] is the index of the bracket paired with tokens[i], or -1
+        match = [-1] * len(self.tokens)
+        stack = []
+        for i, tok in enumerate(tokens):
+            tt = tok.type
+            if tt in _OPENERS:
+                stack.append(i)
+            elif tt in _CLOSERS and stack:
+                j = stack.pop()
+                match[i] = j
+                match[j] = i
+        self._match = match
 
     def _log(self, message, level="normal"):
         """Controlled logging based on config"""
@@ -99,6 +207,9 @@ class UltimateParser:
 
     def parse_program(self):
         """The tolerant parsing pipeline - FIXED"""
+        if sys.getrecursionlimit() < MIN_RECURSION_LIMIT:
+            sys.setrecursionlimit(MIN_RECURSION_LIMIT)
+
         if not self.use_advanced_parsing:
             return self._parse_traditional()
 
@@ -131,9 +242,13 @@ class UltimateParser:
     def parse_map_literal(self):
         """FIXED: Proper map literal parsing"""
         token = self.cur_token  # Current token is LBRACE
-        pairs = []
+        keys = []
+        values = []
+        keys_append = keys.append
+        values_append = values.append
 
-        self._log(f"🔧 Parsing map literal at line {getattr(token, 'line', 'unknown')}", "verbose")
+        if config.enable_debug_logs:
+            self._log(f"🔧 Parsing map literal at line {token.line}", "verbose")
 
         # Skip the opening brace (current token)
         self.next_token()
@@ -141,7 +256,7 @@ class UltimateParser:
         # Handle empty map: {}
         if self.cur_token_is(RBRACE):
             self.next_token()  # Skip }
-            return MapLiteral(pairs=pairs)
+            return MapLiteral(keys, values)
 
         # Parse key-value pairs
         while not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
@@ -151,7 +266,7 @@ class UltimateParser:
             elif self.cur_token_is(IDENT):
                 key = Identifier(self.cur_token.literal)
             else:
-                self.errors.append(f"Line {getattr(self.cur_token, 'line', 'unknown')}: Object key must be string or identifier, got {getattr(self.cur_token, 'type', 'UNKNOWN')}")
+                self.errors.append(f"Line {self.cur_token.line}: Object key must be string or identifier, got {self.cur_token.type}")
                 return None
 
             # Expect colon
@@ -164,7 +279,8 @@ class UltimateParser:
             if value is None:
                 return None
 
-            pairs.append((key, value))
+            keys_append(key)
+            values_append(value)
 
             # If there's a comma, consume it and advance to next key/value
             if self.peek_token_is(COMMA):
@@ -182,41 +298,19 @@ class UltimateParser:
 
         # Final check: ensure we ended on a closing brace (tolerant)
         if not self.cur_token_is(RBRACE):
-            self.errors.append(f"Line {getattr(self.cur_token, 'line', 'unknown')}: Expected '}}'")
+            self.errors.append(f"Line {self.cur_token.line}: Expected '}}'")
             return None
 
         # Move past closing brace
         self.next_token()
 
-        self._log(f"✅ Successfully parsed map literal with {len(pairs)} pairs", "verbose")
-        return MapLiteral(pairs=pairs)
+        if config.enable_debug_logs:
+            self._log(f"✅ Successfully parsed map literal with {len(keys)} pairs", "verbose")
+        return MapLiteral(keys, values)
 
     def _collect_all_tokens(self):
         """Collect all tokens for structural analysis"""
-        tokens = []
-        original_position = self.lexer.position
-        original_cur = self.cur_token
-        original_peek = self.peek_token
-
-        # Reset lexer to beginning
-        self.lexer.position = 0
-        self.lexer.read_position = 0
-        self.lexer.ch = ''
-        self.lexer.read_char()
-
-        # Collect all tokens
-        while True:
-            token = self.lexer.next_token()
-            tokens.append(token)
-            if token.type == EOF:
-                break
-
-        # Restore parser state
-        self.lexer.position = original_position
-        self.cur_token = original_cur
-        self.peek_token = original_peek
-
-        return tokens
+        return self.tokens[:self._last + 1]
 
     def _parse_all_blocks_tolerantly(self, all_tokens):
         """Parse ALL blocks without aggressive filtering - MAXIMUM TOLERANCE"""
@@ -273,67 +367,37 @@ class UltimateParser:
     def _parse_traditional(self):
         """Traditional recursive descent parsing (fallback)"""
         program = Program()
-        while not self.cur_token_is(EOF):
-            stmt = self.parse_statement()
+        append = program.statements.append
+        parse_statement = self.parse_statement
+        next_token = self.next_token
+        while self.cur_token.type != EOF:
+            try:
+                stmt = parse_statement()
+            except Exception as e:
+                # TOLERANT: Don't stop execution for parse errors, just log and continue
+                error_msg = f"Line {self.cur_token.line}:{self.cur_token.column} - Parse error: {str(e)}"
+                self.errors.append(error_msg)
+                self._log(f"⚠️  {error_msg}", "normal")
+
+                # Try to recover and continue
+                self.recover_to_next_statement()
+                stmt = None
             if stmt is not None:
-                program.statements.append(stmt)
-            self.next_token()
+                append(stmt)
+            next_token()
         return program
 
     # === TOLERANT PARSER METHODS ===
 
     def parse_statement(self):
-        """Parse statement with maximum tolerance"""
-        try:
-            if self.cur_token_is(LET):
-                return self.parse_let_statement()
-            elif self.cur_token_is(RETURN):
-                return self.parse_return_statement()
-            elif self.cur_token_is(PRINT):
-                return self.parse_print_statement()
-            elif self.cur_token_is(FOR):
-                return self.parse_for_each_statement()
-            elif self.cur_token_is(SCREEN):
-                return self.parse_screen_statement()
-            elif self.cur_token_is(ACTION):
-                return self.parse_action_statement()
-            elif self.cur_token_is(IF):
-                return self.parse_if_statement()
-            elif self.cur_token_is(WHILE):
-                return self.parse_while_statement()
-            elif self.cur_token_is(USE):
-                return self.parse_use_statement()
-            elif self.cur_token_is(EXACTLY):
-                return self.parse_exactly_statement()
-            elif self.cur_token_is(EXPORT):
-                return self.parse_export_statement()
-            elif self.cur_token_is(DEBUG):
-                return self.parse_debug_statement()
-            elif self.cur_token_is(TRY):
-                return self.parse_try_catch_statement()
-            elif self.cur_token_is(EXTERNAL):
-                return self.parse_external_declaration()
-            elif self.cur_token_is(ENTITY):
-                return self.parse_entity_statement()
-            elif self.cur_token_is(VERIFY):
-                return self.parse_verify_statement()
-            elif self.cur_token_is(CONTRACT):
-                return self.parse_contract_statement()
-            elif self.cur_token_is(PROTECT):
-                return self.parse_protect_statement()
-            elif self.cur_token_is(SEAL):
-                return self.parse_seal_statement()
-            else:
-                return self.parse_expression_statement()
-        except Exception as e:
-            # TOLERANT: Don't stop execution for parse errors, just log and continue
-            error_msg = f"Line {self.cur_token.line}:{self.cur_token.column} - Parse error: {str(e)}"
-            self.errors.append(error_msg)
-            self._log(f"⚠️  {error_msg}", "normal")
+        """Parse statement with maximum tolerance
 
-            # Try to recover and continue
-            self.recover_to_next_statement()
-            return None
+        Unexpected exceptions propagate to the per-statement guard in
+        _parse_traditional; parse_* methods report ordinary syntax errors
+        through self.errors and return None.
+        """
+        fn = self.stmt_parse_fns.get(self.cur_token.type, self.parse_expression_statement)
+        return fn()
 
     def parse_block(self, block_type=""):
         """Unified block parser with maximum tolerance for both syntax styles"""
@@ -363,21 +427,27 @@ class UltimateParser:
     def parse_brace_block(self):
         """Parse { } block with tolerance for missing closing brace"""
         block = BlockStatement()
-        self.next_token()
+        append = block.statements.append
+        parse_statement = self.parse_statement
+        next_token = self.next_token
+        next_token()
 
         brace_count = 1
-        while brace_count > 0 and not self.cur_token_is(EOF):
-            if self.cur_token_is(LBRACE):
+        while brace_count > 0:
+            cur_type = self.cur_token.type
+            if cur_type == EOF:
+                break
+            if cur_type == LBRACE:
                 brace_count += 1
-            elif self.cur_token_is(RBRACE):
+            elif cur_type == RBRACE:
                 brace_count -= 1
                 if brace_count == 0:
                     break
 
-            stmt = self.parse_statement()
+            stmt = parse_statement()
             if stmt is not None:
-                block.statements.append(stmt)
-            self.next_token()
+                append(stmt)
+            next_token()
 
         # TOLERANT: Don't error if we hit EOF without closing brace
         if self.cur_token_is(EOF) and brace_count > 0:
@@ -387,13 +457,12 @@ class UltimateParser:
 
     def parse_single_statement_block(self):
         """Parse a single statement as a block"""
-        block = BlockStatement()
         # Don't consume the next token if it's the end of a structure
         if not self.cur_token_is(RBRACE) and not self.cur_token_is(EOF):
             stmt = self.parse_statement()
             if stmt:
-                block.statements.append(stmt)
-        return block
+                return SingleStatementBlock(stmt)
+        return BlockStatement()
 
     def parse_if_statement(self):
         """Tolerant if statement parser"""
@@ -424,7 +493,7 @@ class UltimateParser:
             self.next_token()
             alternative = self.parse_block("else")
 
-        return IfStatement(condition=condition, consequence=consequence, alternative=alternative)
+        return IfStatement(condition, consequence, alternative)
 
     def parse_action_statement(self):
         """Tolerant action parser supporting both syntax styles"""
@@ -452,17 +521,17 @@ class UltimateParser:
         if not body:
             return None
 
-        return ActionStatement(name=name, parameters=parameters, body=body)
+        return ActionStatement(name, parameters, body)
 
     def parse_let_statement(self):
         """Tolerant let statement parser"""
-        stmt = LetStatement(name=None, value=None)
+        stmt = LetStatement(None, None)
 
         if not self.expect_peek(IDENT):
             self.errors.append("Expected variable name after 'let'")
             return None
 
-        stmt.name = Identifier(value=self.cur_token.literal)
+        stmt.name = Identifier(self.cur_token.literal)
 
         # TOLERANT: Allow both = and : for assignment
         if self.peek_token_is(ASSIGN) or (self.peek_token_is(COLON) and self.peek_token.literal == ":"):
@@ -482,7 +551,7 @@ class UltimateParser:
 
     def parse_print_statement(self):
         """Tolerant print statement parser"""
-        stmt = PrintStatement(value=None)
+        stmt = PrintStatement(None)
         self.next_token()
         stmt.value = self.parse_expression(LOWEST)
 
@@ -525,11 +594,7 @@ class UltimateParser:
         if not catch_block:
             return None
 
-        return TryCatchStatement(
-            try_block=try_block,
-            error_variable=error_var,
-            catch_block=catch_block
-        )
+        return TryCatchStatement(try_block, error_var, catch_block)
 
     def parse_debug_statement(self):
         token = self.cur_token
@@ -550,7 +615,7 @@ class UltimateParser:
                 self.errors.append(f"Line {token.line}:{token.column} - Expected expression after 'debug'")
                 return None
 
-        return DebugStatement(value=value)
+        return DebugStatement(value)
 
     def parse_external_declaration(self):
         token = self.cur_token
@@ -584,19 +649,14 @@ class UltimateParser:
 
         module_path = self.cur_token.literal
 
-        return ExternalDeclaration(
-            name=name,
-            parameters=parameters,
-            module_path=module_path
-        )
+        return ExternalDeclaration(name, parameters, module_path)
 
     def recover_to_next_statement(self):
         """Tolerant error recovery"""
         while not self.cur_token_is(EOF):
             if self.cur_token_is(SEMICOLON):
                 return
-            next_keywords = [LET, RETURN, PRINT, FOR, ACTION, IF, WHILE, USE, EXPORT, DEBUG, TRY, EXTERNAL]
-            if any(self.peek_token_is(kw) for kw in next_keywords):
+            if self.peek_token.type in STATEMENT_START_TOKENS:
                 return
             self.next_token()
 
@@ -633,7 +693,7 @@ class UltimateParser:
             # Otherwise, continue — body parsing will attempt to parse the current token
 
         body = self.parse_expression(LOWEST)
-        return LambdaExpression(parameters=parameters, body=body)
+        return LambdaExpression(parameters, body)
 
     def parse_lambda_infix(self, left):
         """Parse arrow-style lambda when encountering leftside 'params' followed by =>
@@ -646,7 +706,7 @@ class UltimateParser:
         # Build parameter list from `left` expression
         params = []
         # Single identifier param
-        if isinstance(left, Identifier):
+        if left.NODE_KIND == K_IDENTIFIER:
             params = [left]
         else:
             # If left is a grouped expression returning a ListLiteral-like container
@@ -669,7 +729,7 @@ class UltimateParser:
             self.next_token()
 
         body = self.parse_expression(LOWEST)
-        return LambdaExpression(parameters=params, body=body)
+        return LambdaExpression(params, body)
 
     def _parse_parameter_list(self):
         parameters = []
@@ -691,11 +751,11 @@ class UltimateParser:
         return parameters
 
     def parse_assignment_expression(self, left):
-        if not isinstance(left, Identifier):
+        if left.NODE_KIND != K_IDENTIFIER:
             self.errors.append(f"Line {self.cur_token.line}:{self.cur_token.column} - Cannot assign to {type(left).__name__}, only identifiers allowed")
             return None
 
-        expression = AssignmentExpression(name=left, value=None)
+        expression = AssignmentExpression(left, None)
         self.next_token()
         expression.value = self.parse_expression(LOWEST)
         return expression
@@ -713,9 +773,9 @@ class UltimateParser:
         if self.peek_token_is(LPAREN):
             self.next_token()
             arguments = self.parse_expression_list(RPAREN)
-            return MethodCallExpression(object=left, method=method, arguments=arguments)
+            return MethodCallExpression(left, method, arguments)
         else:
-            return PropertyAccessExpression(object=left, property=method)
+            return PropertyAccessExpression(left, method)
 
     def parse_export_statement(self):
         token = self.cur_token
@@ -819,7 +879,7 @@ class UltimateParser:
             return None
 
         target = Identifier(self.cur_token.literal)
-        return SealStatement(target=target)
+        return SealStatement(target)
 
     def parse_embedded_literal(self):
         if not self.expect_peek(LBRACE):
@@ -838,10 +898,10 @@ class UltimateParser:
         language_line = lines[0].strip()
         language = language_line if language_line else "unknown"
         code = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
-        return EmbeddedLiteral(language=language, code=code)
+        return EmbeddedLiteral(language, code)
 
     def read_embedded_code_content(self):
-        start_position = self.lexer.position
+        start_position = self._token_positions[self.pos + 1]
         brace_count = 1
 
         while brace_count > 0 and not self.cur_token_is(EOF):
@@ -855,8 +915,8 @@ class UltimateParser:
             self.errors.append("Unclosed embedded code block")
             return None
 
-        end_position = self.lexer.position - len(self.cur_token.literal)
-        content = self.lexer.input[start_position:end_position].strip()
+        end_position = self._token_positions[self.pos + 1] - len(self.cur_token.literal)
+        content = self._source[start_position:end_position].strip()
         return content
 
     def parse_exactly_statement(self):
@@ -869,10 +929,10 @@ class UltimateParser:
             return None
 
         body = self.parse_block_statement()
-        return ExactlyStatement(name=name, body=body)
+        return ExactlyStatement(name, body)
 
     def parse_for_each_statement(self):
-        stmt = ForEachStatement(item=None, iterable=None, body=None)
+        stmt = ForEachStatement(None, None, None)
 
         if not self.expect_peek(EACH):
             self.errors.append("Expected 'each' after 'for' in for-each loop")
@@ -882,7 +942,7 @@ class UltimateParser:
             self.errors.append("Expected identifier after 'each' in for-each loop")
             return None
 
-        stmt.item = Identifier(value=self.cur_token.literal)
+        stmt.item = Identifier(self.cur_token.literal)
 
         if not self.expect_peek(IN):
             self.errors.append("Expected 'in' after item identifier in for-each loop")
@@ -909,7 +969,8 @@ class UltimateParser:
             self.errors.append("Expected parameter name")
             return None
 
-        params.append(Identifier(self.cur_token.literal))
+        append = params.append
+        append(Identifier(self.cur_token.literal))
 
         while self.peek_token_is(COMMA):
             self.next_token()
@@ -917,7 +978,7 @@ class UltimateParser:
             if not self.cur_token_is(IDENT):
                 self.errors.append("Expected parameter name after comma")
                 return None
-            params.append(Identifier(self.cur_token.literal))
+            append(Identifier(self.cur_token.literal))
 
         if not self.expect_peek(RPAREN):
             self.errors.append("Expected ')' after parameters")
@@ -936,13 +997,11 @@ class UltimateParser:
         if not self.expect_peek(COLON):
             return None
 
-        body = BlockStatement()
         self.next_token()
         stmt = self.parse_statement()
-        if stmt:
-            body.statements.append(stmt)
+        body = SingleStatementBlock(stmt) if stmt else BlockStatement()
 
-        return ActionLiteral(parameters=parameters, body=body)
+        return ActionLiteral(parameters, body)
 
     def parse_while_statement(self):
         if not self.expect_peek(LPAREN):
@@ -960,7 +1019,7 @@ class UltimateParser:
         if not body:
             return None
 
-        return WhileStatement(condition=condition, body=body)
+        return WhileStatement(condition, body)
 
     def parse_use_statement(self):
         """Enhanced use statement parser that handles multiple syntax styles"""
@@ -1034,12 +1093,12 @@ class UltimateParser:
         return UseStatement(file_path=file_path, alias=alias, is_named_import=False)
 
     def parse_screen_statement(self):
-        stmt = ScreenStatement(name=None, body=None)
+        stmt = ScreenStatement(None, None)
         if not self.expect_peek(IDENT):
             self.errors.append("Expected screen name after 'screen'")
             return None
 
-        stmt.name = Identifier(value=self.cur_token.literal)
+        stmt.name = Identifier(self.cur_token.literal)
 
         if not self.expect_peek(LBRACE):
             self.errors.append("Expected '{' after screen name")
@@ -1049,85 +1108,113 @@ class UltimateParser:
         return stmt
 
     def parse_return_statement(self):
-        stmt = ReturnStatement(return_value=None)
+        stmt = ReturnStatement(None)
         self.next_token()
         stmt.return_value = self.parse_expression(LOWEST)
         return stmt
 
     def parse_expression_statement(self):
-        stmt = ExpressionStatement(expression=self.parse_expression(LOWEST))
+        stmt = ExpressionStatement(self.parse_expression(LOWEST))
         if self.peek_token_is(SEMICOLON):
             self.next_token()
         return stmt
 
     def parse_expression(self, precedence):
-        if self.cur_token.type not in self.prefix_parse_fns:
-            self.errors.append(f"Line {self.cur_token.line}:{self.cur_token.column} - Unexpected token '{self.cur_token.literal}'")
-            return None
+        """Pratt expression parser with an explicit stack for binary operators.
 
-        prefix = self.prefix_parse_fns[self.cur_token.type]
-        left_exp = prefix()
+        Instead of recursing through parse_infix_expression for every binary
+        operator, each pending (left, operator, precedence) frame is pushed onto
+        `pending` and reduced once its right operand is complete. The produced
+        tree is identical to the recursive formulation.
+        """
+        # Fast path: a lone literal or name such as an argument or map value
+        cur_type = self.cur_token.type
+        if cur_type in _LEAF_TYPES and self.peek_token.type in _EXPRESSION_END:
+            return self.prefix_parse_fns[cur_type]()
 
-        if left_exp is None:
-            return None
+        infix_table = self.infix_table
+        next_token = self.next_token
+        parse_prefix = self.parse_prefix
+        pending = []
 
-        while (not self.peek_token_is(SEMICOLON) and 
-               not self.peek_token_is(EOF) and 
-               precedence <= self.peek_precedence()):
+        left_exp = parse_prefix()
+        while True:
+            if left_exp is not None:
+                entry = infix_table.get(self.peek_token.type)
+                if entry is not None and precedence <= entry[0]:
+                    next_token()
+                    infix = entry[1]
+                    if infix is None:
+                        # Descend into the right operand of a binary operator
+                        pending.append((left_exp, self.cur_token.literal, precedence))
+                        precedence = entry[0]
+                        next_token()
+                        left_exp = parse_prefix()
+                    else:
+                        left_exp = infix(left_exp)
+                    continue
 
-            if self.peek_token.type not in self.infix_parse_fns:
+            # Current operand is complete: reduce it into the enclosing operator
+            if not pending:
                 return left_exp
+            left, operator, precedence = pending.pop()
+            left_exp = InfixExpression(left, operator, left_exp)
 
-            infix = self.infix_parse_fns[self.peek_token.type]
-            self.next_token()
-            left_exp = infix(left_exp)
-
-            if left_exp is None:
-                return None
-
-        return left_exp
+    def parse_prefix(self):
+        prefix = self.prefix_parse_fns.get(self.cur_token.type)
+        if prefix is None:
+            self.errors.append(f"Line {self.cur_token.line}:{self.cur_token.column} - Unexpected token '{self.cur_token.literal}'")
+            return None
+        return prefix()
 
     def parse_identifier(self):
-        return Identifier(value=self.cur_token.literal)
+        name = self.cur_token.literal
+        node = self._ident_cache.get(name)
+        if node is None:
+            node = self._ident_cache[name] = Identifier(sys.intern(name))
+        return node
 
     def parse_integer_literal(self):
         try:
-            return IntegerLiteral(value=int(self.cur_token.literal))
+            value = int(self.cur_token.literal)
+            if 0 <= value <= 256:
+                return _SMALL_INTS[value]
+            return IntegerLiteral(value)
         except ValueError:
             self.errors.append(f"Line {self.cur_token.line}:{self.cur_token.column} - Could not parse {self.cur_token.literal} as integer")
             return None
 
     def parse_float_literal(self):
         try:
-            return FloatLiteral(value=float(self.cur_token.literal))
+            return FloatLiteral(float(self.cur_token.literal))
         except ValueError:
             self.errors.append(f"Line {self.cur_token.line}:{self.cur_token.column} - Could not parse {self.cur_token.literal} as float")
             return None
 
     def parse_string_literal(self):
-        return StringLiteral(value=self.cur_token.literal)
+        return StringLiteral(self.cur_token.literal)
 
     def parse_boolean(self):
-        return Boolean(value=self.cur_token_is(TRUE))
+        return _TRUE if self.cur_token.type == TRUE else _FALSE
 
     def parse_list_literal(self):
-        list_lit = ListLiteral(elements=[])
+        list_lit = ListLiteral([])
         list_lit.elements = self.parse_expression_list(RBRACKET)
         return list_lit
 
     def parse_call_expression(self, function):
-        exp = CallExpression(function=function, arguments=[])
+        exp = CallExpression(function, [])
         exp.arguments = self.parse_expression_list(RPAREN)
         return exp
 
     def parse_prefix_expression(self):
-        expression = PrefixExpression(operator=self.cur_token.literal, right=None)
+        expression = PrefixExpression(self.cur_token.literal, None)
         self.next_token()
         expression.right = self.parse_expression(PREFIX)
         return expression
 
     def parse_infix_expression(self, left):
-        expression = InfixExpression(left=left, operator=self.cur_token.literal, right=None)
+        expression = InfixExpression(left, self.cur_token.literal, None)
         precedence = self.cur_precedence()
         self.next_token()
         expression.right = self.parse_expression(precedence)
@@ -1138,15 +1225,15 @@ class UltimateParser:
         # treat its contents as a parameter list for an arrow-style lambda: (a, b) => ...
         # The lexer sets a hint flag when it detects a ')' followed by '=>'. Use
         # that as a fast-path check to parse the contents as parameter identifiers.
-        if getattr(self.lexer, '_next_paren_has_lambda', False) or self._lookahead_token_after_matching_paren() == LAMBDA:
+        if self._paren_lambda_hint() or self._lookahead_token_after_matching_paren() == LAMBDA:
             # Consume '('
             self.next_token()
-            self.lexer._next_paren_has_lambda = False  # Clear lexer hint after consuming parenthesis
+            self._hints_cleared_upto = self.pos + 1  # Clear lexer hint after consuming parenthesis
             params = []
             # If immediate RPAREN, empty params
             if self.cur_token_is(RPAREN):
                 self.next_token()
-                return ListLiteral(elements=params)
+                return ListLiteral(params)
 
             # Collect identifiers separated by commas
             if self.cur_token_is(IDENT):
@@ -1166,7 +1253,7 @@ class UltimateParser:
                 return None
 
             # Return a ListLiteral-like node carrying identifiers for lambda parsing
-            return ListLiteral(elements=params)
+            return ListLiteral(params)
 
         # Default grouped expression behavior
         self.next_token()
@@ -1175,41 +1262,31 @@ class UltimateParser:
             return None
         return exp
 
-    def _lookahead_token_after_matching_paren(self):
-        """Character-level lookahead: detect if the matching ')' is followed by '=>' (arrow).
+    def _paren_lambda_hint(self):
+        """The lexer's lambda hint for the current '(' token.
 
-        This avoids consuming parser state by scanning the lexer's input string from the
-        current position and counting parentheses. It's best-effort and ignores strings
-        or escapes — suitable for parameter lists which are simple identifier lists.
+        A streaming lexer reports the hint of the last '(' it scanned, which
+        is the peek token if that is also '(', else the current one.
         """
-        lexer = self.lexer
-        src = getattr(lexer, 'input', '')
-        pos = getattr(lexer, 'position', 0)
-
-        i = pos
-        depth = 0
-        length = len(src)
-
-        while i < length:
-            ch = src[i]
-            if ch == '(':
-                depth += 1
-            elif ch == ')':
-                depth -= 1
-                if depth == 0:
-                    # look ahead for '=>' skipping whitespace
-                    j = i + 1
-                    while j < length and src[j].isspace():
-                        j += 1
-                    if j + 1 < length and src[j] == '=' and src[j + 1] == '>':
-                        return LAMBDA
-                    return None
-            i += 1
+        i = self.pos + 1 if self.peek_token.type == LPAREN else self.pos
+        if i <= self._hints_cleared_upto:
+            return False
+        return self._lambda_hints.get(i, False)
 
+    def _lookahead_token_after_matching_paren(self):
+        """Token-level lookahead: LAMBDA if the ')' matching the current '('
+        is followed by '=>', else None. Reads the bracket table built by
+        _load_tokens, so no parser state is consumed and nothing is rescanned.
+        """
+        end = self._match[self.pos]
+        if end < 0 or self.tokens[end].type != RPAREN:
+            return None
+        if self.tokens[end + 1].type == LAMBDA:
+            return LAMBDA
         return None
 
     def parse_if_expression(self):
-        expression = IfExpression(condition=None, consequence=None, alternative=None)
+        expression = IfExpression(None, None, None)
 
         if not self.expect_peek(LPAREN):
             return None
@@ -1306,7 +1383,7 @@ class UltimateParser:
         else:
             self.next_token()  # Move past }
 
-        return EntityStatement(name=entity_name, properties=properties)
+        return EntityStatement(entity_name, properties)
 
     def recover_to_next_property(self):
         """Recover to the next property in entity definition"""
@@ -1428,13 +1505,16 @@ class UltimateParser:
             self.next_token()
             return elements
 
-        self.next_token()
-        elements.append(self.parse_expression(LOWEST))
+        append = elements.append
+        next_token = self.next_token
+        parse_expression = self.parse_expression
+        next_token()
+        append(parse_expression(LOWEST))
 
-        while self.peek_token_is(COMMA):
-            self.next_token()
-            self.next_token()
-            elements.append(self.parse_expression(LOWEST))
+        while self.peek_token.type == COMMA:
+            next_token()
+            next_token()
+            append(parse_expression(LOWEST))
 
         if not self.expect_peek(end):
             return elements
@@ -1443,8 +1523,12 @@ class UltimateParser:
 
     # === TOKEN UTILITIES ===
     def next_token(self):
+        # Stay on the final EOF once reached, like a drained lexer would
+        pos = self.pos
+        if pos < self._last:
+            pos = self.pos = pos + 1
         self.cur_token = self.peek_token
-        self.peek_token = self.lexer.next_token()
+        self.peek_token = self.tokens[pos + 1]
 
     def cur_token_is(self, t):
         return self.cur_token.type == t
@@ -15,6 +15,12 @@ def ctx_debug(msg, data=None, level='debug'):
     else:
         print(f"🔍 [CTX DEBUG] {msg}")
 
+# Token types that always make a block worth parsing, whatever their literal
+_MEANINGFUL_TYPES = frozenset({
+    IDENT, STRING, INT, FLOAT, LBRACE, RBRACE, LPAREN, RPAREN, LBRACKET, RBRACKET,
+    COMMA, DOT, SEMICOLON, ASSIGN, LAMBDA,
+})
+
 class ContextStackParser:
     def __init__(self, structural_analyzer):
         self.structural_analyzer = structural_analyzer
@@ -69,10 +75,10 @@ class ContextStackParser:
             # Early exit: if a block has no meaningful tokens, skip parsing it
             tokens = block_info.get('tokens', []) or []
             def _meaningful(tok):
-                lit = getattr(tok, 'literal', None)
                 # treat identifiers, strings, numbers and structural tokens as meaningful
-                if tok.type in {IDENT, STRING, INT, FLOAT, LBRACE, RBRACE, LPAREN, RPAREN, LBRACKET, RBRACKET, COMMA, DOT, SEMICOLON, ASSIGN, LAMBDA}:
+                if tok.type in _MEANINGFUL_TYPES:
                     return True
+                lit = tok.literal
                 return not (lit is None or lit == '')
 
             if not any(_meaningful(t) for t in tokens):
@@ -828,7 +834,8 @@ class ContextStackParser:
             print("  ❌ [Map] Not a map literal - no opening brace")
             return None
 
-        pairs_list = []
+        keys = []
+        values = []
         i = 1  # Skip opening brace
 
         while i < len(tokens) and tokens[i].type != RBRACE:
@@ -853,7 +860,8 @@ class ContextStackParser:
                     else:
                         key_node = StringLiteral(key_token.literal)
 
-                    pairs_list.append((key_node, value_expr))
+                    keys.append(key_node)
+                    values.append(value_expr)
                     print(f"  🗺️ [Map] Added pair: {key_token.literal} -> {type(value_expr).__name__}")
 
                 i = j
@@ -863,8 +871,8 @@ class ContextStackParser:
                 # Skip token if it's unexpected (robust parsing)
                 i += 1
 
-        map_literal = MapLiteral(pairs_list)
-        print(f"  🗺️ [Map] Successfully parsed map with {len(pairs_list)} pairs")
+        map_literal = MapLiteral(keys, values)
+        print(f"  🗺️ [Map] Successfully parsed map with {len(keys)} pairs")
         return map_literal
 
     # === EXPRESSION PARSING METHODS ===
@@ -2,6 +2,12 @@
 from .zexus_token import *
 from typing import List, Dict
 
+
+def _is_empty_token(tok):
+    """Tokens with an empty literal (other than strings/identifiers) are dropped from blocks"""
+    lit = tok.literal
+    return (lit == '' or lit is None) and tok.type != STRING and tok.type != IDENT
+
 class StructuralAnalyzer:
     """Lightweight structural analyzer that splits token stream into top-level blocks.
     Special handling for try/catch to avoid merging statements inside try blocks.
@@ -43,11 +49,6 @@ class StructuralAnalyzer:
                 i += 1
                 continue
 
-            # Helper: skip tokens that are empty/whitespace-only literals when building blocks
-            def _is_empty_token(tok):
-                lit = getattr(tok, 'literal', None)
-                return (lit == '' or lit is None) and tok.type != STRING and tok.type != IDENT
-
             # === IMPLEMENTED: Enhanced USE statement detection with braces ===
             if t.type == USE:
                 start_idx = i
@@ -595,5 +596,5 @@ class StructuralAnalyzer:
             end = info.get('end_index')
             ttype = info.get('type')
             subtype = info.get('subtype')
-            token_literals = [t.literal for t in info.get('tokens', []) if getattr(t, 'literal', None)]
+            token_literals = [t.literal for t in info.get('tokens', []) if t.literal]
             print(f"  [{bid}] {ttype}/{subtype} @ {start}-{end}: {token_literals}")
\ No newline at end of file
@@ -5,9 +5,22 @@ class SyntaxValidator:
     def __init__(self):
         self.suggestions = []
         self.warnings = []
+        # ((desired_style, code), result) of the most recent validate_code() call
+        self._last_validation = None
 
     def validate_code(self, code, desired_style="universal"):
         """Validate code and suggest improvements for the desired syntax style"""
+        # `zx run` validates a source and then auto_fix() validates the same
+        # text again; repeat the previous result instead of re-scanning it.
+        # Callers get a fresh dict since auto_fix() adds keys to its result.
+        key = (desired_style, code)
+        last = self._last_validation
+        if last is not None and last[0] == key:
+            result = last[1]
+            self.suggestions = result['suggestions']
+            self.warnings = result['warnings']
+            return dict(result)
+
         self.suggestions = []
         self.warnings = []
 
@@ -17,12 +30,14 @@ class SyntaxValidator:
             line_num = i + 1
             self._validate_line(line, line_num, desired_style)
 
-        return {
+        result = {
             'is_valid': len(self.suggestions) == 0,
             'suggestions': self.suggestions,
             'warnings': self.warnings,
             'error_count': len(self.suggestions)
         }
+        self._last_validation = (key, result)
+        return dict(result)
 
     def _validate_line(self, line, line_num, style):
         """Validate a single line against the desired style"""
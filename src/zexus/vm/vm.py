@@ -6,6 +6,7 @@ Capabilities:
     * high-level ops list (("DEFINE_SCREEN",...), etc.)
     * low-level Bytecode object with .instructions and .constants (stack-machine)
  - Low-level opcodes: LOAD_CONST, LOAD, STORE, CALL, PRINT, JUMP, JUMP_IF_FALSE, RETURN
+ - Arithmetic / comparison / logic opcodes (ADD ... OR, NOT, NEG) with the evaluator's semantics
  - Async primitives: SPAWN (start coroutine), AWAIT (await coroutine/task)
  - Event system: REGISTER_EVENT, EMIT_EVENT
  - Module import: IMPORT (importlib)
@@ -15,8 +16,11 @@ Capabilities:
 from typing import List, Any, Dict, Tuple, Optional, Union
 import asyncio
 import importlib
+import operator
 import types
 
+from ..config import config
+
 # Try to use renderer backend
 try:
 	from renderer import backend as _BACKEND
@@ -32,6 +36,45 @@ class Cell:
 	def __repr__(self):
 		return f"<Cell {self.value!r}>"
 
+def _concat_str(value):
+	"""String form of a value inside a string concatenation (matches the evaluator)"""
+	if isinstance(value, str):
+		return value
+	if value is None:
+		return "null"
+	if isinstance(value, bool):
+		return "true" if value else "false"
+	if hasattr(value, "inspect"):
+		return value.inspect()
+	return str(value)
+
+def _truthy(value):
+	"""Truthiness of the conditional jumps: only None and False are falsy (as in the interpreter)"""
+	return value is not None and value is not False
+
+def _add(a, b):
+	# a string on either side concatenates, like the evaluator
+	if isinstance(a, str) or isinstance(b, str):
+		return _concat_str(a) + _concat_str(b)
+	return a + b
+
+def _div(a, b):
+	if b == 0:
+		raise ZeroDivisionError("Division by zero")
+	# int / int floors, like the evaluator
+	if isinstance(a, int) and isinstance(b, int):
+		return a // b
+	return a / b
+
+# Binary opcode -> implementation, applied to (left, right)
+_BINARY_OPS = {
+	"ADD": _add, "SUB": operator.sub, "MUL": operator.mul, "DIV": _div,
+	"EQ": operator.eq, "NEQ": operator.ne, "LT": operator.lt, "GT": operator.gt,
+	"LTE": operator.le, "GTE": operator.ge,
+	"AND": lambda a, b: _truthy(a) and _truthy(b),
+	"OR": lambda a, b: _truthy(a) or _truthy(b),
+}
+
 class VM:
 	def __init__(self, builtins: Dict[str, Any] = None, env: Dict[str, Any] = None, parent_env: Dict[str, Any] = None):
 		# builtins: mapping name -> Builtin wrapper or callable
@@ -52,6 +95,13 @@ class VM:
 	def execute(self, code: Union[List[Tuple], Any], debug: bool = False):
 		# If Bytecode-like object with instructions and constants -> run stack VM
 		if hasattr(code, "instructions") and hasattr(code, "constants"):
+			if config.enable_jit and not debug and self._parent_env is None and not self._closure_cells:
+				# Optional Numba kernel for numeric loops (falls back to the Python VM);
+				# imported here so numba is only loaded when the JIT is enabled
+				from . import vm_numba
+				result = vm_numba.run_bytecode(code, self.env)
+				if result is not vm_numba.UNSUPPORTED:
+					return result
 			if debug:
 				print("[VM] Running low-level Bytecode (stack VM)")
 			return asyncio.run(self._run_stack_bytecode(code, debug))
@@ -179,6 +229,16 @@ class VM:
 		stack: List[Any] = []
 		# helper to resolve constant operand (index)
 		def const(idx): return consts[idx] if 0 <= idx < len(consts) else None
+		# name opcodes index a separate names table; older bytecode keeps names in constants
+		names = list(getattr(bytecode, "names", consts))
+		def name_at(idx): return names[idx] if 0 <= idx < len(names) else None
+		# Resolve name operands to the names themselves once per run, so the
+		# name opcodes below read them straight from the instruction
+		for i, (op, operand) in enumerate(instrs):
+			if op == "LOAD_NAME" or op == "STORE_NAME":
+				instrs[i] = (op, name_at(operand))
+			elif op == "STORE_FUNC" or op == "CALL_NAME":
+				instrs[i] = (op, (name_at(operand[0]), operand[1]))
 
 		# Helper for lexical name resolution (check local env, closure cells, parent chain)
 		def _resolve(name):
@@ -255,11 +315,17 @@ class VM:
 			# Stack ops
 			if op == "LOAD_CONST":
 				stack.append(const(operand))
+			elif op == "LOAD_SMALLINT":
+				stack.append(operand)
+			elif op == "LOAD_TRUE":
+				stack.append(True)
+			elif op == "LOAD_FALSE":
+				stack.append(False)
 			elif op == "LOAD_NAME":
-				# operand: const index for name
-				name = const(operand)
+				# operand: resolved name
+				name = operand
 				# lexical resolution: check own env then parent chain
-				val = self.env.get(name) if name in self.env else None
+				val = self.env.get(name)
 				if val is None and self._parent_env is not None:
 					# parent may be a raw dict or another VM.env; try lookup chain
 				 # try direct lookup on parent env dict
@@ -269,14 +335,13 @@ class VM:
 						val = None
 				stack.append(val)
 			elif op == "STORE_NAME":
-				name = const(operand)
+				name = operand
 				val = stack.pop() if stack else None
 				# Respect closure cells and lexical semantics
 				_store(name, val)
 			elif op == "STORE_FUNC":
-				# operand: (name_idx, func_const_idx)
-				name_idx, func_idx = operand
-				name = const(name_idx)
+				# operand: (name, func_const_idx)
+				name, func_idx = operand
 				func_desc = const(func_idx)
 				# Prepare descriptor copy
 				func_desc_copy = dict(func_desc) if isinstance(func_desc, dict) else {"bytecode": func_desc}
@@ -289,9 +354,8 @@ class VM:
 				# store function descriptor with closure reference into environment
 				self.env[name] = func_desc_copy
 			elif op == "CALL_NAME":
-				# operand: (name_const_idx, arg_count)
-				name_idx, arg_count = operand
-				func_name = const(name_idx)
+				# operand: (name, arg_count)
+				func_name, arg_count = operand
 				# pop args
 				args = [stack.pop() for _ in range(arg_count)][::-1] if arg_count else []
 				# resolve function by checking local env (_resolve) then builtins
@@ -314,6 +378,21 @@ class VM:
 				fn_obj = stack.pop() if stack else None
 				res = await self._invoke_callable_or_funcdesc(fn_obj, args)
 				stack.append(res)
+			elif op == "CONCAT_N":
+				# operand: count; join the top `count` values as strings
+				parts = stack[-operand:] if operand else []
+				del stack[len(stack) - len(parts):]
+				stack.append("".join(_concat_str(p) for p in parts))
+			elif op in _BINARY_OPS:
+				right = stack.pop()
+				stack.append(_BINARY_OPS[op](stack.pop(), right))
+			elif op == "NOT":
+				stack.append(not _truthy(stack.pop()))
+			elif op == "NEG":
+				stack.append(-stack.pop())
+			elif op == "POP":
+				if stack:
+					stack.pop()
 			elif op == "PRINT":
 				val = stack.pop() if stack else None
 				print(val)
@@ -321,8 +400,11 @@ class VM:
 				ip = operand
 			elif op == "JUMP_IF_FALSE":
 				cond = stack.pop() if stack else None
-				falsy = (cond is None) or (cond is False)
-				if falsy:
+				if not _truthy(cond):
+					ip = operand
+			elif op == "JUMP_IF_TRUE":
+				cond = stack.pop() if stack else None
+				if _truthy(cond):
 					ip = operand
 			elif op == "RETURN":
 				return stack.pop() if stack else None
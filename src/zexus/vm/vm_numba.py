@@ -0,0 +1,285 @@
+"""
+Optional Numba backend for the low-level stack VM.
+
+Compiler bytecode that only moves numbers around (constants, variables,
+arithmetic, comparisons and loops) is run by an @njit kernel straight over
+the flat opcode/operand arrays of compiler.bytecode.Bytecode. Anything else
+(strings, calls, printing, async/event ops) is reported as UNSUPPORTED and
+the caller falls back to the Python VM.
+
+The VM only uses the kernel when config.enable_jit is set. Numba and NumPy
+are optional; without them NUMBA_AVAILABLE is False.
+"""
+try:
+    import numba
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    np = None
+    NUMBA_AVAILABLE = False
+
+from ..compiler import bytecode as _bc
+from ..compiler.bytecode import NO_OPERAND
+
+# Returned by run_bytecode when the bytecode needs the Python VM
+UNSUPPORTED = object()
+
+OP_LOAD_CONST = _bc.LOAD_CONST
+OP_LOAD_SMALLINT = _bc.LOAD_SMALLINT
+OP_LOAD_TRUE = _bc.LOAD_TRUE
+OP_LOAD_FALSE = _bc.LOAD_FALSE
+OP_LOAD_NAME = _bc.LOAD_NAME
+OP_STORE_NAME = _bc.STORE_NAME
+OP_POP = _bc.POP
+OP_RETURN = _bc.RETURN
+OP_JUMP = _bc.JUMP
+OP_JUMP_IF_FALSE = _bc.JUMP_IF_FALSE
+OP_JUMP_IF_TRUE = _bc.JUMP_IF_TRUE
+OP_NOT = _bc.NOT
+OP_NEG = _bc.NEG
+OP_ADD = _bc.ADD
+OP_SUB = _bc.SUB
+OP_MUL = _bc.MUL
+OP_DIV = _bc.DIV
+OP_EQ = _bc.EQ
+OP_NEQ = _bc.NEQ
+OP_LT = _bc.LT
+OP_GT = _bc.GT
+OP_LTE = _bc.LTE
+OP_GTE = _bc.GTE
+
+# AND / OR are left out: the generator lowers && and || to jumps, and the kernel
+# could not tell a numeric 0 (truthy in Zexus) from false in their operands.
+_SUPPORTED = frozenset((
+    OP_LOAD_CONST, OP_LOAD_SMALLINT, OP_LOAD_TRUE, OP_LOAD_FALSE, OP_LOAD_NAME, OP_STORE_NAME,
+    OP_POP, OP_RETURN, OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_NOT, OP_NEG, OP_ADD, OP_SUB, OP_MUL, OP_DIV,
+    OP_EQ, OP_NEQ, OP_LT, OP_GT, OP_LTE, OP_GTE,
+))
+
+# Opcodes leaving a true boolean on the stack. The Python VM only treats
+# None/False as falsy, so conditional jumps and NOT are only compiled after one
+# of these.
+_BOOL_RESULT = frozenset((
+    OP_LOAD_TRUE, OP_LOAD_FALSE, OP_NOT, OP_EQ, OP_NEQ, OP_LT, OP_GT, OP_LTE, OP_GTE,
+))
+_BOOL_OPERAND = frozenset((OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_NOT))
+
+# Status codes returned by the kernel instead of a stack depth
+STACK_OVERFLOW = -1
+DIVISION_BY_ZERO = -2
+INT_OVERFLOW = -3
+
+# int64 bounds; int results outside them make the kernel bail out
+_INT64_MAX = 2 ** 63 - 1
+_INT64_MIN = -2 ** 63
+
+
+def _run(opcodes, operands, constants, slots, slot_bool, stack, stack_bool, int_mode):
+    """Execute until RETURN or the end of code; returns the stack depth, or
+    STACK_OVERFLOW, DIVISION_BY_ZERO or INT_OVERFLOW.
+
+    With `int_mode` set (int programs) DIV floors, like the interpreter, and
+    any result outside int64 stops the run instead of wrapping around.
+    `slot_bool` and `stack_bool` mark the values that are booleans in the
+    interpreter, so they can be handed back as bools."""
+    ip = 0
+    sp = 0
+    n = opcodes.shape[0]
+    limit = stack.shape[0]
+    while ip < n:
+        op = opcodes[ip]
+        arg = operands[ip]
+        ip += 1
+        if op == OP_LOAD_CONST or op == OP_LOAD_NAME:
+            if sp == limit:
+                return STACK_OVERFLOW
+            if op == OP_LOAD_CONST:
+                stack[sp] = constants[arg]
+                stack_bool[sp] = False
+            else:
+                stack[sp] = slots[arg]
+                stack_bool[sp] = slot_bool[arg]
+            sp += 1
+        elif op == OP_LOAD_SMALLINT or op == OP_LOAD_TRUE or op == OP_LOAD_FALSE:
+            if sp == limit:
+                return STACK_OVERFLOW
+            stack[sp] = arg if op == OP_LOAD_SMALLINT else (1 if op == OP_LOAD_TRUE else 0)
+            stack_bool[sp] = op != OP_LOAD_SMALLINT
+            sp += 1
+        elif op == OP_STORE_NAME:
+            sp -= 1
+            slots[arg] = stack[sp]
+            slot_bool[arg] = stack_bool[sp]
+        elif op == OP_POP:
+            sp -= 1
+        elif op == OP_JUMP:
+            ip = arg
+        elif op == OP_JUMP_IF_FALSE:
+            sp -= 1
+            if stack[sp] == 0:
+                ip = arg
+        elif op == OP_JUMP_IF_TRUE:
+            sp -= 1
+            if stack[sp] != 0:
+                ip = arg
+        elif op == OP_RETURN:
+            return sp
+        elif op == OP_NOT:
+            stack[sp - 1] = 1 if stack[sp - 1] == 0 else 0
+            stack_bool[sp - 1] = True
+        elif op == OP_NEG:
+            if int_mode and stack[sp - 1] == _INT64_MIN:
+                return INT_OVERFLOW
+            stack[sp - 1] = -stack[sp - 1]
+            stack_bool[sp - 1] = False
+        else:
+            sp -= 1
+            b = stack[sp]
+            a = stack[sp - 1]
+            is_bool = False
+            if op == OP_ADD:
+                if int_mode and ((b > 0 and a > _INT64_MAX - b) or (b < 0 and a < _INT64_MIN - b)):
+                    return INT_OVERFLOW
+                r = a + b
+            elif op == OP_SUB:
+                if int_mode and ((b < 0 and a > _INT64_MAX + b) or (b > 0 and a < _INT64_MIN + b)):
+                    return INT_OVERFLOW
+                r = a - b
+            elif op == OP_MUL:
+                if int_mode and a != 0 and b != 0:
+                    # -MIN has no int64 abs(), and only MIN * 1 stays in range
+                    if a == _INT64_MIN or b == _INT64_MIN:
+                        if a != 1 and b != 1:
+                            return INT_OVERFLOW
+                    elif abs(a) > _INT64_MAX // abs(b):
+                        return INT_OVERFLOW
+                r = a * b
+            elif op == OP_DIV:
+                if b == 0:
+                    return DIVISION_BY_ZERO
+                if int_mode:
+                    if a == _INT64_MIN and b == -1:
+                        return INT_OVERFLOW
+                    r = a // b
+                else:
+                    r = a / b
+            else:
+                is_bool = True
+                if op == OP_EQ:
+                    r = 1 if a == b else 0
+                elif op == OP_NEQ:
+                    r = 1 if a != b else 0
+                elif op == OP_LT:
+                    r = 1 if a < b else 0
+                elif op == OP_GT:
+                    r = 1 if a > b else 0
+                elif op == OP_LTE:
+                    r = 1 if a <= b else 0
+                else:
+                    r = 1 if a >= b else 0
+            stack[sp - 1] = r
+            stack_bool[sp - 1] = is_bool
+    return sp
+
+
+if NUMBA_AVAILABLE:
+    _run = numba.njit(cache=True)(_run)
+
+
+def _is_number(value):
+    """Plain int (within int64) or float"""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return _INT64_MIN <= value <= _INT64_MAX
+    return isinstance(value, float)
+
+
+def run_bytecode(bytecode, env):
+    """Run numeric-only bytecode with the Numba kernel.
+
+    Variables are read from and written back to `env`, and the result is the
+    value left on top of the stack, as in VM._run_stack_bytecode. Returns
+    UNSUPPORTED, with `env` untouched, when the bytecode (or the environment it
+    reads) falls outside what the kernel handles, or when the run hits a
+    division by zero or an int64 overflow; the caller then re-runs it on the
+    Python VM, which raises the error or keeps the exact big int.
+    """
+    if not NUMBA_AVAILABLE:
+        return UNSUPPORTED
+    opcodes = getattr(bytecode, "opcodes", None)
+    if opcodes is None:
+        return UNSUPPORTED
+    operands = bytecode.operands
+    consts = bytecode.constants
+    names = bytecode.names
+
+    # Only loops are worth the array setup; straight-line code stays in Python
+    if not any(op == OP_JUMP and operands[i] < i for i, op in enumerate(opcodes)):
+        return UNSUPPORTED
+
+    slot_of = {}
+    stored = set()
+    # The interpreter only mixes ints and floats for '+', so code seeing both stays in Python
+    saw_int = False
+    saw_float = False
+    remapped = np.empty(len(operands), dtype=np.int64)
+    for i, op in enumerate(opcodes):
+        arg = operands[i]
+        if op not in _SUPPORTED:
+            return UNSUPPORTED
+        if op in _BOOL_OPERAND and (i == 0 or opcodes[i - 1] not in _BOOL_RESULT):
+            return UNSUPPORTED
+        if op == OP_LOAD_CONST:
+            value = consts[arg] if arg != NO_OPERAND else None
+            if not _is_number(value):
+                return UNSUPPORTED
+            saw_float = saw_float or isinstance(value, float)
+            saw_int = saw_int or isinstance(value, int)
+        elif op == OP_LOAD_SMALLINT:
+            saw_int = True
+        elif op == OP_LOAD_NAME or op == OP_STORE_NAME:
+            name = names[arg]
+            arg = slot_of.setdefault(name, len(slot_of))
+            if op == OP_STORE_NAME:
+                stored.add(name)
+        remapped[i] = arg
+
+    # Names read but never assigned must already hold plain numbers
+    for name in slot_of:
+        if name in env:
+            if not _is_number(env[name]):
+                return UNSUPPORTED
+            saw_float = saw_float or isinstance(env[name], float)
+            saw_int = saw_int or isinstance(env[name], int)
+        elif name not in stored:
+            return UNSUPPORTED
+    if saw_int and saw_float:
+        return UNSUPPORTED
+
+    dtype = np.float64 if saw_float else np.int64
+    constants = np.array([c if _is_number(c) else 0 for c in consts] or [0], dtype=dtype)
+    slots = np.zeros(max(len(slot_of), 1), dtype=dtype)
+    for name, slot in slot_of.items():
+        if name in env:
+            slots[slot] = env[name]
+    slot_bool = np.zeros(slots.shape[0], dtype=np.bool_)
+    stack = np.empty(len(opcodes) + 1, dtype=dtype)
+    stack_bool = np.zeros(stack.shape[0], dtype=np.bool_)
+
+    sp = _run(np.frombuffer(opcodes, dtype=np.uint8), remapped, constants, slots, slot_bool,
+              stack, stack_bool, not saw_float)
+    if sp < 0:
+        # stack overflow, division by zero or int64 overflow: nothing has been
+        # written to env yet, so the Python VM re-runs from the start
+        return UNSUPPORTED
+
+    for name in stored:
+        slot = slot_of[name]
+        value = slots[slot].item()
+        env[name] = bool(value) if slot_bool[slot] else value
+    if not sp:
+        return None
+    value = stack[sp - 1].item()
+    return bool(value) if stack_bool[sp - 1] else value
@@ -1,17 +1,77 @@
 # src/zexus/zexus_ast.py
 
+# Integer node-kind tags. Each node class carries a NODE_KIND class attribute so
+# hot paths can test `node.NODE_KIND == K_IDENTIFIER` instead of isinstance().
+K_NODE = 0
+K_PROGRAM = 1
+K_LET_STATEMENT = 2
+K_RETURN_STATEMENT = 3
+K_EXPRESSION_STATEMENT = 4
+K_BLOCK_STATEMENT = 5
+K_PRINT_STATEMENT = 6
+K_FOR_EACH_STATEMENT = 7
+K_EMBEDDED_CODE_STATEMENT = 8
+K_USE_STATEMENT = 9
+K_FROM_STATEMENT = 10
+K_IF_STATEMENT = 11
+K_WHILE_STATEMENT = 12
+K_SCREEN_STATEMENT = 13
+K_COMPONENT_STATEMENT = 14
+K_THEME_STATEMENT = 15
+K_ACTION_STATEMENT = 16
+K_EXACTLY_STATEMENT = 17
+K_EXPORT_STATEMENT = 18
+K_DEBUG_STATEMENT = 19
+K_TRY_CATCH_STATEMENT = 20
+K_EXTERNAL_DECLARATION = 21
+K_IDENTIFIER = 22
+K_INTEGER_LITERAL = 23
+K_FLOAT_LITERAL = 24
+K_STRING_LITERAL = 25
+K_BOOLEAN = 26
+K_LIST_LITERAL = 27
+K_MAP_LITERAL = 28
+K_ACTION_LITERAL = 29
+K_LAMBDA_EXPRESSION = 30
+K_CALL_EXPRESSION = 31
+K_METHOD_CALL_EXPRESSION = 32
+K_PROPERTY_ACCESS_EXPRESSION = 33
+K_ASSIGNMENT_EXPRESSION = 34
+K_EMBEDDED_LITERAL = 35
+K_PREFIX_EXPRESSION = 36
+K_INFIX_EXPRESSION = 37
+K_IF_EXPRESSION = 38
+K_ENTITY_STATEMENT = 39
+K_VERIFY_STATEMENT = 40
+K_CONTRACT_STATEMENT = 41
+K_PROTECT_STATEMENT = 42
+K_MIDDLEWARE_STATEMENT = 43
+K_AUTH_STATEMENT = 44
+K_THROTTLE_STATEMENT = 45
+K_CACHE_STATEMENT = 46
+K_SEAL_STATEMENT = 47
+
 # Base classes
-class Node: 
+class Node:
+    __slots__ = ()
+    NODE_KIND = K_NODE
+
     def __repr__(self):
         return f"{self.__class__.__name__}()"
 
     def __str__(self):
         return self.__repr__()
 
-class Statement(Node): pass
-class Expression(Node): pass
+class Statement(Node):
+    __slots__ = ()
+
+class Expression(Node):
+    __slots__ = ()
 
 class Program(Node):
+    __slots__ = ('statements',)
+    NODE_KIND = K_PROGRAM
+
     def __init__(self):
         self.statements = []
 
@@ -20,6 +80,9 @@ class Program(Node):
 
 # Statement Nodes
 class LetStatement(Statement):
+    __slots__ = ('name', 'value')
+    NODE_KIND = K_LET_STATEMENT
+
     def __init__(self, name, value): 
         self.name = name; self.value = value
 
@@ -27,6 +90,9 @@ class LetStatement(Statement):
         return f"LetStatement(name={self.name}, value={self.value})"
 
 class ReturnStatement(Statement):
+    __slots__ = ('return_value',)
+    NODE_KIND = K_RETURN_STATEMENT
+
     def __init__(self, return_value):
         self.return_value = return_value
 
@@ -34,6 +100,9 @@ class ReturnStatement(Statement):
         return f"ReturnStatement(return_value={self.return_value})"
 
 class ExpressionStatement(Statement):
+    __slots__ = ('expression',)
+    NODE_KIND = K_EXPRESSION_STATEMENT
+
     def __init__(self, expression): 
         self.expression = expression
 
@@ -41,13 +110,34 @@ class ExpressionStatement(Statement):
         return f"ExpressionStatement(expression={self.expression})"
 
 class BlockStatement(Statement):
+    __slots__ = ('statements',)
+    NODE_KIND = K_BLOCK_STATEMENT
+
     def __init__(self): 
         self.statements = []
 
     def __repr__(self):
         return f"BlockStatement(statements={len(self.statements)})"
 
+class SingleStatementBlock(BlockStatement):
+    """Brace-less block holding exactly one statement (`if x: stmt`, `action f(): stmt`).
+
+    Avoids allocating a mutable statements list for the most common colon-style
+    bodies; `statements` is exposed as a read-only one-element tuple.
+    """
+    __slots__ = ('stmt',)
+
+    def __init__(self, stmt):
+        self.stmt = stmt
+
+    @property
+    def statements(self):
+        return (self.stmt,)
+
 class PrintStatement(Statement):
+    __slots__ = ('value',)
+    NODE_KIND = K_PRINT_STATEMENT
+
     def __init__(self, value): 
         self.value = value
 
@@ -55,6 +145,9 @@ class PrintStatement(Statement):
         return f"PrintStatement(value={self.value})"
 
 class ForEachStatement(Statement):
+    __slots__ = ('item', 'iterable', 'body')
+    NODE_KIND = K_FOR_EACH_STATEMENT
+
     def __init__(self, item, iterable, body):
         self.item = item; self.iterable = iterable; self.body = body
 
@@ -62,6 +155,9 @@ class ForEachStatement(Statement):
         return f"ForEachStatement(item={self.item}, iterable={self.iterable})"
 
 class EmbeddedCodeStatement(Statement):
+    __slots__ = ('name', 'language', 'code')
+    NODE_KIND = K_EMBEDDED_CODE_STATEMENT
+
     def __init__(self, name, language, code):
         self.name = name
         self.language = language
@@ -71,6 +167,9 @@ class EmbeddedCodeStatement(Statement):
         return f"EmbeddedCodeStatement(name={self.name}, language={self.language})"
 
 class UseStatement(Statement):
+    __slots__ = ('file_path', 'alias', 'names', 'is_named_import')
+    NODE_KIND = K_USE_STATEMENT
+
     def __init__(self, file_path, alias=None, names=None, is_named_import=False):
         self.file_path = file_path  # StringLiteral or string path
         self.alias = alias          # Optional Identifier for alias
@@ -95,6 +194,9 @@ class UseStatement(Statement):
             return f"use '{self.file_path}'"
 
 class FromStatement(Statement):
+    __slots__ = ('file_path', 'imports')
+    NODE_KIND = K_FROM_STATEMENT
+
     def __init__(self, file_path, imports=None):
         self.file_path = file_path  # StringLiteral for file path
         self.imports = imports or [] # List of (Identifier, Optional Identifier) for name and alias
@@ -103,6 +205,9 @@ class FromStatement(Statement):
         return f"FromStatement(file_path={self.file_path}, imports={len(self.imports)})"
 
 class IfStatement(Statement):
+    __slots__ = ('condition', 'consequence', 'alternative')
+    NODE_KIND = K_IF_STATEMENT
+
     def __init__(self, condition, consequence, alternative=None):
         self.condition = condition
         self.consequence = consequence
@@ -112,6 +217,9 @@ class IfStatement(Statement):
         return f"IfStatement(condition={self.condition})"
 
 class WhileStatement(Statement):
+    __slots__ = ('condition', 'body')
+    NODE_KIND = K_WHILE_STATEMENT
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -120,6 +228,9 @@ class WhileStatement(Statement):
         return f"WhileStatement(condition={self.condition})"
 
 class ScreenStatement(Statement):
+    __slots__ = ('name', 'body')
+    NODE_KIND = K_SCREEN_STATEMENT
+
     def __init__(self, name, body):
         self.name = name
         self.body = body
@@ -129,6 +240,9 @@ class ScreenStatement(Statement):
 
 # NEW: Component and Theme AST nodes for interpreter
 class ComponentStatement(Statement):
+    __slots__ = ('name', 'properties')
+    NODE_KIND = K_COMPONENT_STATEMENT
+
     def __init__(self, name, properties):
         self.name = name
         self.properties = properties  # expected to be MapLiteral or BlockStatement
@@ -137,6 +251,9 @@ class ComponentStatement(Statement):
         return f"ComponentStatement(name={self.name}, properties={self.properties})"
 
 class ThemeStatement(Statement):
+    __slots__ = ('name', 'properties')
+    NODE_KIND = K_THEME_STATEMENT
+
     def __init__(self, name, properties):
         self.name = name
         self.properties = properties  # expected to be MapLiteral or BlockStatement
@@ -145,6 +262,9 @@ class ThemeStatement(Statement):
         return f"ThemeStatement(name={self.name}, properties={self.properties})"
 
 class ActionStatement(Statement):
+    __slots__ = ('name', 'parameters', 'body')
+    NODE_KIND = K_ACTION_STATEMENT
+
     def __init__(self, name, parameters, body):
         self.name = name
         self.parameters = parameters
@@ -154,6 +274,9 @@ class ActionStatement(Statement):
         return f"ActionStatement(name={self.name}, parameters={len(self.parameters)})"
 
 class ExactlyStatement(Statement):
+    __slots__ = ('name', 'body')
+    NODE_KIND = K_EXACTLY_STATEMENT
+
     def __init__(self, name, body):
         self.name = name
         self.body = body
@@ -163,6 +286,9 @@ class ExactlyStatement(Statement):
 
 # Export statement
 class ExportStatement(Statement):
+    __slots__ = ('names', 'name', 'allowed_files', 'permission')
+    NODE_KIND = K_EXPORT_STATEMENT
+
     def __init__(self, name=None, names=None, allowed_files=None, permission=None):
         # `names` is a list of Identifier nodes; `name` kept for backward compatibility (first item)
         self.names = names or ([] if names is not None else ([name] if name is not None else []))
@@ -176,6 +302,9 @@ class ExportStatement(Statement):
 
 # NEW: Debug statement
 class DebugStatement(Statement):
+    __slots__ = ('value',)
+    NODE_KIND = K_DEBUG_STATEMENT
+
     def __init__(self, value):
         self.value = value
 
@@ -184,6 +313,9 @@ class DebugStatement(Statement):
 
 # NEW: Try-catch statement  
 class TryCatchStatement(Statement):
+    __slots__ = ('try_block', 'error_variable', 'catch_block')
+    NODE_KIND = K_TRY_CATCH_STATEMENT
+
     def __init__(self, try_block, error_variable, catch_block):
         self.try_block = try_block
         self.error_variable = error_variable
@@ -194,6 +326,9 @@ class TryCatchStatement(Statement):
 
 # NEW: External function declaration
 class ExternalDeclaration(Statement):
+    __slots__ = ('name', 'parameters', 'module_path')
+    NODE_KIND = K_EXTERNAL_DECLARATION
+
     def __init__(self, name, parameters, module_path):
         self.name = name
         self.parameters = parameters
@@ -204,6 +339,9 @@ class ExternalDeclaration(Statement):
 
 # Expression Nodes
 class Identifier(Expression):
+    __slots__ = ('value',)
+    NODE_KIND = K_IDENTIFIER
+
     def __init__(self, value): 
         self.value = value
 
@@ -214,6 +352,9 @@ class Identifier(Expression):
         return self.value
 
 class IntegerLiteral(Expression):
+    __slots__ = ('value',)
+    NODE_KIND = K_INTEGER_LITERAL
+
     def __init__(self, value): 
         self.value = value
 
@@ -221,6 +362,9 @@ class IntegerLiteral(Expression):
         return f"IntegerLiteral({self.value})"
 
 class FloatLiteral(Expression):
+    __slots__ = ('value',)
+    NODE_KIND = K_FLOAT_LITERAL
+
     def __init__(self, value): 
         self.value = value
 
@@ -228,6 +372,9 @@ class FloatLiteral(Expression):
         return f"FloatLiteral({self.value})"
 
 class StringLiteral(Expression):
+    __slots__ = ('value',)
+    NODE_KIND = K_STRING_LITERAL
+
     def __init__(self, value): 
         self.value = value
 
@@ -238,6 +385,9 @@ class StringLiteral(Expression):
         return self.value
 
 class Boolean(Expression):
+    __slots__ = ('value',)
+    NODE_KIND = K_BOOLEAN
+
     def __init__(self, value): 
         self.value = value
 
@@ -245,6 +395,9 @@ class Boolean(Expression):
         return f"Boolean({self.value})"
 
 class ListLiteral(Expression):
+    __slots__ = ('elements',)
+    NODE_KIND = K_LIST_LITERAL
+
     def __init__(self, elements): 
         self.elements = elements
 
@@ -252,13 +405,25 @@ class ListLiteral(Expression):
         return f"ListLiteral(elements={len(self.elements)})"
 
 class MapLiteral(Expression):
-    def __init__(self, pairs): 
-        self.pairs = pairs
+    __slots__ = ('keys', 'values')
+    NODE_KIND = K_MAP_LITERAL
+
+    # Keys and values are kept in parallel lists rather than as (key, value) tuples
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    @property
+    def pairs(self):
+        return list(zip(self.keys, self.values))
 
     def __repr__(self):
-        return f"MapLiteral(pairs={len(self.pairs)})"
+        return f"MapLiteral(pairs={len(self.keys)})"
 
 class ActionLiteral(Expression):
+    __slots__ = ('parameters', 'body')
+    NODE_KIND = K_ACTION_LITERAL
+
     def __init__(self, parameters, body):
         self.parameters = parameters
         self.body = body
@@ -268,6 +433,9 @@ class ActionLiteral(Expression):
 
 # Lambda expression
 class LambdaExpression(Expression):
+    __slots__ = ('parameters', 'body')
+    NODE_KIND = K_LAMBDA_EXPRESSION
+
     def __init__(self, parameters, body):
         self.parameters = parameters
         self.body = body
@@ -276,6 +444,9 @@ class LambdaExpression(Expression):
         return f"LambdaExpression(parameters={len(self.parameters)})"
 
 class CallExpression(Expression):
+    __slots__ = ('function', 'arguments')
+    NODE_KIND = K_CALL_EXPRESSION
+
     def __init__(self, function, arguments):
         self.function = function
         self.arguments = arguments
@@ -284,6 +455,9 @@ class CallExpression(Expression):
         return f"CallExpression(function={self.function}, arguments={len(self.arguments)})"
 
 class MethodCallExpression(Expression):
+    __slots__ = ('object', 'method', 'arguments')
+    NODE_KIND = K_METHOD_CALL_EXPRESSION
+
     def __init__(self, object, method, arguments):
         self.object = object
         self.method = method
@@ -293,6 +467,9 @@ class MethodCallExpression(Expression):
         return f"MethodCallExpression(object={self.object}, method={self.method})"
 
 class PropertyAccessExpression(Expression):
+    __slots__ = ('object', 'property')
+    NODE_KIND = K_PROPERTY_ACCESS_EXPRESSION
+
     def __init__(self, object, property):
         self.object = object
         self.property = property
@@ -301,6 +478,9 @@ class PropertyAccessExpression(Expression):
         return f"PropertyAccessExpression(object={self.object}, property={self.property})"
 
 class AssignmentExpression(Expression):
+    __slots__ = ('name', 'value')
+    NODE_KIND = K_ASSIGNMENT_EXPRESSION
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -309,6 +489,9 @@ class AssignmentExpression(Expression):
         return f"AssignmentExpression(name={self.name}, value={self.value})"
 
 class EmbeddedLiteral(Expression):
+    __slots__ = ('language', 'code')
+    NODE_KIND = K_EMBEDDED_LITERAL
+
     def __init__(self, language, code):
         self.language = language
         self.code = code
@@ -317,6 +500,9 @@ class EmbeddedLiteral(Expression):
         return f"EmbeddedLiteral(language={self.language})"
 
 class PrefixExpression(Expression):
+    __slots__ = ('operator', 'right')
+    NODE_KIND = K_PREFIX_EXPRESSION
+
     def __init__(self, operator, right): 
         self.operator = operator; self.right = right
 
@@ -324,6 +510,9 @@ class PrefixExpression(Expression):
         return f"PrefixExpression(operator='{self.operator}', right={self.right})"
 
 class InfixExpression(Expression):
+    __slots__ = ('left', 'operator', 'right')
+    NODE_KIND = K_INFIX_EXPRESSION
+
     def __init__(self, left, operator, right): 
         self.left = left; self.operator = operator; self.right = right
 
@@ -331,6 +520,9 @@ class InfixExpression(Expression):
         return f"InfixExpression(left={self.left}, operator='{self.operator}', right={self.right})"
 
 class IfExpression(Expression):
+    __slots__ = ('condition', 'consequence', 'alternative')
+    NODE_KIND = K_IF_EXPRESSION
+
     def __init__(self, condition, consequence, alternative=None):
         self.condition = condition
         self.consequence = consequence
@@ -353,6 +545,9 @@ class EntityStatement(Statement):
         role: string = "user"
     }
     """
+    __slots__ = ('name', 'properties', 'parent', 'methods')
+    NODE_KIND = K_ENTITY_STATEMENT
+
     def __init__(self, name, properties, parent=None, methods=None):
         self.name = name                    # Identifier
         self.properties = properties        # List of dicts: {name, type, default_value}
@@ -377,6 +572,9 @@ class VerifyStatement(Statement):
         check_whitelist(recipient)
     ])
     """
+    __slots__ = ('target', 'conditions', 'error_handler')
+    NODE_KIND = K_VERIFY_STATEMENT
+
     def __init__(self, target, conditions, error_handler=None):
         self.target = target                # Function/action to verify
         self.conditions = conditions        # List of verification conditions
@@ -396,6 +594,9 @@ class ContractStatement(Statement):
         action transfer(to: Address, amount: integer) -> boolean { ... }
     }
     """
+    __slots__ = ('name', 'storage_vars', 'actions', 'blockchain_config')
+    NODE_KIND = K_CONTRACT_STATEMENT
+
     def __init__(self, name, storage_vars, actions, blockchain_config=None):
         self.name = name                        # Identifier
         self.storage_vars = storage_vars or []  # Persistent storage declarations
@@ -419,6 +620,9 @@ class ProtectStatement(Statement):
         session_timeout: 3600
     })
     """
+    __slots__ = ('target', 'rules', 'enforcement_level')
+    NODE_KIND = K_PROTECT_STATEMENT
+
     def __init__(self, target, rules, enforcement_level="strict"):
         self.target = target                    # Function/app to protect
         self.rules = rules                      # Protection rules (Map or dict)
@@ -441,6 +645,9 @@ class MiddlewareStatement(Statement):
         return true
     })
     """
+    __slots__ = ('name', 'handler')
+    NODE_KIND = K_MIDDLEWARE_STATEMENT
+
     def __init__(self, name, handler):
         self.name = name                    # Identifier
         self.handler = handler              # ActionLiteral with (req, res) parameters
@@ -458,6 +665,9 @@ class AuthStatement(Statement):
         token_expiry: 3600
     }
     """
+    __slots__ = ('config',)
+    NODE_KIND = K_AUTH_STATEMENT
+
     def __init__(self, config):
         self.config = config                # Map or dict with auth config
 
@@ -474,6 +684,9 @@ class ThrottleStatement(Statement):
         per_user: true
     })
     """
+    __slots__ = ('target', 'limits')
+    NODE_KIND = K_THROTTLE_STATEMENT
+
     def __init__(self, target, limits):
         self.target = target                # Function to throttle
         self.limits = limits                # Throttle limits (Map or dict)
@@ -491,6 +704,9 @@ class CacheStatement(Statement):
         invalidate_on: ["data_changed"]
     })
     """
+    __slots__ = ('target', 'policy')
+    NODE_KIND = K_CACHE_STATEMENT
+
     def __init__(self, target, policy):
         self.target = target                # Function to cache
         self.policy = policy                # Cache policy (Map or dict)
@@ -504,6 +720,9 @@ class SealStatement(Statement):
 
     seal myObj
     """
+    __slots__ = ('target',)
+    NODE_KIND = K_SEAL_STATEMENT
+
     def __init__(self, target):
         # target is expected to be an Identifier or PropertyAccessExpression
         self.target = target
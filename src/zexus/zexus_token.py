@@ -131,6 +131,10 @@ class Token:
         # For backward compatibility with code expecting dict-like tokens
         self.value = literal  # Alias for literal
 
+    def copy(self):
+        """Detached copy, for holding on to a token the parser will recycle"""
+        return Token(self.type, self.literal, self.line, self.column)
+
     def __repr__(self):
         if self.line and self.column:
             return f"Token({self.type}, '{self.literal}', line={self.line}, col={self.column})"
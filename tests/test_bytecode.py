@@ -0,0 +1,207 @@
+"""
+Tests for the compiler's bytecode generator (zexus.compiler.bytecode).
+
+Programs are built as ASTs directly, so each test pins the tree shape it
+lowers; the results are checked on the Python stack VM.
+"""
+import asyncio
+import itertools
+
+import pytest
+
+from zexus.compiler.bytecode import BytecodeGenerator, _string_concat_parts
+from zexus.compiler.zexus_ast import (
+    Boolean, CallExpression, FloatLiteral, Identifier, InfixExpression, IntegerLiteral,
+    PrefixExpression, Program, ReturnStatement, StringLiteral,
+)
+from zexus.vm.vm import VM
+
+
+def name(value):
+    return Identifier(value)
+
+
+def num(value):
+    return IntegerLiteral(value)
+
+
+def infix(left, operator, right):
+    return InfixExpression(left, operator, right)
+
+
+def generate(expression):
+    """Bytecode of `return <expression>`"""
+    program = Program()
+    program.statements.append(ReturnStatement(expression))
+    return BytecodeGenerator().generate(program)
+
+
+def evaluate(bytecode, **env):
+    return asyncio.run(VM(env=env)._run_stack_bytecode(bytecode))
+
+
+def truthy(value):
+    return value is not None and value is not False
+
+
+# --- && / || short-circuit lowering ---
+
+@pytest.mark.parametrize("operator, jump, fall_through, short_circuit", [
+    ("&&", "JUMP_IF_FALSE", "LOAD_TRUE", "LOAD_FALSE"),
+    ("||", "JUMP_IF_TRUE", "LOAD_FALSE", "LOAD_TRUE"),
+])
+def test_short_circuit_jump_targets(operator, jump, fall_through, short_circuit):
+    bytecode = generate(infix(name("a"), operator, name("b")))
+    assert bytecode.instructions == [
+        ("LOAD_NAME", 0),
+        (jump, 6),
+        ("LOAD_NAME", 1),
+        (jump, 6),
+        (fall_through, None),
+        ("JUMP", 7),
+        (short_circuit, None),
+        ("RETURN", None),
+    ]
+
+
+VALUES = (True, False, None, 0, "")
+
+
+@pytest.mark.parametrize("a, b", list(itertools.product(VALUES, repeat=2)))
+def test_short_circuit_values(a, b):
+    result = evaluate(generate(infix(name("a"), "&&", name("b"))), a=a, b=b)
+    assert result is (truthy(a) and truthy(b))
+    result = evaluate(generate(infix(name("a"), "||", name("b"))), a=a, b=b)
+    assert result is (truthy(a) or truthy(b))
+
+
+@pytest.mark.parametrize("a, b, c", list(itertools.product((True, False, None), repeat=3)))
+def test_nested_short_circuit_values(a, b, c):
+    and_or = infix(infix(name("a"), "&&", name("b")), "||", name("c"))
+    assert evaluate(generate(and_or), a=a, b=b, c=c) is ((truthy(a) and truthy(b)) or truthy(c))
+    or_and = infix(name("a"), "||", infix(name("b"), "&&", name("c")))
+    assert evaluate(generate(or_and), a=a, b=b, c=c) is (truthy(a) or (truthy(b) and truthy(c)))
+
+
+@pytest.mark.parametrize("operator, left, runs_right", [
+    ("&&", False, False),
+    ("&&", True, True),
+    ("||", True, False),
+    ("||", False, True),
+])
+def test_right_operand_only_runs_when_needed(operator, left, runs_right):
+    calls = []
+    vm = VM(builtins={"right": lambda: calls.append(1) or True}, env={"left": left})
+    bytecode = generate(infix(name("left"), operator, CallExpression(name("right"), [])))
+    asyncio.run(vm._run_stack_bytecode(bytecode))
+    assert bool(calls) is runs_right
+
+
+def test_constant_short_circuit_folds():
+    bytecode = generate(infix(Boolean(True), "&&", Boolean(False)))
+    assert bytecode.instructions == [("LOAD_FALSE", None), ("RETURN", None)]
+
+
+# --- constant folding ---
+
+@pytest.mark.parametrize("expression, value", [
+    (infix(num(7), "/", num(2)), 3),
+    (infix(PrefixExpression("-", num(7)), "/", num(2)), -4),
+    (infix(infix(num(1), "+", num(2)), "*", num(3)), 9),
+    (infix(num(2), "<", num(3)), True),
+    (infix(StringLiteral("a"), "+", StringLiteral("b")), "ab"),
+    (PrefixExpression("!", Boolean(False)), True),
+])
+def test_literal_operators_fold(expression, value):
+    bytecode = generate(expression)
+    assert len(bytecode.instructions) == 2
+    result = evaluate(bytecode)
+    assert result == value and type(result) is type(value)
+
+
+def test_division_by_zero_is_left_for_runtime():
+    bytecode = generate(infix(num(7), "/", num(0)))
+    assert bytecode.instructions == [
+        ("LOAD_SMALLINT", 7), ("LOAD_SMALLINT", 0), ("DIV", None), ("RETURN", None),
+    ]
+    with pytest.raises(ZeroDivisionError):
+        evaluate(bytecode)
+
+
+@pytest.mark.parametrize("expression, opcode", [
+    (infix(num(1), "+", FloatLiteral(2.5)), "ADD"),
+    (infix(num(1), "+", Boolean(True)), "ADD"),
+    (infix(Boolean(True), "==", num(1)), "EQ"),
+    (infix(StringLiteral("1"), "==", num(1)), "EQ"),
+    (infix(StringLiteral("a"), "*", num(3)), "MUL"),
+    (infix(num(1), "<", name("x")), "LT"),
+])
+def test_mixed_or_unknown_operands_do_not_fold(expression, opcode):
+    opcodes = [op for op, _ in generate(expression).instructions]
+    assert opcodes[-2:] == [opcode, "RETURN"]
+    assert len(opcodes) == 4
+
+
+# --- string '+' chains (CONCAT_N) ---
+
+def test_number_sum_before_string_is_added_first():
+    # (1 + 2) + "a" is "3a" in the evaluator, not "12a"
+    bytecode = generate(infix(infix(num(1), "+", num(2)), "+", StringLiteral("a")))
+    assert bytecode.instructions == [
+        ("LOAD_SMALLINT", 3), ("LOAD_CONST", 0), ("CONCAT_N", 2), ("RETURN", None),
+    ]
+    assert evaluate(bytecode) == "3a"
+
+
+def test_runtime_sum_before_string_is_added_first():
+    bytecode = generate(infix(infix(name("x"), "+", num(1)), "+", StringLiteral("a")))
+    opcodes = [op for op, _ in bytecode.instructions]
+    assert opcodes == ["LOAD_NAME", "LOAD_SMALLINT", "ADD", "LOAD_CONST", "CONCAT_N", "RETURN"]
+    assert evaluate(bytecode, x=2) == "3a"
+
+
+@pytest.mark.parametrize("expression, count, value", [
+    # ("a" + 1) + 2
+    (infix(infix(StringLiteral("a"), "+", num(1)), "+", num(2)), 3, "a12"),
+    # 1 + (2 + "a"), the tree the compiler's parser builds for 1 + 2 + "a"
+    (infix(num(1), "+", infix(num(2), "+", StringLiteral("a"))), 3, "12a"),
+    # (1 + "a") + (2 + 3)
+    (infix(infix(num(1), "+", StringLiteral("a")), "+", infix(num(2), "+", num(3))), 3, "1a5"),
+])
+def test_string_chains_concatenate_in_order(expression, count, value):
+    bytecode = generate(expression)
+    assert bytecode.instructions[-2:] == [("CONCAT_N", count), ("RETURN", None)]
+    assert evaluate(bytecode) == value
+
+
+@pytest.mark.parametrize("x, text", [(None, "x=null"), (True, "x=true"), (False, "x=false"), (1.5, "x=1.5")])
+def test_concat_string_forms(x, text):
+    assert evaluate(generate(infix(StringLiteral("x="), "+", name("x"))), x=x) == text
+
+
+def test_long_string_chain():
+    expression = StringLiteral("s")
+    for _ in range(5000):
+        expression = infix(expression, "+", name("x"))
+    bytecode = generate(expression)
+    assert bytecode.instructions[-2:] == [("CONCAT_N", 5001), ("RETURN", None)]
+    assert evaluate(bytecode, x=1) == "s" + "1" * 5000
+
+
+def test_long_number_chain():
+    expression = name("x")
+    for _ in range(5000):
+        expression = infix(expression, "+", name("x"))
+    opcodes = [op for op, _ in generate(expression).instructions]
+    assert opcodes.count("ADD") == 5000 and "CONCAT_N" not in opcodes
+    assert evaluate(generate(expression), x=1) == 5001
+
+
+def test_rejected_chain_is_not_walked_again():
+    inner = infix(name("x"), "+", name("y"))
+    outer = infix(inner, "+", name("z"))
+    not_chains = set()
+    assert _string_concat_parts(outer, not_chains) is None
+    assert not_chains == {id(outer), id(inner)}
+    # the emitter asks again for the left operand; it is answered from the set
+    assert _string_concat_parts(inner, not_chains) is None
@@ -0,0 +1,159 @@
+"""
+Tests for the `zx` command line (zexus.cli.main), run in-process.
+"""
+import json
+
+import pytest
+
+import zexus.compiler as compiler_pkg
+from zexus.cli import main
+from zexus.cli.main import cli
+from zexus.config import config
+
+# The validator keeps flagging `catch (e)` after its auto-fix pass, although
+# the parser accepts it
+CATCH_OK = 'try {\n  print("in try")\n} catch (e) {\n  print("in catch")\n}\n'
+# Same shape with an unfinished expression, which the parser rejects when
+# advanced parsing is off
+CATCH_BROKEN = 'try {\n  let x = (1 +\n} catch (e) {\n  print("in catch")\n}\n'
+
+
+def run_cli(*args):
+    """cli() exit status: 0 when it returns, else the SystemExit code"""
+    try:
+        cli(list(args))
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+@pytest.fixture
+def source(tmp_path):
+    def write(text, name="main.zx"):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Keep bytecode the compiler caches on disk out of the user's cache directory"""
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_DIR", tmp_path / "bc")
+
+
+def test_run_when_parser_accepts_validator_errors(source, disk_cache, capsys):
+    path = source(CATCH_OK)
+    assert run_cli("--syntax-style", "universal", "run", path) == 0
+    out = capsys.readouterr().out
+    assert "Could not auto-fix" not in out
+    assert "in try" in out
+
+
+def test_run_refuses_unfixable_errors(source, disk_cache, capsys, monkeypatch):
+    monkeypatch.setattr(config, "enable_advanced_parsing", False)
+    path = source(CATCH_BROKEN)
+    assert run_cli("--syntax-style", "universal", "run", path) == 1
+    out = capsys.readouterr().out
+    assert "not running (use --force to run anyway)" in out
+    assert "Falling back" not in out and "Compiling" not in out
+
+
+def test_run_force_runs_anyway(source, disk_cache, capsys, monkeypatch):
+    monkeypatch.setattr(config, "enable_advanced_parsing", False)
+    path = source(CATCH_BROKEN)
+    run_cli("--syntax-style", "universal", "run", "--force", path)
+    out = capsys.readouterr().out
+    assert "attempting to run anyway" in out
+    assert "Parse errors" in out
+
+
+def test_style_cache_keeps_latest_entries(source, tmp_path, monkeypatch):
+    cache_file = tmp_path / "cache" / "style.json"
+    monkeypatch.setattr(main, "STYLE_CACHE_FILE", cache_file)
+    monkeypatch.setattr(main, "STYLE_CACHE_SIZE", 2)
+    validator = main._get_validator()
+    paths = [source("print(1)\n", f"{name}.zx") for name in ("a", "b", "c")]
+    for path in paths:
+        main._detect_syntax_style(validator, path, "print(1)\n")
+
+    assert list(json.loads(cache_file.read_text())) == paths[1:]
+    assert [p.name for p in cache_file.parent.iterdir()] == ["style.json"]
+
+
+# --- command line parsing ---
+
+@pytest.fixture
+def recorded_run(monkeypatch):
+    """Replace the run command's handler; returns the (ctx, kwargs) it was called with"""
+    calls = []
+    params = main.COMMANDS["run"][1]
+    monkeypatch.setitem(main.COMMANDS, "run", (lambda ctx, **kwargs: calls.append((ctx, kwargs)), params))
+    # settings cli() writes to config for some global options
+    monkeypatch.setattr(config, "use_hybrid_compiler", config.use_hybrid_compiler)
+    monkeypatch.setattr(main, "_COLOR", main._COLOR)
+    return calls
+
+
+def test_version(capsys):
+    assert run_cli("--version") == 0
+    assert capsys.readouterr().out == f"Zexus, version {main.VERSION}\n"
+
+
+@pytest.mark.parametrize("args", [["--help"], []])
+def test_main_help(args, capsys):
+    assert run_cli(*args) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("Usage: zx [OPTIONS] COMMAND [ARGS]...")
+    assert "--syntax-style [universal|tolerable|auto]" in out
+    for name in main.COMMANDS:
+        assert f"  {name}  " in out
+
+
+def test_command_help(capsys):
+    assert run_cli("run", "--help") == 0
+    out = capsys.readouterr().out
+    assert out.startswith("Usage: zx run [OPTIONS] FILE")
+    assert "--force" in out
+
+
+def test_global_options_and_options_after_file(source, recorded_run):
+    path = source("print(1)\n")
+    assert run_cli("--syntax-style=tolerable", "--execution-mode", "interpreter", "--color",
+                   "run", path, "--force") == 0
+    (ctx, kwargs), = recorded_run
+    assert ctx["SYNTAX_STYLE"] == "tolerable"
+    assert ctx["EXECUTION_MODE"] == "interpreter"
+    assert kwargs == {"file": path, "force": True}
+
+
+def test_defaults(source, recorded_run):
+    path = source("print(1)\n")
+    assert run_cli("run", path) == 0
+    (ctx, kwargs), = recorded_run
+    assert ctx["SYNTAX_STYLE"] == "auto" and ctx["EXECUTION_MODE"] == "auto"
+    assert kwargs == {"file": path, "force": False}
+
+
+@pytest.mark.parametrize("args, message", [
+    (["--nope"], "No such option: --nope"),
+    (["--debug=1"], "Option '--debug' does not take a value."),
+    (["--syntax-style"], "Option '--syntax-style' requires an argument."),
+    (["--syntax-style=strict", "run"], "Invalid value for '--syntax-style': 'strict' is not one of"),
+    (["frobnicate"], "No such command 'frobnicate'."),
+    (["run"], "Missing argument 'FILE'."),
+    (["run", "{file}", "extra.zx"], "Got unexpected extra argument (extra.zx)"),
+    (["run", "missing.zx"], "Invalid value for 'FILE': Path 'missing.zx' does not exist."),
+    (["run", "--force=1", "{file}"], "Option '--force' does not take a value."),
+    (["run", "--fast", "{file}"], "No such option: --fast"),
+    (["debug", "loud"], "Invalid value for 'ACTION': 'loud' is not one of"),
+    (["init", "--mode"], "Option '--mode' requires an argument."),
+])
+def test_usage_errors_exit_2(args, message, source, recorded_run, capsys, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    path = source("print(1)\n")
+    assert run_cli(*[arg.format(file=path) for arg in args]) == 2
+    err = capsys.readouterr().err
+    assert "Try 'zx --help' for help." in err
+    assert f"Error: {message}" in err
+    assert recorded_run == []
@@ -0,0 +1,108 @@
+"""
+Tests for the compiled-bytecode cache of zexus.compiler (in memory and on disk).
+"""
+import os
+import pickle
+from collections import OrderedDict
+
+import pytest
+
+import zexus.compiler as compiler_pkg
+from zexus.compiler import ZexusCompiler
+
+SOURCE = "let x = 1 + 2\nprint(x)\n"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Empty memory cache and a private disk cache directory with a fixed tag"""
+    monkeypatch.setattr(compiler_pkg, "_BYTECODE_CACHE", OrderedDict())
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_TAG", "tag1")
+    monkeypatch.setattr(compiler_pkg, "_disk_cache_count", None)
+    return tmp_path
+
+
+@pytest.fixture
+def frontend_runs(monkeypatch):
+    """Number of compile() calls that went past the cache to the frontend"""
+    runs = []
+    lazy_load = compiler_pkg._lazy_load
+    monkeypatch.setattr(compiler_pkg, "_lazy_load", lambda: runs.append(1) or lazy_load())
+    return runs
+
+
+def compile_source(source=SOURCE):
+    compiler = ZexusCompiler(source)
+    bytecode = compiler.compile()
+    assert not compiler.errors
+    return compiler, bytecode
+
+
+def cache_files(cache_dir):
+    return sorted(p.name for p in cache_dir.iterdir())
+
+
+def test_memory_hit(cache_dir, frontend_runs):
+    first, bytecode = compile_source()
+    second, cached = compile_source()
+    assert len(frontend_runs) == 1
+    assert cached is bytecode
+    assert second.ast is first.ast and second.analyzer is first.analyzer
+
+
+def test_disk_hit(cache_dir, frontend_runs):
+    compiler, bytecode = compile_source()
+    assert cache_files(cache_dir) == [f"{compiler._cache_key.hex()}-tag1.pkl"]
+
+    compiler_pkg._BYTECODE_CACHE.clear()
+    _, cached = compile_source()
+    assert len(frontend_runs) == 1
+    assert cached is not bytecode
+    assert cached.instructions == bytecode.instructions
+    assert cached.constants == bytecode.constants
+
+
+def test_tag_change_invalidates(cache_dir, frontend_runs, monkeypatch):
+    old, _ = compile_source()
+    compiler_pkg._BYTECODE_CACHE.clear()
+
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_TAG", "tag2")
+    new, _ = compile_source()
+    assert len(frontend_runs) == 2
+    # the old entry stays until the cache is full
+    assert cache_files(cache_dir) == [f"{old._cache_key.hex()}-tag1.pkl", f"{new._cache_key.hex()}-tag2.pkl"]
+
+
+def test_full_cache_evicts_least_recently_used(cache_dir, monkeypatch):
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_SIZE", 4)
+    prunes = []
+    prune = compiler_pkg._prune_disk_cache
+    monkeypatch.setattr(compiler_pkg, "_prune_disk_cache", lambda: prunes.append(1) or prune())
+    # left by another version of the frontend
+    (cache_dir / f"{'00' * 16}-tag0.pkl").write_bytes(b"")
+
+    names = []
+    for i in range(3):
+        compiler, _ = compile_source(f"let x = {i}\n")
+        names.append(f"{compiler._cache_key.hex()}-tag1.pkl")
+        os.utime(cache_dir / names[-1], (i + 1, i + 1))
+    assert prunes == []
+
+    # a disk hit makes the oldest entry the most recently used
+    compiler_pkg._BYTECODE_CACHE.clear()
+    compile_source("let x = 0\n")
+    compiler, _ = compile_source("let x = 3\n")
+    names.append(f"{compiler._cache_key.hex()}-tag1.pkl")
+    assert prunes == [1]
+    assert cache_files(cache_dir) == sorted([names[0], names[2], names[3]])
+
+
+def test_failed_write_leaves_no_files(cache_dir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(pickle, "dump", fail)
+    _, bytecode = compile_source()
+    assert bytecode is not None
+    assert cache_files(cache_dir) == []
@@ -0,0 +1,49 @@
+"""
+Tests for the parsed-program cache of HybridOrchestrator.interpret().
+"""
+from zexus.config import config
+from zexus.hybrid_orchestrator import HybridOrchestrator
+from zexus.object import Environment
+
+SOURCE = "let x = 1 + 2\n"
+
+
+def interpret_x(orchestrator):
+    env = Environment()
+    orchestrator.interpret(SOURCE, env, syntax_style="universal")
+    return env.get("x").inspect()
+
+
+def test_interpret_reuses_parsed_program(monkeypatch):
+    monkeypatch.setattr(config, "enable_advanced_parsing", True)
+    orchestrator = HybridOrchestrator()
+
+    assert interpret_x(orchestrator) == "3"
+    parser = orchestrator._parser
+    (key, program), = orchestrator._programs.items()
+    assert key == ("universal", True, SOURCE)
+
+    assert interpret_x(orchestrator) == "3"
+    assert orchestrator._parser is parser
+    assert list(orchestrator._programs.items()) == [(key, program)]
+
+
+def test_interpret_after_toggling_advanced_parsing(monkeypatch):
+    monkeypatch.setattr(config, "enable_advanced_parsing", True)
+    orchestrator = HybridOrchestrator()
+    interpret_x(orchestrator)
+    advanced_parser = orchestrator._parser
+
+    monkeypatch.setattr(config, "enable_advanced_parsing", False)
+    assert interpret_x(orchestrator) == "3"
+    assert orchestrator._parser is not advanced_parser
+    assert orchestrator._parser.enable_advanced_strategies is False
+    assert list(orchestrator._programs) == [
+        ("universal", True, SOURCE),
+        ("universal", False, SOURCE),
+    ]
+
+    # toggling back finds the program parsed with advanced strategies again
+    monkeypatch.setattr(config, "enable_advanced_parsing", True)
+    assert interpret_x(orchestrator) == "3"
+    assert len(orchestrator._programs) == 2
@@ -0,0 +1,164 @@
+"""
+Parity tests for the optional Numba kernel (zexus.vm.vm_numba) against the
+Python stack VM. The kernel tests are skipped when numba is not installed.
+"""
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+import zexus
+import zexus.compiler as compiler_pkg
+from zexus.compiler import ZexusCompiler
+from zexus.compiler.bytecode import Bytecode
+from zexus.config import config
+from zexus.vm import vm_numba
+from zexus.vm.vm import VM
+
+
+def loop_bytecode(init, op, step, count):
+    """acc = init; i = 0; while i < count { acc = acc <op> step; i = i + 1 }
+
+    The counter has the type of `init`, since the kernel keeps programs that
+    mix ints and floats on the Python VM."""
+    bc = Bytecode()
+    number = type(init)
+    acc = bc.add_name("acc")
+    i = bc.add_name("i")
+    bc.add_instruction("LOAD_CONST", bc.add_constant(init))
+    bc.add_instruction("STORE_NAME", acc)
+    bc.add_instruction("LOAD_CONST", bc.add_constant(number(0)))
+    bc.add_instruction("STORE_NAME", i)
+    start = len(bc.opcodes)
+    bc.add_instruction("LOAD_NAME", i)
+    bc.add_instruction("LOAD_CONST", bc.add_constant(number(count)))
+    bc.add_instruction("LT")
+    exit_jump = len(bc.opcodes)
+    bc.add_instruction("JUMP_IF_FALSE", 0)
+    bc.add_instruction("LOAD_NAME", acc)
+    bc.add_instruction("LOAD_CONST", bc.add_constant(step))
+    bc.add_instruction(op)
+    bc.add_instruction("STORE_NAME", acc)
+    bc.add_instruction("LOAD_NAME", i)
+    bc.add_instruction("LOAD_CONST", bc.add_constant(number(1)))
+    bc.add_instruction("ADD")
+    bc.add_instruction("STORE_NAME", i)
+    bc.add_instruction("JUMP", start)
+    bc.operands[exit_jump] = len(bc.opcodes)
+    return bc
+
+
+def run_python_vm(bytecode):
+    vm = VM()
+    result = asyncio.run(vm._run_stack_bytecode(bytecode))
+    return result, vm.env
+
+
+def test_python_vm_arithmetic(tmp_path, monkeypatch):
+    monkeypatch.setattr(compiler_pkg, "_DISK_CACHE_DIR", tmp_path)
+    compiler = ZexusCompiler("let x = 5\nlet y = x + 1\nlet z = 7 / x\n")
+    bytecode = compiler.compile()
+    assert not compiler.errors
+    _, env = run_python_vm(bytecode)
+    assert env["y"] == 6
+    assert env["z"] == 1
+
+
+def test_python_vm_loop():
+    _, env = run_python_vm(loop_bytecode(1, "ADD", 3, 10))
+    assert env == {"acc": 31, "i": 10}
+
+
+@pytest.mark.parametrize("init, op, step, count", [
+    (1, "ADD", 3, 100),
+    (1000, "SUB", 7, 50),
+    (3, "MUL", 2, 20),
+    (10 ** 9, "DIV", 3, 5),
+    (1.0, "MUL", 1.5, 20),
+    (100.0, "DIV", 3.0, 10),
+])
+def test_kernel_matches_python_vm(init, op, step, count):
+    pytest.importorskip("numba")
+    bytecode = loop_bytecode(init, op, step, count)
+    env = {}
+    result = vm_numba.run_bytecode(bytecode, env)
+    assert result is not vm_numba.UNSUPPORTED
+    expected_result, expected_env = run_python_vm(bytecode)
+    assert result == expected_result
+    assert env == expected_env
+    assert type(env["acc"]) is type(expected_env["acc"])
+
+
+def test_kernel_division_by_zero_falls_back():
+    pytest.importorskip("numba")
+    bytecode = loop_bytecode(10, "DIV", 0, 5)
+    env = {}
+    assert vm_numba.run_bytecode(bytecode, env) is vm_numba.UNSUPPORTED
+    assert env == {}
+    with pytest.raises(ZeroDivisionError):
+        run_python_vm(bytecode)
+
+
+@pytest.mark.parametrize("init, op, step", [
+    (2, "MUL", 2),
+    (-3, "MUL", 3),
+    (-2 ** 62, "MUL", 2),
+    (2 ** 62, "ADD", 2 ** 60),
+    (-2 ** 62, "SUB", 2 ** 60),
+])
+def test_kernel_int64_overflow_falls_back(init, op, step):
+    pytest.importorskip("numba")
+    bytecode = loop_bytecode(init, op, step, 70)
+    env = {}
+    assert vm_numba.run_bytecode(bytecode, env) is vm_numba.UNSUPPORTED
+    assert env == {}
+    _, expected_env = run_python_vm(bytecode)
+    assert abs(expected_env["acc"]) >= 2 ** 63
+
+
+def test_kernel_keeps_bools():
+    pytest.importorskip("numba")
+    bytecode = loop_bytecode(1, "ADD", 3, 10)
+    # a = true; b = a; return a
+    a = bytecode.add_name("a")
+    b = bytecode.add_name("b")
+    bytecode.add_instruction("LOAD_TRUE")
+    bytecode.add_instruction("STORE_NAME", a)
+    bytecode.add_instruction("LOAD_NAME", a)
+    bytecode.add_instruction("STORE_NAME", b)
+    bytecode.add_instruction("LOAD_NAME", a)
+    bytecode.add_instruction("RETURN")
+    env = {}
+    result = vm_numba.run_bytecode(bytecode, env)
+    expected_result, expected_env = run_python_vm(bytecode)
+    assert result is expected_result is True
+    assert env == expected_env
+    assert env["b"] is True
+
+
+def test_vm_import_does_not_load_numba():
+    code = "import sys, zexus.vm.vm; print('numba' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(zexus.__file__)))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True,
+                         check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_execute_uses_kernel_only_when_enabled(monkeypatch):
+    pytest.importorskip("numba")
+    calls = []
+    run_bytecode = vm_numba.run_bytecode
+    monkeypatch.setattr(vm_numba, "run_bytecode", lambda bc, env: calls.append(bc) or run_bytecode(bc, env))
+    bytecode = loop_bytecode(1, "ADD", 3, 10)
+
+    monkeypatch.setattr(config, "enable_jit", False)
+    vm = VM()
+    vm.execute(bytecode)
+    assert calls == [] and vm.env["acc"] == 31
+
+    monkeypatch.setattr(config, "enable_jit", True)
+    vm = VM()
+    vm.execute(bytecode)
+    assert calls == [bytecode] and vm.env["acc"] == 31